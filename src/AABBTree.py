@@ -0,0 +1,465 @@
+##  @file AABBTree.py
+#   @date Fall 2026
+#
+#   A dynamic bounding volume hierarchy collision detection strategy.
+#
+#   Every bounding volume is stored in a leaf of a binary tree whose internal
+#   nodes hold the union of the bounds of their children. The leaves of
+#   dynamic volumes hold "fat" bounds that are enlarged by a margin, so a
+#   volume that moves inside its fat bounds doesn't require the tree to be
+#   changed at all. Volumes that leave their fat bounds are reinserted, and
+#   the tree is kept shallow with the same rotations used by AVL trees.
+#   Unlike a uniform grid, the tree handles volumes of very different sizes
+#   without any tuning and answers region queries in logarithmic time.
+
+import heapq
+import pygame as PG
+from CollisionDetector import *
+
+## A single node within an `AABBTree`. Leaf nodes reference the bounding
+#  volume they hold while internal nodes always have exactly two children.
+class _TreeNode(object):
+
+    ## Constructs a tree node with the given bounds.
+    #
+    #  @param bounds The rectangle enclosing everything beneath the node.
+    #  @param obj The bounding volume held by the node if it's a leaf.
+    def __init__(self, bounds, obj=None):
+        self.bounds = bounds
+        self.obj = obj
+        self.parent = None
+        self.left = None
+        self.right = None
+        self.height = 0
+
+    ## @return True if the node is a leaf and false otherwise.
+    def is_leaf(self):
+        return self.left is None
+
+
+class AABBTree( CollisionDetector ):
+
+    ### Construtors ###
+
+    ## Constructs an empty bounding volume hierarchy.
+    #
+    #  @param margin The number of pixels by which the bounds of dynamic
+    #   volumes are enlarged on each side. Volumes that move less than this
+    #   amount since they were last inserted don't alter the tree.
+    def __init__(self, margin=8):
+        # Initialize the super class
+        CollisionDetector.__init__(self)
+
+        self.margin = margin
+        self.root = None
+
+        # Mapping from each tracked object to the leaf that holds it
+        self.leaves = {}
+
+        # Set of the objects (i.e. bounding volumes) being tracked
+        self.dynamic_objects = set([])
+        self.static_objects = set([])
+
+    ### Public methods ###
+
+    ## Adds a list of bounding volumes to the tree.
+    #
+    #  Note: The bounding volumes MUST be hashable.
+    #
+    #  @param objs A list of _hashable_ bounding volumes
+    #  @param static A boolean signifying whether the objects are stationary
+    def add_multiple(self, objs, static=False):
+        for obj in objs:
+            self.add(obj, static)
+
+    ## Adds a single bounding volume to the tree.
+    #
+    #  Note: The bounding volume MUST be hashable.
+    #
+    #  @param obj A single bounding volume.
+    #  @param static A boolean signifying whether the object is stationary.
+    #   Static objects are stored with exact bounds and are never reinserted.
+    def add(self, obj, static=False):
+        if self.exists(obj):
+            self.remove(obj)
+        if self._make_dormant(obj, static):
+            return
+
+        bounds = PG.Rect(obj) if static else self._get_fat_bounds(obj)
+        leaf = _TreeNode(bounds, obj)
+        self._insert_leaf(leaf)
+        self.leaves[obj] = leaf
+
+        if static:
+            self.static_objects.add(obj)
+        else:
+            self.dynamic_objects.add(obj)
+
+    ## Removes a list of bounding volumes from the tree.
+    #
+    #  @param objs The list of bounding volumes to be removed.
+    def remove_multiple(self, objs):
+        for obj in objs:
+            self.remove(obj)
+
+    ## Removes a single bounding volume from the tree.
+    #
+    #  @param obj The single bounding volume to be removed.
+    def remove(self, obj):
+        self.dormant_objects.pop(obj, None)
+        if obj not in self.leaves:
+            return
+
+        self._remove_leaf(self.leaves.pop(obj))
+        self.static_objects.discard(obj)
+        self.dynamic_objects.discard(obj)
+
+    ## Reinserts the dynamic bounding volumes that have left their fat
+    #  bounds. Volumes still inside their fat bounds are left untouched.
+    #
+    #  @param objs An optional list of the bounding volumes known to have
+    #   moved. If omitted, every dynamic bounding volume is checked.
+    def update(self, objs=None):
+        moved_objects = self.dynamic_objects if objs is None else objs
+        self._update_dormancy()
+
+        for obj in moved_objects:
+            if obj not in self.dynamic_objects:
+                continue
+
+            leaf = self.leaves[obj]
+            if not leaf.bounds.contains(obj):
+                self._remove_leaf(leaf)
+                leaf.bounds = self._get_fat_bounds(obj)
+                self._insert_leaf(leaf)
+
+    ## Determines all the collisions that are occuring given the current
+    #  state of the tree. Only pairs with at least one dynamic object are
+    #  tested since static objects never collide with each other.
+    #
+    #  @return A list of (Bounding Volume, Bounding Volume) frozensets of
+    #          colliding game world entities.
+    def get_all_collisions(self):
+        collisions = set([])
+
+        for obj in self.dynamic_objects:
+            other_leaves = self._query_leaves(self.leaves[obj].bounds)
+            self.pairs_tested += len(other_leaves) - 1
+
+            for other_leaf in other_leaves:
+                other = other_leaf.obj
+                if other is not obj and self._can_collide(obj, other) and \
+                        obj.colliderect(other):
+                    collisions.add(frozenset([obj, other]))
+
+        return list(collisions)
+
+    ## Finds the bounding volumes colliding with a rectangle by descending
+    #  only into the subtrees whose bounds overlap it.
+    #
+    #  @param rect The rectangle (of type `pygame.Rect`) to be queried.
+    #  @return A list of the bounding volumes colliding with the rectangle.
+    def query_rect(self, rect):
+        return [leaf.obj for leaf in self._query_leaves(rect)
+                if leaf.obj.colliderect(rect)]
+
+    ## Finds the bounding volumes containing a point.
+    #
+    #  @param x The x coordinate of the point.
+    #  @param y The y coordinate of the point.
+    #  @return A list of the bounding volumes containing the point.
+    def query_point(self, x, y):
+        return [leaf.obj for leaf in self._query_leaves(PG.Rect(x, y, 0, 0))
+                if leaf.obj.collidepoint(x, y)]
+
+    ## Casts a ray through the tree, descending only into the subtrees whose
+    #  bounds the ray enters within its maximum distance.
+    #
+    #  @param origin The (x, y) point from which the ray is cast.
+    #  @param direction The (x, y) vector along which the ray is cast.
+    #  @param max_dist The maximum distance the ray travels.
+    #  @return A list of (distance, Bounding Volume) tuples for the volumes
+    #   hit by the ray, ordered from nearest to farthest.
+    def raycast(self, origin, direction, max_dist):
+        direction = self._get_unit_vector(direction)
+        if direction is None:
+            return []
+
+        candidates = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            if self._get_ray_distance(node.bounds, origin, direction,
+                                      max_dist) is None:
+                continue
+
+            if node.is_leaf():
+                candidates.append(node.obj)
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+
+        return self._get_ray_hits(candidates, origin, direction, max_dist)
+
+    ## Finds the bounding volumes nearest to a point with a best-first search
+    #  that expands the nodes of the tree in order of their distance.
+    #
+    #  @param x The x coordinate of the point.
+    #  @param y The y coordinate of the point.
+    #  @param k The maximum number of bounding volumes to be found.
+    #  @return A list of up to k bounding volumes, ordered from nearest to
+    #   farthest from the point.
+    def nearest(self, x, y, k=1):
+        nearest_objects = []
+        if self.root is None:
+            return nearest_objects
+
+        # Entries are (distance, tiebreaker, node, volume) tuples, where the
+        # volume is only given once its exact distance has been computed.
+        queue = [(self._get_point_distance(self.root.bounds, x, y), 0,
+                  self.root, None)]
+        count = 1
+        while queue and len(nearest_objects) < k:
+            (distance, order, node, obj) = heapq.heappop(queue)
+            if obj is not None:
+                nearest_objects.append(obj)
+                continue
+
+            if node.is_leaf():
+                entries = [(self._get_point_distance(node.obj, x, y), node,
+                            node.obj)]
+            else:
+                entries = [(self._get_point_distance(child.bounds, x, y),
+                            child, None) for child in (node.left, node.right)]
+
+            for (child_distance, child, child_obj) in entries:
+                heapq.heappush(queue, (child_distance, count, child,
+                                       child_obj))
+                count += 1
+
+        return nearest_objects
+
+    ## @return A list of all the bounding volumes currently being tracked.
+    def get_all_objects(self):
+        return list(self.static_objects) + list(self.dynamic_objects)
+
+    ## @return True if we're tracking the provided bounding volume and false
+    #   otherwise.
+    def exists(self, obj):
+        return obj in self.leaves or obj in self.dormant_objects
+
+    ## @return The number of objects in the tree.
+    def size(self):
+        return len(self.static_objects) + len(self.dynamic_objects)
+
+    ## @return The height of the tree, which is 0 for a single leaf and -1
+    #   for an empty tree.
+    def get_height(self):
+        return self.root.height if self.root is not None else -1
+
+    ## Resets the tree.
+    def clear(self):
+        self.root = None
+        self.leaves.clear()
+        self.dormant_objects.clear()
+        self.static_objects = set([])
+        self.dynamic_objects = set([])
+
+    ### Private helper methods ###
+
+    ## @return The bounds of the given volume enlarged by the tree margin.
+    def _get_fat_bounds(self, obj):
+        return PG.Rect(obj.x - self.margin, obj.y - self.margin,
+                       obj.width + 2 * self.margin,
+                       obj.height + 2 * self.margin)
+
+    ## Finds all the leaves whose bounds overlap or touch the given rectangle.
+    #
+    #  @param rect The rectangle to be queried.
+    #  @return A list of the `_TreeNode` leaves overlapping the rectangle.
+    def _query_leaves(self, rect):
+        leaves = []
+        stack = [self.root] if self.root is not None else []
+
+        while stack:
+            node = stack.pop()
+            if not _overlaps(node.bounds, rect):
+                continue
+
+            if node.is_leaf():
+                leaves.append(node)
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+
+        return leaves
+
+    ## Inserts a leaf into the tree next to the sibling that least increases
+    #  the total perimeter of the tree, then rebalances the tree above it.
+    #
+    #  @param leaf The `_TreeNode` leaf to be inserted.
+    def _insert_leaf(self, leaf):
+        if self.root is None:
+            self.root = leaf
+            leaf.parent = None
+            return
+
+        bounds = leaf.bounds
+        sibling = self.root
+        while not sibling.is_leaf():
+            perimeter = _perimeter(sibling.bounds)
+            combined_perimeter = _perimeter(sibling.bounds.union(bounds))
+
+            # Cost of pairing the leaf with this node, and the minimum cost
+            # incurred by every ancestor if the leaf is pushed further down.
+            cost = 2 * combined_perimeter
+            inheritance_cost = 2 * (combined_perimeter - perimeter)
+
+            left_cost = self._get_descent_cost(sibling.left, bounds) + \
+                inheritance_cost
+            right_cost = self._get_descent_cost(sibling.right, bounds) + \
+                inheritance_cost
+
+            if cost < left_cost and cost < right_cost:
+                break
+            sibling = sibling.left if left_cost < right_cost else sibling.right
+
+        old_parent = sibling.parent
+        new_parent = _TreeNode(sibling.bounds.union(bounds))
+        new_parent.parent = old_parent
+        new_parent.height = sibling.height + 1
+        new_parent.left = sibling
+        new_parent.right = leaf
+        sibling.parent = new_parent
+        leaf.parent = new_parent
+
+        self._replace_child(old_parent, sibling, new_parent)
+        self._refit(new_parent)
+
+    ## Removes a leaf from the tree, promoting its sibling in place of their
+    #  shared parent and rebalancing the tree above it.
+    #
+    #  @param leaf The `_TreeNode` leaf to be removed.
+    def _remove_leaf(self, leaf):
+        if leaf is self.root:
+            self.root = None
+            return
+
+        parent = leaf.parent
+        grandparent = parent.parent
+        sibling = parent.right if parent.left is leaf else parent.left
+
+        sibling.parent = grandparent
+        self._replace_child(grandparent, parent, sibling)
+        leaf.parent = None
+
+        if grandparent is not None:
+            self._refit(grandparent)
+
+    ## @return The perimeter added by descending into the given child node
+    #   in order to insert a leaf with the given bounds.
+    def _get_descent_cost(self, child, bounds):
+        union_perimeter = _perimeter(child.bounds.union(bounds))
+        if child.is_leaf():
+            return union_perimeter
+        return union_perimeter - _perimeter(child.bounds)
+
+    ## Replaces the given child of a parent node with a new node, updating the
+    #  tree root instead if the parent doesn't exist.
+    def _replace_child(self, parent, old_child, new_child):
+        if parent is None:
+            self.root = new_child
+        elif parent.left is old_child:
+            parent.left = new_child
+        else:
+            parent.right = new_child
+
+    ## Walks from the given node to the root, rebalancing each node and
+    #  recomputing its height and bounds from its children.
+    #
+    #  @param node The internal `_TreeNode` from which to begin the walk.
+    def _refit(self, node):
+        while node is not None:
+            node = self._balance(node)
+            node.height = 1 + max(node.left.height, node.right.height)
+            node.bounds = node.left.bounds.union(node.right.bounds)
+            node = node.parent
+
+    ## Performs a left or right rotation at the given node if its subtrees
+    #  differ in height by more than one.
+    #
+    #  @param a The `_TreeNode` to be balanced.
+    #  @return The node that now occupies the position of the given node.
+    def _balance(self, a):
+        if a.is_leaf() or a.height < 2:
+            return a
+
+        b = a.left
+        c = a.right
+        balance = c.height - b.height
+
+        # Rotate the right child up.
+        if balance > 1:
+            f = c.left
+            g = c.right
+
+            c.left = a
+            c.parent = a.parent
+            a.parent = c
+            self._replace_child(c.parent, a, c)
+
+            if f.height > g.height:
+                c.right = f
+                a.right = g
+                g.parent = a
+            else:
+                c.right = g
+                a.right = f
+                f.parent = a
+
+            self._fix_node(a)
+            self._fix_node(c)
+            return c
+
+        # Rotate the left child up.
+        if balance < -1:
+            d = b.left
+            e = b.right
+
+            b.left = a
+            b.parent = a.parent
+            a.parent = b
+            self._replace_child(b.parent, a, b)
+
+            if d.height > e.height:
+                b.right = d
+                a.left = e
+                e.parent = a
+            else:
+                b.right = e
+                a.left = d
+                d.parent = a
+
+            self._fix_node(a)
+            self._fix_node(b)
+            return b
+
+        return a
+
+    ## Recomputes the height and bounds of an internal node from its children.
+    def _fix_node(self, node):
+        node.height = 1 + max(node.left.height, node.right.height)
+        node.bounds = node.left.bounds.union(node.right.bounds)
+
+
+## @return True if the two rectangles overlap or touch and false otherwise.
+#   Unlike `pygame.Rect.colliderect`, this never ignores empty rectangles.
+def _overlaps(rect_a, rect_b):
+    return rect_a.x <= rect_b.x + rect_b.width and \
+        rect_b.x <= rect_a.x + rect_a.width and \
+        rect_a.y <= rect_b.y + rect_b.height and \
+        rect_b.y <= rect_a.y + rect_a.height
+
+## @return The perimeter of the given rectangle.
+def _perimeter(rect):
+    return 2 * (rect.width + rect.height)
@@ -0,0 +1,187 @@
+##  @file AssetBundle.py
+#   @date Fall 2026
+#
+#   Source File for the "AssetBundle" Type
+#
+#   An asset bundle is a single binary file holding precompiled game data
+#   (entity data, hitbox templates and segment data) so that the game doesn't
+#   need to parse JSON, SVG and GIF files on startup.  The file is laid out as:
+#
+#       magic (8 bytes) | version (uint32) | index size (uint32) | index | data
+#
+#   where the index is a marshalled dictionary mapping each asset name to the
+#   offset, length and SHA-1 digest of its marshalled data, along with the
+#   modification times of the source files it was compiled from.  Bundles are
+#   memory mapped and each asset is only read and verified when requested.
+#   Any asset whose source files have changed since the bundle was built is
+#   reported as missing so that callers fall back to the source files.
+
+import os
+import os.path
+import mmap
+import struct
+import marshal
+import hashlib
+import logging
+import Globals
+
+##  A read-only collection of named assets compiled into a single file.
+class AssetBundle( object ):
+    ### Class Variables ###
+
+    ##  The magic string that begins every bundle file.
+    MAGIC = "ZOLBNDL\0"
+
+    ##  The version of the bundle format, which must be incremented whenever
+    #   the layout of the file or of any compiled asset changes.
+    VERSION = 1
+
+    ##  The layout of the header at the start of every bundle file.
+    HEADER = struct.Struct( "<8sII" )
+
+    ##  The bundle used by the game when loading assets (or None if the game
+    #   should only use source files).
+    _default = None
+
+    ##  Indicates whether the default bundle has been loaded yet.
+    _default_loaded = False
+
+    ### Constructors ###
+
+    ##  Constructs an asset bundle from the given bundle file.  Use `open` to
+    #   load a bundle that may be missing or invalid.
+    #
+    #   @param path The path of the bundle file to be mapped.
+    def __init__( self, path ):
+        self._path = path
+
+        with open( path, "rb" ) as bundle_file:
+            self._map = mmap.mmap( bundle_file.fileno(), 0, access=mmap.ACCESS_READ )
+
+        ( magic, version, index_size ) = AssetBundle.HEADER.unpack_from( self._map, 0 )
+        if magic != AssetBundle.MAGIC or version != AssetBundle.VERSION:
+            self._map.close()
+            raise ValueError( "Unsupported asset bundle format (version %d)." % version )
+
+        index_start = AssetBundle.HEADER.size
+        self._index = marshal.loads( self._map[index_start:index_start + index_size] )
+
+    ##  Loads the asset bundle at the given path, returning None if the file
+    #   doesn't exist or isn't a supported bundle.
+    #
+    #   @param path The path of the bundle file to be loaded.
+    #   @return The loaded `AssetBundle` instance or None.
+    @classmethod
+    def open( cls, path ):
+        if not os.path.isfile( path ):
+            return None
+
+        try:
+            return cls( path )
+        except (ValueError, EOFError, struct.error, mmap.error), message:
+            logging.warning( "Could not load asset bundle at '%s'... failed with "
+                "error '%s'." % (path, message) )
+            return None
+
+    ##  @return The bundle used by the game when loading assets, which is
+    #    loaded from `Globals.BUNDLE_PATH` when first requested (or None if
+    #    there is no such bundle).
+    @classmethod
+    def get_default( cls ):
+        if not cls._default_loaded:
+            cls.set_default( cls.open(Globals.BUNDLE_PATH) )
+
+        return cls._default
+
+    ##  Sets the bundle used by the game when loading assets.
+    #
+    #   @param bundle The `AssetBundle` to be used or None if the game should
+    #    only use source files.
+    @classmethod
+    def set_default( cls, bundle ):
+        cls._default = bundle
+        cls._default_loaded = True
+
+    ##  Writes a bundle file containing the given assets.
+    #
+    #   @param path The path of the bundle file to be written.
+    #   @param assets A dictionary mapping each asset name to a tuple of the
+    #    form (value, source_paths), where the value is any marshallable
+    #    object and the source paths list the files it was compiled from.
+    @staticmethod
+    def write( path, assets ):
+        project_path = os.path.abspath( Globals.PROJECT_PATH )
+        ( index, blobs, offset ) = ( {}, [], 0 )
+        for name in sorted( assets.keys() ):
+            ( value, source_paths ) = assets[ name ]
+            blob = marshal.dumps( value )
+            sources = [ (os.path.relpath(os.path.abspath(source_path), project_path),
+                os.path.getmtime(source_path)) for source_path in source_paths ]
+
+            index[ name ] = ( offset, len(blob), hashlib.sha1(blob).hexdigest(), sources )
+            blobs.append( blob )
+            offset += len( blob )
+
+        # The data begins after the index, so the offsets can only be made
+        # absolute once the size of the index is known.  Marshal stores small
+        # integers with a fixed width, so this doesn't change that size.
+        index_blob = marshal.dumps( index )
+        data_start = AssetBundle.HEADER.size + len( index_blob )
+        for name in index:
+            index[ name ] = ( data_start + index[name][0], ) + index[ name ][ 1: ]
+        index_blob = marshal.dumps( index )
+        assert AssetBundle.HEADER.size + len( index_blob ) == data_start, \
+            "Asset bundle index changed size!"
+
+        with open( path, "wb" ) as bundle_file:
+            bundle_file.write( AssetBundle.HEADER.pack(AssetBundle.MAGIC,
+                AssetBundle.VERSION, len(index_blob)) )
+            bundle_file.write( index_blob )
+            [ bundle_file.write( blob ) for blob in blobs ]
+
+    ### Methods ###
+
+    ##  Returns the asset with the given name if it's contained in the bundle,
+    #   is intact and is up to date with its source files.
+    #
+    #   @param name The name of the asset to be returned.
+    #   @return The value of the asset or None if it can't be used.
+    def get( self, name ):
+        if name not in self._index:
+            return None
+
+        ( offset, length, digest, sources ) = self._index[ name ]
+        if self._is_stale( sources ):
+            logging.info( "Asset '%s' is out of date in bundle '%s'..." %
+                (name, self._path) )
+            return None
+
+        blob = self._map[ offset:offset + length ]
+        if hashlib.sha1( blob ).hexdigest() != digest:
+            logging.error( "Asset '%s' is corrupt in bundle '%s'..." %
+                (name, self._path) )
+            return None
+
+        return marshal.loads( blob )
+
+    ##  @return A sorted list of the names of all assets in the bundle that
+    #    begin with the given prefix.
+    def get_names( self, prefix="" ):
+        return sorted( name for name in self._index if name.startswith(prefix) )
+
+    ##  Releases the memory mapping of the bundle file.
+    def close( self ):
+        self._map.close()
+
+    ### Helper Methods ###
+
+    ##  @return True if any of the given source files has been modified since
+    #    the bundle was built and false otherwise.  Missing source files are
+    #    never considered modified so bundles can be shipped without them.
+    def _is_stale( self, sources ):
+        for ( source_path, mtime ) in sources:
+            source_path = os.path.join( Globals.PROJECT_PATH, source_path )
+            if os.path.isfile( source_path ) and os.path.getmtime( source_path ) > mtime:
+                return True
+
+        return False
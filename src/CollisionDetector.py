@@ -5,6 +5,9 @@
 #   An abstract base class that defines the interface that all future collision
 #   detection implementations must support.
 
+import heapq
+import math
+import pygame as PG
 from abc import ABCMeta, abstractmethod
 
 class CollisionDetector( object ):
@@ -13,8 +16,34 @@ class CollisionDetector( object ):
     # Accept an arbitrary argument list
     @abstractmethod
     def __init__(self):
+        # Mapping from each (Bounding Volume, Bounding Volume) frozenset that
+        # was colliding the last time the contacts were updated to the types
+        # of its volumes at that time
+        self.contacts = {}
+
+        # Optional `CollisionFilter` deciding which volumes may collide, and a
+        # mapping from each volume it excluded from the index when it was
+        # added to whether the volume was added as static
+        self.collision_filter = None
+        self.dormant_objects = {}
+
+        # Running count of the candidate pairs whose overlap has been tested
+        self.pairs_tested = 0
+
+    # Construct a detector suited to an area of the given pixel dimensions
+    @classmethod
+    def for_area(cls, width, height):
+        return cls()
+
+    # Adapt the parameters of the detector to the volumes it tracks
+    def tune(self):
         pass
 
+    # Set the filter deciding which volumes may collide, which must be done
+    # before any volumes are added
+    def set_filter(self, collision_filter):
+        self.collision_filter = collision_filter
+
     @abstractmethod
     def add_multiple(self, objs, static=False):
         pass
@@ -31,14 +60,174 @@ class CollisionDetector( object ):
     def remove(self, obj):
         pass
 
+    def update(self, objs=None):
+        pass
+
     @abstractmethod
     def get_all_collisions(self):
         pass
 
+    # Compare the current collisions against those found by the last call,
+    # returning a (begun, persisting, ended) tuple of frozenset lists. A pair
+    # whose volumes changed type since the last call has begun again, since
+    # hitboxes change type in place when their composite adopts a template.
+    # Ended pairs involving a volume that is no longer tracked are dropped.
+    def update_contacts(self):
+        contacts = dict((pair, self._get_pair_types(pair))
+                        for pair in self.get_all_collisions())
+
+        (begun, persisting) = ([], [])
+        for (pair, pair_types) in contacts.iteritems():
+            if self.contacts.get(pair) == pair_types:
+                persisting.append(pair)
+            else:
+                begun.append(pair)
+        ended = [pair for pair in self.contacts
+                 if pair not in contacts and
+                 all(self.exists(obj) for obj in pair)]
+
+        self.contacts = contacts
+        return (begun, persisting, ended)
+
     @abstractmethod
     def get_all_objects(self):
         pass
 
+    # Find the tracked volumes colliding with the given rectangle. This and
+    # the other queries scan every volume unless a subclass overrides them.
+    def query_rect(self, rect):
+        return [obj for obj in self.get_all_objects() if obj.colliderect(rect)]
+
+    # Find the tracked volumes containing the given point
+    def query_point(self, x, y):
+        return [obj for obj in self.get_all_objects() if obj.collidepoint(x, y)]
+
+    # Cast a ray from the origin point along the direction vector, returning
+    # a list of (distance, volume) tuples for the volumes it hits within the
+    # maximum distance, ordered from nearest to farthest
+    def raycast(self, origin, direction, max_dist):
+        direction = self._get_unit_vector(direction)
+        if direction is None:
+            return []
+
+        if math.isinf(max_dist):
+            candidates = self.get_all_objects()
+        else:
+            end = (origin[0] + direction[0] * max_dist,
+                   origin[1] + direction[1] * max_dist)
+            left = int(math.floor(min(origin[0], end[0]))) - 1
+            top = int(math.floor(min(origin[1], end[1]))) - 1
+            right = int(math.ceil(max(origin[0], end[0]))) + 1
+            bottom = int(math.ceil(max(origin[1], end[1]))) + 1
+
+            candidates = self.query_rect(PG.Rect(left, top, right - left,
+                                                 bottom - top))
+        return self._get_ray_hits(candidates, origin, direction, max_dist)
+
+    # Find up to k tracked volumes nearest to the given point, ordered from
+    # nearest to farthest
+    def nearest(self, x, y, k=1):
+        return heapq.nsmallest(k, self.get_all_objects(),
+                               key=lambda obj: self._get_point_distance(obj,
+                                                                        x, y))
+
+    # Keep a volume that the filter excludes out of the index, returning true
+    # if the volume was made dormant
+    def _make_dormant(self, obj, static=False):
+        if self.collision_filter is None or \
+                self.collision_filter.is_collidable(obj):
+            return False
+
+        self.dormant_objects[obj] = static
+        return True
+
+    # Index the dormant volumes that the filter now accepts, since the types
+    # of hitboxes change when their composite adopts a new template. Indexed
+    # volumes that the filter stops accepting stay in the index and are
+    # rejected when their pairs are tested, so a volume is indexed only once
+    # however often its type changes.
+    def _update_dormancy(self):
+        if self.collision_filter is None:
+            return
+
+        for (obj, static) in self.dormant_objects.items():
+            if self.collision_filter.is_collidable(obj):
+                del self.dormant_objects[obj]
+                self.add(obj, static)
+
+    # Get the types of the volumes of a pair, which identify the contact
+    # along with the volumes themselves
+    def _get_pair_types(self, pair):
+        return frozenset((obj, getattr(obj, "htype", None)) for obj in pair)
+
+    # Check whether the filter allows two volumes to collide
+    def _can_collide(self, obj_a, obj_b):
+        return self.collision_filter is None or \
+            self.collision_filter.can_collide(obj_a, obj_b)
+
+    # Find the nearest volumes by querying ever larger squares around the
+    # point until k volumes are found closer than the edge of the square
+    def _get_nearest_by_window(self, x, y, k):
+        radius = 32
+        while True:
+            candidates = self.query_rect(PG.Rect(int(x) - radius,
+                                                 int(y) - radius,
+                                                 2 * radius, 2 * radius))
+            closest = heapq.nsmallest(
+                k, [(self._get_point_distance(obj, x, y), obj)
+                    for obj in candidates], key=lambda hit: hit[0])
+
+            if len(candidates) >= len(self.get_all_objects()) or \
+                    (len(closest) == k and closest[-1][0] < radius - 1):
+                return [obj for (distance, obj) in closest]
+            radius *= 2
+
+    # Compute the hits of a ray against the given volumes, ordered by distance
+    def _get_ray_hits(self, objs, origin, direction, max_dist):
+        hits = []
+        for obj in objs:
+            distance = self._get_ray_distance(obj, origin, direction, max_dist)
+            if distance is not None:
+                hits.append((distance, obj))
+
+        hits.sort(key=lambda hit: hit[0])
+        return hits
+
+    # Compute the distance along a ray with a unit direction at which it
+    # enters the given rectangle, or None if it misses within max_dist
+    def _get_ray_distance(self, rect, origin, direction, max_dist):
+        (t_enter, t_exit) = (0.0, float(max_dist))
+        for (low, size, start, step) in ((rect.x, rect.width,
+                                          origin[0], direction[0]),
+                                         (rect.y, rect.height,
+                                          origin[1], direction[1])):
+            if step == 0:
+                if start < low or start > low + size:
+                    return None
+                continue
+
+            t_low = (low - start) / step
+            t_high = (low + size - start) / step
+            t_enter = max(t_enter, min(t_low, t_high))
+            t_exit = min(t_exit, max(t_low, t_high))
+            if t_enter > t_exit:
+                return None
+
+        return t_enter
+
+    # Compute the distance from a point to the closest point of a rectangle
+    def _get_point_distance(self, rect, x, y):
+        dx = max(rect.x - x, 0, x - rect.x - rect.width)
+        dy = max(rect.y - y, 0, y - rect.y - rect.height)
+        return math.hypot(dx, dy)
+
+    # Scale a direction vector to unit length, or None if it has no length
+    def _get_unit_vector(self, direction):
+        length = math.hypot(direction[0], direction[1])
+        if length == 0:
+            return None
+        return (direction[0] / length, direction[1] / length)
+
     @abstractmethod
     def exists(self, entity):
         pass
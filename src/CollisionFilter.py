@@ -0,0 +1,109 @@
+##  @file CollisionFilter.py
+#   @date Fall 2026
+#
+#   A broad-phase filter deciding which bounding volumes may collide.
+#
+#   Volumes whose hitbox type is ignored entirely (intangible volumes by
+#   default) are kept out of the index of a collision detector until their
+#   type changes. Pairs are rejected before any overlap test if either volume
+#   has an ignored type, if their types form an ignored pair in the type
+#   matrix or if both volumes belong to the same owner, such as two hitboxes
+#   of the same entity. Volumes without a hitbox type are treated as
+#   `HitboxType.DEFAULT` volumes.
+
+import numpy as NP
+from CompositeHitbox import HitboxType
+
+class CollisionFilter( object ):
+
+    ### Construtors ###
+
+    ## Constructs a collision filter.
+    #
+    #  @param get_owner An optional function mapping a bounding volume to its
+    #   owner, or to None if it has none. Volumes with the same owner never
+    #   collide.
+    #  @param ignored_types A list of the hitbox types that never collide with
+    #   anything.
+    def __init__(self, get_owner=None, ignored_types=[HitboxType.INTANGIBLE]):
+        self.get_owner = get_owner
+        self.ignored_types = set(ignored_types)
+
+        # Set of the frozensets of hitbox types that never collide together
+        self.ignored_pairs = set([])
+
+        # Mapping from each hitbox type seen to its index in the type matrix
+        self.type_indices = {}
+
+    ### Public methods ###
+
+    ## Configures the filter so that volumes of the two given hitbox types
+    #  never collide with each other.
+    #
+    #  @param type_a The first hitbox type of the pair.
+    #  @param type_b The second hitbox type of the pair, which may be the same
+    #   as the first.
+    def ignore_pair(self, type_a, type_b):
+        self.ignored_pairs.add(frozenset([type_a, type_b]))
+
+    ## @return True if the given bounding volume can collide with anything and
+    #   should be indexed, and false otherwise.
+    def is_collidable(self, obj):
+        return self._get_type(obj) not in self.ignored_types
+
+    ## @return True if the two given bounding volumes are allowed to collide
+    #   and false otherwise. Their overlap isn't considered.
+    def can_collide(self, obj_a, obj_b):
+        if self.get_owner is not None and \
+                self.get_owner_key(obj_a) == self.get_owner_key(obj_b):
+            return False
+
+        (type_a, type_b) = (self._get_type(obj_a), self._get_type(obj_b))
+        if type_a in self.ignored_types or type_b in self.ignored_types:
+            return False
+
+        return not self.ignored_pairs or \
+            frozenset([type_a, type_b]) not in self.ignored_pairs
+
+    ## @return An integer that is equal for two bounding volumes if and only if
+    #   they have the same owner. Volumes without an owner are their own owner.
+    def get_owner_key(self, obj):
+        owner = self.get_owner(obj) if self.get_owner is not None else None
+        return id(obj if owner is None else owner)
+
+    ## @return The index of the hitbox type of the given bounding volume in the
+    #   type matrix, which is assigned the first time the type is seen.
+    def get_type_index(self, obj):
+        htype = self._get_type(obj)
+        if htype not in self.type_indices:
+            self.type_indices[htype] = len(self.type_indices)
+
+        return self.type_indices[htype]
+
+    ## @return A square boolean array indexed by the type indices of two
+    #   bounding volumes that is true where volumes of those types may collide.
+    #   The rows and columns of the ignored types are entirely false.
+    def get_type_matrix(self):
+        count = len(self.type_indices)
+        matrix = NP.ones((count, count), dtype=bool)
+
+        for htype in self.ignored_types:
+            if htype in self.type_indices:
+                matrix[self.type_indices[htype], :] = False
+                matrix[:, self.type_indices[htype]] = False
+
+        for pair in self.ignored_pairs:
+            types = list(pair) * (3 - len(pair))
+            if types[0] in self.type_indices and types[1] in self.type_indices:
+                index_a = self.type_indices[types[0]]
+                index_b = self.type_indices[types[1]]
+                matrix[index_a, index_b] = False
+                matrix[index_b, index_a] = False
+
+        return matrix
+
+    ### Private helper methods ###
+
+    ## @return The hitbox type of the given bounding volume.
+    def _get_type(self, obj):
+        return getattr(obj, "htype", HitboxType.DEFAULT)
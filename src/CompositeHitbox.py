@@ -53,6 +53,10 @@ class HitboxType():
     ##  Indicates that the described hitbox surrounds an intangible object.
     INTANGIBLE = "intangible"
 
+    ##  Indicates that the described hitbox is a sensor that reports when
+    #   objects enter it but never physically blocks them.
+    TRIGGER = "trigger"
+
 
 ##  The representation of a rectangular, axis-aligned collision volume within 
 #   the game world.
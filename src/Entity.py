@@ -27,15 +27,12 @@
 #     for the sake of consistency.
 
 import Globals
-import Queue
-import json
-import os.path
-import logging
-from xml.dom import minidom
+from collections import deque
 
 from PhysicalState import *
 from SimulationDelta import *
 from StateMachine import *
+from EntityArchetype import *
 
 ##  The representation of a dynamic object within the scope of the world.  Each
 #   entity object is an independent and autonomous item within the game world with 
@@ -50,7 +47,7 @@ class Entity( object ):
     #   @param initial_delta The initial physical state delta for the new "Entity."
     def __init__( self, name, initial_delta=PhysicalState() ):
         self._name = name
-        self._event_queue = Queue.Queue()
+        self._event_queue = deque()
 
         self._mntl_state = self._produce_machine()
         self._phys_state = self._produce_physical()
@@ -76,8 +73,8 @@ class Entity( object ):
         sim_delta = SimulationDelta()
 
         prev_state = self._mntl_state.get_current_state().get_name()
-        while not self._event_queue.empty():
-            next_event = self._event_queue.get()
+        while self._event_queue:
+            next_event = self._event_queue.popleft()
             if "victim" in next_event.get_parameters():
                 if repr(next_event.get_parameters()["victim"]) == self.get_name():
                     if repr(next_event.get_parameters()["attacker"]) == "player":
@@ -106,7 +103,12 @@ class Entity( object ):
     #
     #   @param event The event of which the instance "Entity" will be notified.
     def notify_of( self, event ):
-        self._event_queue.put( event )
+        self._event_queue.append( event )
+
+    ##  @return The shared listing of the `EventMatcher` and `RegexMatcher`
+    #    objects for the events that may change the state of the "Entity."
+    def get_event_matchers( self ):
+        return self._get_archetype().get_event_matchers()
 
     ##  @return The status of the "Entity" instance as a string of the form
     #    "[entity-name] [state-name] [state-time]".
@@ -161,75 +163,32 @@ class Entity( object ):
             entity_chitbox.adopt_template( chitbox_template )
 
     ##  Produces the state machine for the entity instance, returning a
-    #   reference to this produced machine.
+    #   reference to this produced machine.  The states are owned by the
+    #   instance while the transitions and their compiled table are shared
+    #   with the entity archetype.
     #
     #   @return The `StateMachine` instance constructed for the entity instance.
     def _produce_machine( self ):
-        data = json.load( self._open_entity_file() )
-
-        states = []
-        for ele in data[ "states" ]:
-            state_class = Globals.load_class(ele[0])
-            state_class_test = state_class(*ele[1:])
-            states.append(state_class(*ele[1:]))
+        archetype = self._get_archetype()
 
-        edges = []
-        for ele in data[ "edges" ]:
-            edges.append(Transition(*ele))
-
-        return StateMachine( states, edges, data["start"] if "start" in data else None )
+        return StateMachine( archetype.produce_states(),
+            archetype.get_transitions(), archetype.get_start_id(),
+            archetype.get_transition_table() )
 
     ##  Produces the initial physical state for the entity instance, returning
     #   a reference to this created state.
     #
     #   @return The `PhysicalState` instance constructed for the entity instance.
     def _produce_physical( self ):
-        data = json.load( self._open_entity_file() )
-        info = data[ "physical" ]
-
-        pos_x = info[0][0]
-        pos_y = info[0][1]
-        velocity = ( info[1][0], info[1][1] )
-        mass = info[2]
-        curr_health = info[3]
-        max_health = info[4]
-
-        return PhysicalState( CompositeHitbox(pos_x, pos_y), velocity, mass, curr_health, max_health )
+        return self._get_archetype().produce_physical()
 
     ##  Produces the composite hitbox templates for the entity instance (based 
-    #   on its state machine), returning a list of these templates.
+    #   on its state machine), returning a list of these templates.  The
+    #   templates are shared by all entities with the same name.
     #
     #   @return A list of `CompositeHitbox` instances constructed for the entity.
     def _produce_chitboxes( self ):
-        hitlist = {}
-
-        # Get states and entity names
-        for state in self._mntl_state.get_states():
-            hitboxes = []
-
-            # TODO: Add functionality to specify an anchor for each chitbox.
-            tree = minidom.parse( self._open_state_hbox_file(state) )
-
-            rects = tree.getElementsByTagName('rect')
-            for rect in rects:
-                x = int( rect.getAttribute('x') )
-                y = int( rect.getAttribute('y') )
-                w = int( rect.getAttribute('width') )
-                h = int( rect.getAttribute('height') )
-                h_class = str( rect.getAttribute('class') )
-
-                hitboxes.append( Hitbox(x, y, w, h, h_class) )
-
-            ax = 0
-            ay = 0
-            circles = tree.getElementsByTagName('circle')
-            for circle in circles:
-                ax = int( circle.getAttribute('cx') )
-                ay = int( circle.getAttribute('cy') )
-
-            hitlist[ state.get_name() ] = CompositeHitbox( 0, 0, hitboxes, ax, ay )
-
-        return hitlist
+        return self._get_archetype().get_chitbox_templates()
 
     ##  Builds a simulation delta with a death event inside to notify the
     #   GameWorld of the instance's death.
@@ -242,21 +201,7 @@ class Entity( object ):
     def _is_dead( self ):
         return self.get_physical_state().get_curr_health() < 1
 
-    ##  @return An open file handle for the data file for the instance entity.
-    def _open_entity_file( self ):
-        efile = self._name + ".json"
-        return open( os.path.join(Globals.DATA_PATH, "entities", efile), "r" )
-
-    ##  @return An open file handle for the data file for the hitbox hile
-    #    associated with the given state of the instance entity.
-    def _open_state_hbox_file( self, state ):
-        sfile = state.get_name() + ".svg"
-        spath = os.path.join( Globals.DATA_PATH, "hitbox", self._name, sfile )
-        dpath = os.path.join( Globals.DATA_PATH, "hitbox", "default.svg" )
-
-        if os.path.isfile( spath ):
-            return open( spath, "r" )
-        else:
-            logging.error( "Could not load hitbox file at '%s'..." % (spath) )
-            return open( dpath, "r" )
-
+    ##  @return The `EntityArchetype` shared by all entities with the name of
+    #    the instance entity.
+    def _get_archetype( self ):
+        return EntityArchetype.load( self._name )
@@ -0,0 +1,193 @@
+##  @file EntityArchetype.py
+#   @date Fall 2026
+#
+#   Source File for the "EntityArchetype" Type
+#
+#   An archetype holds everything that is known about a kind of entity before
+#   any instance of it exists: the data parsed from its entity file and the
+#   composite hitbox templates parsed from its hitbox files.  Archetypes are
+#   loaded once per entity name and shared by every `Entity` of that name, so
+#   spawning an entity only creates the state that belongs to the instance.
+#   The data for an archetype is read from the default `AssetBundle` when it
+#   has an up to date copy and from the source files otherwise.
+
+import Globals
+import json
+import os.path
+import logging
+from xml.dom import minidom
+
+from AssetBundle import *
+from PhysicalState import *
+from StateMachine import *
+
+##  The shared template for all entities with a given name identifier.  The
+#   parts of an archetype that are handed out directly (transitions, the
+#   compiled transition table and composite hitbox templates) are never
+#   modified by entities, while the mutable parts (states and physical
+#   states) are produced fresh on request.
+class EntityArchetype( object ):
+    ### Class Variables ###
+
+    ##  The registry of all loaded archetypes, of the form { name => archetype }.
+    _registry = {}
+
+    ### Constructors ###
+
+    ##  Constructs the archetype for the given entity name by parsing its
+    #   entity data file and the hitbox file for each of its states.
+    #
+    #   @param name The name identifier for the entities of the archetype.
+    def __init__( self, name ):
+        self._name = name
+
+        data = self._load_asset( "entities/" + name )
+        if data == None:
+            with self._open_entity_file() as entity_file:
+                data = json.load( entity_file )
+
+        self._state_specs = [ (Globals.load_class(ele[0]), ele[1:])
+            for ele in data["states"] ]
+        self._transitions = [ Transition(*ele) for ele in data["edges"] ]
+        self._start_id = data[ "start" ] if "start" in data else None
+        self._physical = data[ "physical" ]
+
+        states = self.produce_states()
+        self._transition_table = TransitionTable(
+            [state.get_name() for state in states], self._transitions )
+        self._event_matchers = tuple( transition.get_matcher()
+            for transition in self._transitions )
+        self._chitbox_templates = dict(
+            ( state.get_name(), self._produce_chitbox(state) )
+            for state in states
+        )
+
+    ##  Returns the archetype for the given entity name, which is loaded the
+    #   first time that it's requested and shared afterwards.
+    #
+    #   @param name The name identifier of the archetype to be returned.
+    #   @return The `EntityArchetype` instance for the given entity name.
+    @classmethod
+    def load( cls, name ):
+        if name not in cls._registry:
+            cls._registry[ name ] = cls( name )
+
+        return cls._registry[ name ]
+
+    ##  Discards all loaded archetypes so that they're reloaded from their
+    #   data files when they're next requested.
+    @classmethod
+    def clear( cls ):
+        cls._registry.clear()
+
+    ##  Parses the composite hitbox template data contained in a hitbox file.
+    #
+    #   @param hbox_file An open file handle for the SVG hitbox file.
+    #   @return A tuple of the form (hitboxes, (ax, ay)) where the hitboxes are
+    #    a list of tuples of the form (x, y, w, h, class) and (ax, ay) is the
+    #    anchor point of the template.
+    @staticmethod
+    def parse_hitbox_file( hbox_file ):
+        tree = minidom.parse( hbox_file )
+
+        hitboxes = []
+        rects = tree.getElementsByTagName('rect')
+        for rect in rects:
+            x = int( rect.getAttribute('x') )
+            y = int( rect.getAttribute('y') )
+            w = int( rect.getAttribute('width') )
+            h = int( rect.getAttribute('height') )
+            h_class = str( rect.getAttribute('class') )
+
+            hitboxes.append( (x, y, w, h, h_class) )
+
+        ax = 0
+        ay = 0
+        circles = tree.getElementsByTagName('circle')
+        for circle in circles:
+            ax = int( circle.getAttribute('cx') )
+            ay = int( circle.getAttribute('cy') )
+
+        return ( hitboxes, (ax, ay) )
+
+    ### Methods ###
+
+    ##  @return A new listing of `State` instances for the archetype, which are
+    #    owned by the caller.
+    def produce_states( self ):
+        return [ state_class(*state_args)
+            for ( state_class, state_args ) in self._state_specs ]
+
+    ##  @return A new `PhysicalState` instance for the archetype, which is
+    #    owned by the caller.
+    def produce_physical( self ):
+        info = self._physical
+
+        return PhysicalState( CompositeHitbox(info[0][0], info[0][1]),
+            (info[1][0], info[1][1]), info[2], info[3], info[4] )
+
+    ##  @return The shared listing of `Transition` instances for the archetype.
+    def get_transitions( self ):
+        return self._transitions
+
+    ##  @return The shared `TransitionTable` compiled from the states and
+    #    transitions of the archetype.
+    def get_transition_table( self ):
+        return self._transition_table
+
+    ##  @return The shared tuple of the `EventMatcher` and `RegexMatcher`
+    #    objects for all the events that can invoke a transition of the
+    #    archetype, which are the events to which its entities subscribe.
+    def get_event_matchers( self ):
+        return self._event_matchers
+
+    ##  @return The name identifier of the start state for the archetype (or
+    #    None if the first state is the start state).
+    def get_start_id( self ):
+        return self._start_id
+
+    ##  @return The shared dictionary mapping each state name of the archetype
+    #    to its `CompositeHitbox` template.
+    def get_chitbox_templates( self ):
+        return self._chitbox_templates
+
+    ### Helper Methods ###
+
+    ##  Produces the composite hitbox template for the given state of the
+    #   archetype from the state's hitbox data.
+    #
+    #   @param state The `State` whose hitbox template will be produced.
+    #   @return The `CompositeHitbox` template produced for the state.
+    def _produce_chitbox( self, state ):
+        data = self._load_asset( "hitbox/%s/%s" % (self._name, state.get_name()) )
+        if data == None:
+            # TODO: Add functionality to specify an anchor for each chitbox.
+            with self._open_state_hbox_file( state ) as hbox_file:
+                data = EntityArchetype.parse_hitbox_file( hbox_file )
+
+        ( hitboxes, ( ax, ay ) ) = data
+        return CompositeHitbox( 0, 0, [Hitbox(*hitbox) for hitbox in hitboxes], ax, ay )
+
+    ##  @return The value of the named asset in the default `AssetBundle`, or
+    #    None if the asset should be loaded from its source files.
+    def _load_asset( self, name ):
+        bundle = AssetBundle.get_default()
+        return bundle.get( name ) if bundle != None else None
+
+    ##  @return An open file handle for the data file for the archetype.
+    def _open_entity_file( self ):
+        efile = self._name + ".json"
+        return open( os.path.join(Globals.DATA_PATH, "entities", efile), "r" )
+
+    ##  @return An open file handle for the data file for the hitbox hile
+    #    associated with the given state of the archetype.
+    def _open_state_hbox_file( self, state ):
+        sfile = state.get_name() + ".svg"
+        spath = os.path.join( Globals.DATA_PATH, "hitbox", self._name, sfile )
+        dpath = os.path.join( Globals.DATA_PATH, "hitbox", "default.svg" )
+
+        if os.path.isfile( spath ):
+            return open( spath, "r" )
+        else:
+            logging.error( "Could not load hitbox file at '%s'..." % (spath) )
+            return open( dpath, "r" )
@@ -35,6 +35,17 @@ class EventType():
     #   Parameters: { "objects": (Entity, Entity), "volumes": (Rect, Rect) }
     COLLISION = "collision"
 
+    ##  Indicates that the event represents the end of a collision between two
+    #   game world objects that were colliding on the previous update.
+    #   Parameters: { "objects": (Entity, Entity), "volumes": (Rect, Rect) }
+    SEPARATION = "separation"
+
+    ##  Indicates that the event represents a game world object entering a
+    #   trigger volume, such as a transition to another segment.
+    #   Parameters: { "objects": (Entity,), "volumes": (Rect, Rect),
+    #    "transition": (segment_id, (x, y)) or None }
+    TRIGGER = "trigger"
+
     ### Input-Related Events ###
 
     ##  Indicates that the event represents a the pressing of a key
@@ -49,11 +60,38 @@ class EventType():
     #   Parameters: { "entity": Entity }
     DEAD = "death"
 
+##  A read-only dictionary of event parameters, which can't be changed once
+#   the event that holds it has been created.
+class EventParameters( dict ):
+    __slots__ = ()
+
+    def _immutable( self, *args, **kwargs ):
+        raise TypeError( "Event parameters can't be modified." )
+
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    ##  @return The instance parameters, since read-only parameters are shared
+    #    rather than copied (copying a dictionary subclass would otherwise
+    #    rebuild it item by item).
+    def __copy__( self ):
+        return self
+
+    def __deepcopy__( self, memo ):
+        return self
+
 ##  A representation of a discrete event that has occured within the scope of the
 #   game world.  These events are used to encapsulate interactions between objects
 #   and environments in the game world and to communicate this information to
 #   relevant game world objects.
-class Event():
+#
+#   Events are immutable, so a single event is shared by reference between all
+#   the entities, mailboxes and simulation deltas that hold it (copying an event
+#   gives the same event).  The signature and representation of an event are
+#   computed once, when they're first needed, and cached.
+class Event( object ):
+    __slots__ = ( "_type", "_params", "_signature", "_repr" )
+
     ### Constructors ###
 
     ##  Creates an event with the specified type and parameters.
@@ -63,8 +101,11 @@ class Event():
     #   @param params The parameters for the event, which should match the
     #    required parameters for the given event type.
     def __init__( self, etype=EventType.NOTIFY, params={} ):
-        self._type = etype
-        self._params = params
+        set_slot = object.__setattr__
+        set_slot( self, "_type", etype )
+        set_slot( self, "_params", EventParameters(params) )
+        set_slot( self, "_signature", None )
+        set_slot( self, "_repr", None )
 
     ### Overloaded Operators ###
 
@@ -74,18 +115,33 @@ class Event():
     #   @return True if the instance event is equivalent to the given event and
     #    false otherwise.
     def __eq__( self, other ):
-        return self._type == other._type and \
-            self._params == other._params
+        if not isinstance( other, Event ):
+            return NotImplemented
+
+        return self is other or ( self._type == other._type and \
+            self._params == other._params )
+
+    def __ne__( self, other ):
+        equal = self.__eq__( other )
+        return equal if equal is NotImplemented else not equal
+
+    ##  @return A hash of the event signature, which is equal for all equivalent
+    #    events.
+    def __hash__( self ):
+        return hash( self.get_signature() )
 
     ##  @return A string of the form "[type],[paramName]:[paramValue], ..."
     #    (where the parameters are listed in an arbitrary order).
     def __repr__( self ):
-        string = str( self._type )
+        if self._repr == None:
+            string = str( self._type )
 
-        for param_name, param_value in self._params.iteritems():
-            string += "," + str( param_name ) + ":" + repr( param_value )
+            for param_name, param_value in self._params.iteritems():
+                string += "," + str( param_name ) + ":" + repr( param_value )
 
-        return string
+            object.__setattr__( self, "_repr", string )
+
+        return self._repr
 
     ##  @return A string of the form "[[type]( [paramName]->[paramValue] ... )"
     #    (where the parameters are listed in an arbitrary order).
@@ -99,13 +155,36 @@ class Event():
 
         return string
 
+    def __setattr__( self, name, value ):
+        raise AttributeError( "Event objects are immutable." )
+
+    def __delattr__( self, name ):
+        raise AttributeError( "Event objects are immutable." )
+
+    ##  @return The instance event, since immutable events are shared rather
+    #    than copied.
+    def __copy__( self ):
+        return self
+
+    def __deepcopy__( self, memo ):
+        return self
+
     ### Methods ###
 
     ##  @return The type of the instance event as an 'EventType' instance.
     def get_type( self ):
         return self._type
 
-    ##  @return The parameters for the event as a dictionary.  The contents
-    #    of this dictionary depends on the event type.
+    ##  @return The parameters for the event as a read-only dictionary.  The
+    #    contents of this dictionary depends on the event type.
     def get_parameters( self ):
         return self._params
+
+    ##  @return A tuple of the form (type, (param_name, ...)) that identifies
+    #    the type and the sorted parameter names of the event.
+    def get_signature( self ):
+        if self._signature == None:
+            object.__setattr__( self, "_signature",
+                (self._type, tuple(sorted(self._params))) )
+
+        return self._signature
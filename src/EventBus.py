@@ -0,0 +1,109 @@
+##  @file EventBus.py
+#   @date Fall 2026
+#
+#   Source File for the "EventBus" Type
+#
+#   The event bus delivers the events broadcast within the game world to only
+#   the subscribers that may react to them.  Each subscriber is registered with
+#   the matchers for the events that it reacts to, which are indexed by event
+#   type so that publishing an event only visits the subscribers interested in
+#   its type.  Subscribers with untyped matchers (`RegexMatcher` objects) are
+#   visited for events of every type.
+
+from collections import OrderedDict
+
+##  A topic-based publisher of events, where each topic is an event type.
+#   Subscribers are any objects with a `notify_of( event )` method, and are
+#   notified in the order in which they subscribed.
+class EventBus( object ):
+    ### Constructors ###
+
+    ##  Constructs an event bus without any subscribers.
+    def __init__( self ):
+        # Ordered by subscription, of the form: { subscriber => (matcher, ...) }
+        self._subscriptions = OrderedDict()
+
+        # Built from the subscriptions on the first publish after they change,
+        # of the form: { etype => ((subscriber, (matcher, ...)), ...) }
+        self._topics = None
+        self._untyped_topic = None
+
+    ### Methods ###
+
+    ##  Subscribes the given object to all events matched by any of the given
+    #   matchers, replacing its existing subscription if it has one.
+    #
+    #   @param subscriber The object that will be notified of matched events.
+    #   @param matchers A listing of the `EventMatcher` and `RegexMatcher`
+    #    objects for the events of which the subscriber will be notified.
+    def subscribe( self, subscriber, matchers ):
+        self._subscriptions.pop( subscriber, None )
+        self._subscriptions[ subscriber ] = tuple( matchers )
+        self._topics = None
+
+    ##  Removes the subscription of the given object if it has one.
+    #
+    #   @param subscriber The object that will no longer be notified of events.
+    def unsubscribe( self, subscriber ):
+        if self._subscriptions.pop( subscriber, None ) != None:
+            self._topics = None
+
+    ##  Notifies every subscriber with a matcher for the given event of the
+    #   event, returning the number of subscribers notified.
+    #
+    #   @param event The `Event` object to be delivered to its subscribers.
+    #   @return The number of subscribers that were notified of the event.
+    def publish( self, event ):
+        if self._topics == None:
+            self._build_topics()
+
+        num_notified = 0
+        for ( subscriber, matchers ) in self._topics.get( event.get_type(),
+                self._untyped_topic ):
+            for matcher in matchers:
+                if matcher.matches( event ):
+                    subscriber.notify_of( event )
+                    num_notified += 1
+                    break
+
+        return num_notified
+
+    ##  @return True if the given object is subscribed to the bus and false
+    #    otherwise.
+    def __contains__( self, subscriber ):
+        return subscriber in self._subscriptions
+
+    ##  @return A list of the subscribers that may be notified of events of
+    #    the given 'EventType' type, in subscription order.
+    def get_subscribers( self, event_type ):
+        if self._topics == None:
+            self._build_topics()
+
+        return [ subscriber for ( subscriber, matchers ) in
+            self._topics.get( event_type, self._untyped_topic ) ]
+
+    ### Helper Methods ###
+
+    ##  Rebuilds the index of subscriptions by event type, where the topic for
+    #   each type holds the matchers of that type and the untyped matchers.
+    def _build_topics( self ):
+        event_types = set( matcher.get_event_type() for matchers in
+            self._subscriptions.itervalues() for matcher in matchers )
+        event_types.discard( None )
+
+        self._untyped_topic = self._get_topic( None )
+        self._topics = dict( (etype, self._get_topic(etype)) for etype in event_types )
+
+    ##  @return A tuple of the form ((subscriber, (matcher, ...)), ...) for the
+    #    subscribers with matchers for events of the given type, which only
+    #    includes untyped matchers if the given type is None.
+    def _get_topic( self, event_type ):
+        topic = []
+
+        for ( subscriber, matchers ) in self._subscriptions.iteritems():
+            topic_matchers = tuple( matcher for matcher in matchers
+                if matcher.get_event_type() in (event_type, None) )
+            if len( topic_matchers ) > 0:
+                topic.append( (subscriber, topic_matchers) )
+
+        return tuple( topic )
@@ -0,0 +1,112 @@
+##  @file EventMatcher.py
+#   @date Fall 2026
+#
+#   Source File for the "EventMatcher" and "RegexMatcher" Types
+#
+#   Matchers describe the events that invoke a state machine transition.  An
+#   `EventMatcher` tests the type of an event along with the values of some of
+#   its parameters (and optionally its string representation), which lets state
+#   machines and event buses index matchers by event type.  A `RegexMatcher`
+#   tests the string representation of an event with a regular expression,
+#   which can match events of any type and is kept as the fallback for
+#   classifications that a structured matcher can't express.
+#
+#   Entity data files may give either form as the classification of an edge:
+#
+#       "^keydown,key:24$"                                (a `RegexMatcher`)
+#       { "type": "keydown", "params": { "key": 24 } }    (an `EventMatcher`)
+#       { "type": "collision", "pattern": "hurt" }         (an `EventMatcher`)
+
+import re
+
+##  A structured description of the events that invoke a transition, which
+#   matches events of a single type whose parameters meet its conditions.
+class EventMatcher( object ):
+    ### Constructors ###
+
+    ##  Creates a matcher for the events of the given type with the given
+    #   parameter conditions.
+    #
+    #   @param etype The 'EventType' type of the matched events.
+    #   @param params A dictionary mapping parameter names to conditions on
+    #    their values.  Each condition is either a function that returns true
+    #    for the matched values or a value that the parameter must equal.
+    #    Events that don't have a parameter with a condition never match.
+    #   @param pattern An optional regular expression string that must also be
+    #    found in the string representation of the matched events.
+    def __init__( self, etype, params={}, pattern=None ):
+        self._type = etype
+        self._conditions = tuple( (name, condition if callable(condition)
+            else EventMatcher._equal_to(condition)) for ( name, condition ) in
+            params.iteritems() )
+        self._pattern = re.compile( pattern ) if pattern != None else None
+
+    ##  Creates the matcher given by the specification of an event
+    #   classification, which is either a matcher, a regular expression string
+    #   or a dictionary of the form { "type": etype, "params": { name: value },
+    #   "pattern": regex } (where the parameters and pattern are optional).
+    #
+    #   @param spec The specification of the event classification.
+    #   @return The `EventMatcher` or `RegexMatcher` given by the specification.
+    @staticmethod
+    def parse( spec ):
+        if isinstance( spec, basestring ):
+            return RegexMatcher( spec )
+        elif isinstance( spec, dict ):
+            return EventMatcher( str(spec["type"]), spec.get("params", {}),
+                spec.get("pattern") )
+        else:
+            return spec
+
+    ### Methods ###
+
+    ##  @return True if the given event is matched by the instance matcher and
+    #    false otherwise.
+    def matches( self, event ):
+        if event.get_type() != self._type:
+            return False
+
+        params = event.get_parameters()
+        for ( name, condition ) in self._conditions:
+            if name not in params or not condition( params[name] ):
+                return False
+
+        return self._pattern == None or \
+            self._pattern.search( repr(event) ) != None
+
+    ##  @return The 'EventType' type of all events matched by the instance.
+    def get_event_type( self ):
+        return self._type
+
+    ### Helper Methods ###
+
+    ##  @return A condition function that's true for values equal to the given
+    #    value.  Lists are treated as tuples so that data file values can be
+    #    compared with tuple parameters.
+    @staticmethod
+    def _equal_to( value ):
+        value = tuple( value ) if isinstance( value, list ) else value
+        return lambda param: param == value
+
+##  A description of the events that invoke a transition given as a regular
+#   expression, which is searched for in the string representation of events.
+class RegexMatcher( object ):
+    ### Constructors ###
+
+    ##  Creates a matcher for the events whose representation contains a match
+    #   for the given regular expression.
+    #
+    #   @param pattern The regular expression string for the matched events.
+    def __init__( self, pattern ):
+        self._pattern = re.compile( pattern )
+
+    ### Methods ###
+
+    ##  @return True if the given event is matched by the instance matcher and
+    #    false otherwise.
+    def matches( self, event ):
+        return True if self._pattern.search( repr(event) ) else False
+
+    ##  @return None, since events of any type can be matched by the instance.
+    def get_event_type( self ):
+        return None
@@ -23,6 +23,7 @@
 #     at once in a similar fashion when more widgets are used.
 
 import os.path
+import numpy as NP
 import pygame as PG
 from pygame.locals import *
 
@@ -43,6 +44,8 @@ class GameView():
     def __init__( self ):
         self._tile_graphics = {}
         self._entity_graphics = {}
+        # The `Tilemap` whose tile graphics were loaded most recently
+        self._loaded_tilemap = None
 
         self._screen = PG.display.set_mode( Globals.SCREEN_DIMS )
         PG.display.set_caption( Globals.GAME_NAME )
@@ -84,24 +87,24 @@ class GameView():
     #   only draw the tiles that are within the camera's viewport.
     #
     #   @param viewport     The camera's view, should be a pygame rect
-    #   @param tilemap      2D Array of strings that contain the all the
-    #                        information about each tile.
+    #   @param tilemap      The `Tilemap` that contains all the information
+    #                        about each tile.
     def render_environment( self, viewport, tilemap ):
         self._load_tilemap_graphics( tilemap )
 
-        num_tiles_x = len( tilemap )
-        num_tiles_y = len( tilemap[0] )
+        ( num_tiles_x, num_tiles_y ) = tilemap.get_dims()
 
         start_idx_x = Globals.clamp( int(viewport.left / Globals.TILE_DIMS[0]), 0, num_tiles_x )
         start_idx_y = Globals.clamp( int(viewport.top / Globals.TILE_DIMS[1]), 0, num_tiles_y )
         final_idx_x = Globals.clamp( int(viewport.right / Globals.TILE_DIMS[0]) + 1, 0, num_tiles_x )
         final_idx_y = Globals.clamp( int(viewport.bottom / Globals.TILE_DIMS[1]) + 1, 0, num_tiles_y )
 
-        for idx_x in range( start_idx_x, final_idx_x ):
-            for idx_y in range( start_idx_y, final_idx_y ):
+        visible_tiles = tilemap.get_tile_ids( slice(start_idx_x, final_idx_x),
+            slice(start_idx_y, final_idx_y) )
+        for ( idx_x, column ) in enumerate( visible_tiles, start_idx_x ):
+            for ( idx_y, tile ) in enumerate( column, start_idx_y ):
                 tile_pos_x = idx_x * Globals.TILE_DIMS[0] - viewport.x
                 tile_pos_y = idx_y * Globals.TILE_DIMS[1] - viewport.y
-                tile = tilemap[ idx_x ][ idx_y ][ 0 ]
 
                 self._screen.blit(
                     self._get_tile_graphic(tile),
@@ -150,19 +153,24 @@ class GameView():
         return self._calc_tile_key( tile ) in self._tile_graphics
 
     ##  Loads all the assets for the tiles contained within the given tile map
-    #   into the `self._tile_graphics` dictionary.
+    #   into the `self._tile_graphics` dictionary.  The tiles used by the map
+    #   are found from its distinct palette indices, and only the first time
+    #   the map is rendered.
     #
-    #   @param tilemap A matrix of `Tile` instances to have their assets loaded.
+    #   @param tilemap A `Tilemap` whose tiles will have their assets loaded.
     def _load_tilemap_graphics( self, tilemap ):
-        for idx_x in range( len(tilemap) ):
-            for idx_y in range( len(tilemap[0]) ):
-                tile = tilemap[ idx_x ][ idx_y ][ 0 ]
-
-                if not self._is_tile_graphic_loaded( tile ):
-                    tile_key = self._calc_tile_key( tile )
-                    tile_path = self._calc_tile_path( tile )
-
-                    self._tile_graphics[ tile_key ] = Globals.load_image( tile_path )
+        if tilemap is self._loaded_tilemap:
+            return
+        self._loaded_tilemap = tilemap
+
+        palette = tilemap.get_palette()
+        for index in NP.unique( tilemap.get_indices() ):
+            tile = palette[ index ][ 0 ]
+            if not self._is_tile_graphic_loaded( tile ):
+                tile_key = self._calc_tile_key( tile )
+                tile_path = self._calc_tile_path( tile )
+
+                self._tile_graphics[ tile_key ] = Globals.load_image( tile_path )
 
     ##  Loads all the assets for the entities contained within the given entity
     #   list into the `self._tile_graphics` dictionary.
@@ -22,8 +22,14 @@ import pygame as PG
 from Globals import TILE_DIMS
 
 from Event import *
+from EventBus import *
+from TimerScheduler import *
+from SweptAABB import *
 from CollisionDetector import *
+from CollisionFilter import *
 from SpatialDictionary import *
+from SweepAndPrune import *
+from AABBTree import *
 from Camera import *
 from World import *
 from Entity import *
@@ -40,7 +46,15 @@ class GameWorld():
     #   the input name parameter.
     #
     #   @param world_name The identifier for the initial world to be loaded.
-    def __init__( self, world_name="" ):
+    #   @param detector_type The `CollisionDetector` subclass that will be
+    #    used to detect collisions within each loaded segment.
+    #   @param continuous True if the movement of each entity should be swept
+    #    and stopped at its first contact, which keeps entities from passing
+    #    through thin volumes when given large time deltas.
+    def __init__( self, world_name="", detector_type=SpatialDictionary,
+            continuous=False ):
+        self._detector_type = detector_type
+        self._continuous = continuous
         self._world = World()
         self._player_entity = None
         segment = self._world.levels[ "3" ].segments[ "3.1" ]
@@ -53,6 +67,12 @@ class GameWorld():
     #
     #   @param time_delta The amount of game time that has passed in the frame.
     def update( self, time_delta ):
+        start_positions = dict( (entity, entity.get_chitbox().get_position())
+            for entity in self._entities ) if self._continuous else {}
+
+        for machine in self._timers.pop_expired( self._timers.get_time() + time_delta ):
+            machine.expire_timer()
+
         entity_gen_events = []
         for entity in self._entities:
             entity_gen_events = entity.update(time_delta)
@@ -60,15 +80,56 @@ class GameWorld():
                 if event.get_type() == EventType.DEAD:
                     self._remove_entity(entity)
 
+        self._timers.advance( time_delta )
+
+        if self._continuous:
+            self._sweep_entities( start_positions )
+
         self._collision_detector.update()
 
-        for entity_collision in self._collision_detector.get_all_collisions():
-            self._resolve_entity_collision( list(entity_collision) )
+        ( begun, persisting, ended ) = self._collision_detector.update_contacts()
+
+        tile_collisions = {}
+        ( trigger_entries, trigger_occupancy ) = ( [], set() )
+        new_collisions = set( begun )
+        for collision in begun + persisting:
+            is_new = collision in new_collisions
+            collision = list( collision )
+            if collision[ 0 ] in self._tile_hitboxes or \
+                    collision[ 0 ] in self._trigger_hitboxes:
+                collision.reverse()
+
+            if collision[ 1 ] in self._trigger_hitboxes:
+                entity = self._get_entity_from_collision_detector( collision[0] )
+                occupant = ( entity, collision[1] )
+                if occupant not in self._trigger_occupancy and \
+                        occupant not in trigger_occupancy:
+                    trigger_entries.append( (entity, collision[1], collision[0]) )
+                trigger_occupancy.add( occupant )
+            elif collision[ 1 ] in self._tile_hitboxes:
+                entity = self._get_entity_from_collision_detector( collision[0] )
+                tile_collisions.setdefault( entity, set() ).add( collision[1] )
+            else:
+                self._resolve_entity_collision( collision, is_new )
+
+        self._trigger_occupancy = trigger_occupancy
+
+        for separation in ended:
+            separation = list( separation )
+            if not self._tile_hitboxes.intersection( separation ) and \
+                    not self._trigger_hitboxes.intersection( separation ):
+                self._resolve_entity_separation( separation )
 
         for entity in self._entities:
-            transition = self._resolve_tile_collisions( entity )
-            if (transition != None):
-                self._load_new_segment(transition[0], transition[1])
+            self._resolve_tile_collisions( entity,
+                tile_collisions.get(entity, set()) )
+
+        for ( entity, trigger, volume ) in trigger_entries:
+            transition = self._resolve_trigger_entry( entity, trigger, volume )
+            if transition != None and entity == self._player_entity:
+                new_pos = ( transition[1][0] + 2, transition[1][1] + 1 )
+                self._load_new_segment( self._world.get_segment(transition[0]),
+                    new_pos )
                 break
 
         self._camera.update( time_delta )
@@ -78,11 +139,13 @@ class GameWorld():
     #
     #   @param event The event of which the game world will be notified.
     #   @param entities An optional listing of entities to be notified of the
-    #    event.  If this list is empty, the event will be broadcasted.
+    #    event.  If this list is empty, the event will be broadcasted to the
+    #    entities that may react to it.
     def notify_of( self, event, entities=[] ):
-        entities_to_notify = self._entities if len(entities) == 0 else entities
+        if len( entities ) == 0:
+            self._event_bus.publish( event )
 
-        for entity in entities_to_notify:
+        for entity in entities:
             entity.notify_of( event )
 
     ##  @return A listing of all the entity objects contained within the world
@@ -90,6 +153,22 @@ class GameWorld():
     def get_entities( self ):
         return self._entities
 
+    ##  Finds the entities with a collision volume intersecting the given
+    #   region through the collision detector, so only the entities near the
+    #   region are examined.
+    #
+    #   @param rect The region (of type `pygame.Rect`) to be queried.
+    #   @return A listing of the `Entity` objects within the region, given in
+    #    the same order as they're given by `get_entities`.
+    def get_entities_in( self, rect ):
+        entities_in_rect = set( [
+            self._cdrepr2entity_dict[ hitbox ]
+            for hitbox in self._collision_detector.query_rect( rect )
+            if hitbox in self._cdrepr2entity_dict
+        ] )
+
+        return [ entity for entity in self._entities if entity in entities_in_rect ]
+
     ##  @return A 2D matrix of strings where each string represents the
     #    identifier of the corresponding tile in the game world.
     def get_tilemap( self ):
@@ -103,11 +182,33 @@ class GameWorld():
     ### Helper Functions ###
 
     ##  Establishes the proper infrastructure to get the collision detection
-    #   system for the world instance up and running.
+    #   system for the world instance up and running.  The merged collision
+    #   and trigger geometry of the current segment is registered once as
+    #   static volumes, and the detector is filtered so that intangible
+    #   volumes and volumes of the same entity are never paired.  Once all the
+    #   volumes are registered, the detector is tuned to their sizes.
     def _setup_collision_detector( self ):
         self._cdrepr2entity_dict = {}
+        # Of the form: set( (entity, trigger_hitbox) ), holding the triggers
+        # occupied by a volume of each entity as of the last update
+        self._trigger_occupancy = set()
+        collision_filter = CollisionFilter( self._cdrepr2entity_dict.get )
+        collision_filter.ignore_pair( HitboxType.TRIGGER, HitboxType.TRIGGER )
+        self._collision_detector.set_filter( collision_filter )
         [ self._add_to_collision_detector( entity ) for entity in self._entities ]
 
+        self._tile_hitboxes = set( [
+            Hitbox( rect.x, rect.y, rect.w, rect.h )
+            for rect in self._segment.get_collision_rects()
+        ] )
+        self._trigger_hitboxes = set( [
+            Hitbox( rect.x, rect.y, rect.w, rect.h, HitboxType.TRIGGER )
+            for rect in self._segment.get_trigger_rects()
+        ] )
+        self._collision_detector.add_multiple( self._tile_hitboxes, static=True )
+        self._collision_detector.add_multiple( self._trigger_hitboxes, static=True )
+        self._collision_detector.tune()
+
     ##  Adds the given entity to the collision detection system.
     #
     #   @param entity The `Entity` object instance to be added to the collision
@@ -159,64 +260,138 @@ class GameWorld():
         return Event( EventType.COLLISION, event_args )
 
     ##  Resolves a given collision between `Entity` objects given their
-    #   representations in the collision detector as a two-tuple.
+    #   representations in the collision detector as a two-tuple.  The
+    #   entities are only notified of the collision when it first begins.
     #
     #   @param collision The two-tuple (Rect, Rect) given by the collision system.
-    def _resolve_entity_collision( self, collision ):
+    #   @param is_new True if the volumes weren't colliding on the last update.
+    def _resolve_entity_collision( self, collision, is_new=True ):
         ( entity1, entity2 ) = (
             self._get_entity_from_collision_detector( collision[0] ),
             self._get_entity_from_collision_detector( collision[1] ),
         )
 
-        collision_event = self._generate_collision_event( collision )
-
         if entity1 != entity2:
-            entity1.notify_of( collision_event )
-            entity2.notify_of( collision_event )
+            if is_new:
+                collision_event = self._generate_collision_event( collision )
+                entity1.notify_of( collision_event )
+                entity2.notify_of( collision_event )
 
             self._resolve_collision( entity1.get_chitbox(), entity2.get_chitbox() )
 
+    ##  Notifies the `Entity` objects owning the given pair of volumes that
+    #   the volumes have stopped colliding.
+    #
+    #   @param separation The two-tuple (Rect, Rect) of volumes that were
+    #    colliding on the last update.
+    def _resolve_entity_separation( self, separation ):
+        ( entity1, entity2 ) = (
+            self._get_entity_from_collision_detector( separation[0] ),
+            self._get_entity_from_collision_detector( separation[1] ),
+        )
+
+        if entity1 != entity2:
+            separation_event = Event( EventType.SEPARATION, {
+                "objects": ( entity1, entity2 ),
+                "volumes": ( separation[0], separation[1] )
+            } )
+            entity1.notify_of( separation_event )
+            entity2.notify_of( separation_event )
+
     ##  Resolves the collisions between an `Entity` and all the world tiles
-    #   with which it intersects.
+    #   with which it intersects.  The entity is resolved against each merged
+    #   tile volume in turn, from the deepest overlap to the shallowest, so
+    #   that it doesn't snag on the seams between volumes.
     #
     #   @param entity The `Entity` object that will have its tile collisions resolved.
+    #   @param tile_hitboxes The static tile `Hitbox` instances that the
+    #    collision system found intersecting the entity.
+    def _resolve_tile_collisions( self, entity, tile_hitboxes ):
+        # Resolve collision with each intersected tile volume that still
+        # intersects the entity once the previous volumes are resolved
+        chitbox = entity.get_chitbox()
+        for tile_hitbox in sorted( tile_hitboxes, key=lambda tile_hitbox:
+                self._get_overlap_area(chitbox.get_bounding_box(), tile_hitbox),
+                reverse=True ):
+            if chitbox.get_bounding_box().colliderect( tile_hitbox ):
+                self._resolve_collision_with_box( chitbox, tile_hitbox )
+
+    ##  Notifies an `Entity` that one of its volumes has begun intersecting a
+    #   trigger volume, finding the segment transition that it entered if any.
     #
-    #   @return A tuple of the form (segment, starting_position) if the player is colliding
-    #           with a transition tile, else None
-    def _resolve_tile_collisions( self, entity ):
-        entity_hitbox = entity.get_bbox()
+    #   @param entity The `Entity` object that entered the trigger.
+    #   @param trigger The trigger `Hitbox` instance that was entered.
+    #   @param volume The `Hitbox` of the entity that intersects the trigger.
+    #   @return A tuple of the form (segment_id, (x, y)) describing the
+    #    transition tile entered (given in tiles), or None if no transition
+    #    was entered.
+    def _resolve_trigger_entry( self, entity, trigger, volume ):
+        trigger_rect = volume.clip( trigger )
         seg_dims = self._segment.get_dims()
 
-        # Get bounds for tiles surrounding the entity
-        start_idx_x = int( entity_hitbox.left / Globals.TILE_DIMS[0] )
-        start_idx_y = int( entity_hitbox.top / Globals.TILE_DIMS[1] )
-        final_idx_x = int( entity_hitbox.right / Globals.TILE_DIMS[0] ) + 1
-        final_idx_y = int( entity_hitbox.bottom / Globals.TILE_DIMS[1] ) + 1
-
-        # Get hitboxes for tiles that the entity is on top of
-        tile_hitbox_list = []
+        # Find the first transition tile in the intersection of the volumes
+        transition = None
+        start_idx_x = trigger_rect.left / TILE_DIMS[ 0 ]
+        start_idx_y = trigger_rect.top / TILE_DIMS[ 1 ]
+        final_idx_x = ( trigger_rect.right - 1 ) / TILE_DIMS[ 0 ] + 1
+        final_idx_y = ( trigger_rect.bottom - 1 ) / TILE_DIMS[ 1 ] + 1
         for idx_x in range( max(0, start_idx_x), min(final_idx_x, seg_dims[0]) ):
             for idx_y in range( max(0, start_idx_y), min(final_idx_y, seg_dims[1]) ):
-                tile_hitbox = self._get_hitbox_from_tile(idx_x,idx_y)
-                tile_hitbox_list.append( tile_hitbox )
+                transition = transition or \
+                    self._segment.get_tile_transition( idx_x, idx_y )
 
-                # Check for transitions to other segments
-                if (entity == self._player_entity):
-                    transition = self._segment.get_tile_transition(idx_x,idx_y)
-                    if (transition != None):
-                        new_segment = transition[0]
-                        new_pos = (transition[1][0] + 2, transition[1][1] + 1)
-                        # return the transition information so the new segment can be loaded
-                        return (new_segment, new_pos)
+        entity.notify_of( Event(EventType.TRIGGER, {
+            "objects": ( entity, ),
+            "volumes": ( volume, trigger ),
+            "transition": transition
+        }) )
 
-        # Create composite hitbox of tangible tiles
-        tile_collection_chitbox = self._get_composite_hitbox_from_hitboxes(tile_hitbox_list)
+        return transition
 
-        # Resolve collision with the composite hitbox
-        self._resolve_collision( entity.get_chitbox(), tile_collection_chitbox )
+    ##  Sweeps the movement of every entity made since the given positions,
+    #   stopping each entity at its first contact with a tile volume or
+    #   another entity.  All entities are returned to their starting positions
+    #   before any are swept, and are then swept in order.
+    #
+    #   @param start_positions A dictionary mapping each `Entity` to the
+    #    position of its composite hitbox at the start of the update.
+    def _sweep_entities( self, start_positions ):
+        displacements = {}
+        for entity in self._entities:
+            chitbox = entity.get_chitbox()
+            ( pos_x, pos_y ) = chitbox.get_position()
+            ( start_x, start_y ) = start_positions.get( entity, (pos_x, pos_y) )
 
-        # No transitions were found so we return None
-        return None
+            displacements[ entity ] = ( pos_x - start_x, pos_y - start_y )
+            chitbox.translate( start_x - pos_x, start_y - pos_y )
+
+        self._collision_detector.update()
+
+        for entity in self._entities:
+            if displacements[ entity ] != ( 0, 0 ):
+                ( delta_x, delta_y ) = self._sweep_entity( entity,
+                    displacements[entity] )
+                entity.get_chitbox().translate( delta_x, delta_y )
+
+    ##  Sweeps the collidable volumes of an `Entity` along a displacement
+    #   against the volumes found by the collision detector along the way.
+    #
+    #   @param entity The `Entity` object to be swept from its current position.
+    #   @param displacement The integer displacement tuple (dx, dy) to be swept.
+    #   @return The displacement tuple (dx, dy) clamped to the first contact.
+    def _sweep_entity( self, entity, displacement ):
+        chitbox = entity.get_chitbox()
+        bbox = chitbox.get_bounding_box()
+        collision_filter = self._collision_detector.collision_filter
+
+        swept_rect = bbox.union( bbox.move(displacement[0], displacement[1]) )
+        return clamp_displacement(
+            [ hitbox for hitbox in chitbox.get_inner_boxes()
+                if collision_filter.is_collidable( hitbox ) ],
+            displacement,
+            [ volume for volume in self._collision_detector.query_rect( swept_rect )
+                if volume not in self._trigger_hitboxes ],
+            collision_filter.can_collide )
 
     ##  Resolves a collision between two hitboxes, adjusting the them as
     #   necessary so that they're no longer intersecting.
@@ -224,8 +399,17 @@ class GameWorld():
     #   @param chitbox_movable The composite to be resolved and moved in collision.
     #   @param chitbox_fixed The composite to be resolved in the collision.
     def _resolve_collision( self, chitbox_movable, chitbox_fixed ):
+        self._resolve_collision_with_box( chitbox_movable,
+            chitbox_fixed.get_bounding_box() )
+
+    ##  Resolves a collision between a composite hitbox and a fixed rectangle,
+    #   moving the composite so that the two are no longer intersecting.
+    #
+    #   @param chitbox_movable The composite to be resolved and moved in collision.
+    #   @param hitbox_fixed The rectangle (of type `pygame.Rect`) to be resolved
+    #    in the collision.
+    def _resolve_collision_with_box( self, chitbox_movable, hitbox_fixed ):
         hitbox_movable = chitbox_movable.get_bounding_box()
-        hitbox_fixed = chitbox_fixed.get_bounding_box()
 
         collision_rect = hitbox_movable.clip( hitbox_fixed )
         res_vector = [ 0, 0 ]
@@ -239,6 +423,12 @@ class GameWorld():
 
         chitbox_movable.translate( res_vector[0], res_vector[1] )
 
+    ##  @return The area of the intersection of the two given rectangles (of
+    #    type `pygame.Rect`).
+    def _get_overlap_area( self, rect1, rect2 ):
+        overlap_rect = rect1.clip( rect2 )
+        return overlap_rect.w * overlap_rect.h
+
     ##  Removes an entity from the Game World.
     #
     #   @param entity The entity that needs to be removed
@@ -249,12 +439,16 @@ class GameWorld():
         # Remove from Game World entity list
         if entity in self._entities:
             self._entities.remove(entity)
+        self._event_bus.unsubscribe(entity)
+        entity.get_mental_state().set_timer_scheduler(None)
 
     def _load_new_segment(self, segment, player_pos=None):
         self._segment = segment
         segment_dims = segment.get_pixel_dims()
         self._tilemap = segment.get_tiles()
         self._entities = []
+        self._event_bus = EventBus()
+        self._timers = TimerScheduler()
 
         # Create entities
         for ( (idx_x, idx_y), entity_class ) in segment.get_entities():
@@ -271,45 +465,15 @@ class GameWorld():
                 if entity_class == "player":
                     self._player_entity = entity
 
+        # Subscribe entities to the broadcast events and timeouts they react to
+        for entity in self._entities:
+            self._event_bus.subscribe( entity, entity.get_event_matchers() )
+            entity.get_mental_state().set_timer_scheduler( self._timers )
+
         # Initialize camera and collision detector
         self._camera = Camera( target=self._player_entity.get_bbox(),
             new_border=PG.Rect(0, 0, segment_dims[0], segment_dims[1]) )
-        self._collision_detector = SpatialDictionary( segment_dims[0] / 16,
+        self._collision_detector = self._detector_type.for_area(
             segment_dims[0], segment_dims[1] )
 
         self._setup_collision_detector()
-
-    ## Creates a hitbox for a tile specified by x and y coordinates.
-    #
-    #   @param x The x coordinate for the tile.
-    #   @param y The y coordinate for the tile.
-    #
-    #   @return A hitbox that covers the tile.
-    def _get_hitbox_from_tile(self, x, y):
-        tile_is_tangible = self._tilemap[ x ][ y ][ 1 ]
-        return Hitbox(
-            x * Globals.TILE_DIMS[0],
-            y * Globals.TILE_DIMS[1],
-            Globals.TILE_DIMS[0],
-            Globals.TILE_DIMS[1],
-            HitboxType.DEFAULT if tile_is_tangible else HitboxType.INTANGIBLE
-        )
-
-    ## Creates a composite hitbox out of a list of individual hitboxes.
-    #
-    #   @param hitbox_list A list containing Hitboxes
-    #
-    #   @return A CompositeHitbox
-    def _get_composite_hitbox_from_hitboxes(self, hitbox_list):
-        x_list = [h.x for h in hitbox_list if h.htype != HitboxType.INTANGIBLE]
-        y_list = [h.y for h in hitbox_list if h.htype != HitboxType.INTANGIBLE]
-
-        if (len(x_list) == 0):
-            return CompositeHitbox(0,0)
-        else:
-            min_x = min(x_list)
-            min_y = min(y_list)
-            for hitbox in hitbox_list:
-                hitbox.x -= min_x
-                hitbox.y -= min_y
-            return CompositeHitbox( min_x, min_y, hitbox_list )
@@ -33,6 +33,10 @@ FRAMES_PER_SECOND = 60
 #   in a rope pulling along the camera.
 SLACK = 0
 
+##  The estimated number of bytes that the loaded segments of the game world
+#   are allowed to use before the least recently used ones are unloaded.
+SEGMENT_MEMORY_BUDGET = 8 * 1024 * 1024
+
 ## Game View Variables ##
 
 ##  The default dimensions of the screen to which the game will be rendered
@@ -60,6 +64,10 @@ DATA_PATH = os.path.join( ASSET_PATH, "data" )
 #   image assets for the game.
 GRAPHICS_PATH = os.path.join( ASSET_PATH, "graphics" )
 
+##  The path to the compiled asset bundle for the game, which is used in place
+#   of the data content when it's present and up to date.
+BUNDLE_PATH = os.path.join( DATA_PATH, "assets.bundle" )
+
 # Custom Events
 MOVE_UP = PG.USEREVENT
 MOVE_DOWN = PG.USEREVENT+1
@@ -9,37 +9,140 @@
 
 import os.path
 import string
+import logging
 import pygame as PG
 from Globals import *
+from Segment import Segment
+from SegmentCache import SegmentCache
 
-##  This class is a container for a connected Segment graph.
+##  This class is a container for a connected Segment graph.  Segments are
+#   described by their `SegmentInfo` until they're first accessed through the
+#   `segments` mapping, at which point they're loaded into the segment cache.
 class Level():
     ### Constructors ###
 
     ##  Creates an empty Level
     #   
     #   @param id A unique identifier for the level
-    def __init__(self, id):
+    #   @param cache The `SegmentCache` holding the loaded segments of the
+    #       level (defaults to an unbounded cache for this level alone).
+    def __init__(self, id, cache=None):
         self.id = id
-        # has the form { id => Segment }
-        self.segments = {}
+        # has the form { id => SegmentInfo }
+        self.segment_infos = {}
+        # loads segments on access, and has the form { id => Segment }
+        self.segments = LevelSegments(self)
+        # edges between segments, of the form:
+        # { id => { (x,y) => (dest_segment_id, (dest_x,dest_y)) } }
+        self.transitions = {}
+        # transition tiles grouped by their color, of the form:
+        # { color_tuple => [(id, (x,y))] }
+        self.transition_buckets = {}
+        self.cache = cache if cache != None else SegmentCache()
 
     ### Methods ###
 
-    ##  Adds the segment to the level by adding it to the segment dictionary.
+    ##  Adds the loaded segment to the level.
     #
     #   @param segment The segment object to be added to the level
     def add_segment(self, segment):
-        self.segments[segment.id] = segment
+        self.add_segment_info(segment.get_info())
+        segment.transitions = self.transitions[segment.id]
+        self.cache.add(segment.id, segment)
 
-    ##  Creates transitions between segments in the level
+    ##  Adds a segment to the level without loading it.
+    #
+    #   @param info The `SegmentInfo` describing the segment to be added.
+    def add_segment_info(self, info):
+        self.segment_infos[info.id] = info
+        self.transitions.setdefault(info.id, {})
+
+    ##  Returns the segment with the given id, loading it if it isn't loaded.
+    #
+    #   @param id The identifier of a segment in the level.
+    #
+    #   @return The loaded `Segment` object.
+    def get_segment(self, id):
+        if id not in self.segment_infos:
+            raise KeyError(id)
+
+        return self.cache.get(id, self._load_segment)
+
+    ##  Creates transitions between segments in the level by grouping their
+    #   transition tiles by color and linking the tiles within each group.
     def connect(self):
-        for segment_i in self.segments.values():
-            for segment_j in self.segments.values():
-                for tti in segment_i.transition_tiles:
-                    for ttj in segment_j.transition_tiles:
-                        if (tti[1] == ttj[1]):
-                            if (segment_i != segment_j or tti[0] != ttj[0]):
-                                segment_i.add_transition(tti[0],segment_j,ttj[0])
-                                segment_j.add_transition(ttj[0],segment_i,tti[0])
+        self.transition_buckets = {}
+        for id in sorted(self.segment_infos.keys()):
+            for (pos, color) in self.segment_infos[id].transition_tiles:
+                self.transition_buckets.setdefault(color, []).append((id, pos))
+
+        for color in self.transition_buckets:
+            self._link_bucket(color)
+
+    ##  Adds a segment to a connected level and creates the transitions to and
+    #   from it, relinking only the transition tiles that share its colors.
+    #
+    #   @param info The `SegmentInfo` describing the segment to be connected.
+    def connect_segment(self, info):
+        self.add_segment_info(info)
+
+        colors = set()
+        for (pos, color) in info.transition_tiles:
+            bucket = self.transition_buckets.setdefault(color, [])
+            if (info.id, pos) not in bucket:
+                bucket.append((info.id, pos))
+            colors.add(color)
+
+        for color in colors:
+            self._link_bucket(color)
+
+    # Helper Functions #
+
+    ##  Links each transition tile of the given color to the next tile of that
+    #   color, so a pair of tiles is linked in both directions.  Colors should
+    #   be used by exactly two tiles, otherwise the tiles are linked in a ring.
+    def _link_bucket(self, color):
+        bucket = self.transition_buckets[color]
+        if (len(bucket) > 2):
+            logging.warning("Transition color %s is used by %d tiles in level '%s'..." %
+                (str(color), len(bucket), self.id))
+
+        if (len(bucket) > 1):
+            for (index, (id, pos)) in enumerate(bucket):
+                self.transitions[id][pos] = bucket[(index + 1) % len(bucket)]
+
+    ##  Loads the segment with the given id along with its transitions, which
+    #   are shared with the level so that later connections reach it.
+    def _load_segment(self, id):
+        segment = Segment(id)
+        segment.transitions = self.transitions[id]
+        return segment
+
+##  A read-only mapping of the form { id => Segment } over the segments of a
+#   level, which loads each segment when it's first accessed.
+class LevelSegments():
+
+    ##  Creates the mapping over the segments of the given level.
+    def __init__(self, level):
+        self._level = level
+
+    def __getitem__(self, id):
+        return self._level.get_segment(id)
+
+    def __contains__(self, id):
+        return id in self._level.segment_infos
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self._level.segment_infos)
+
+    def keys(self):
+        return sorted(self._level.segment_infos.keys())
+
+    def values(self):
+        return [self[id] for id in self.keys()]
 
+    def items(self):
+        return [(id, self[id]) for id in self.keys()]
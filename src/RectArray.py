@@ -0,0 +1,182 @@
+##  @file RectArray.py
+#   @date Fall 2026
+#
+#   Source File for the "RectArray" Type
+#
+#   A batch of axis-aligned rectangles stored as contiguous `int32` arrays so
+#   that overlap tests can be run over every rectangle at once with NumPy.
+#   Candidate pairs are found over intervals sorted along the x axis, sweeping
+#   the static rectangles only against the moving ones, and then filtered with
+#   the same strict overlap test as `pygame.Rect.colliderect`, so no Python
+#   code runs per candidate pair.
+
+import numpy as NP
+
+##  A fixed collection of rectangles whose positions are mirrored in
+#   contiguous integer arrays for vectorized overlap testing.
+class RectArray( object ):
+    ### Constructors ###
+
+    ##  Constructs a rectangle array mirroring the given rectangles.
+    #
+    #   @param rects A list of rectangles (of type `pygame.Rect`).
+    #   @param static_count The number of rectangles at the front of the list
+    #    that never move.  Pairs of two such rectangles are never generated
+    #    and their positions are never refreshed.
+    #   @param collision_filter An optional `CollisionFilter` whose rejected
+    #    pairs are never reported.
+    def __init__( self, rects, static_count=0, collision_filter=None ):
+        self._rects = list( rects )
+        self._static_count = static_count
+        self._filter = collision_filter
+
+        # Number of candidate pairs tested by the last overlap computation
+        self.pairs_tested = 0
+
+        count = len( self._rects )
+        self._left = NP.zeros( count, dtype=NP.int32 )
+        self._top = NP.zeros( count, dtype=NP.int32 )
+        self._right = NP.zeros( count, dtype=NP.int32 )
+        self._bottom = NP.zeros( count, dtype=NP.int32 )
+
+        # Type matrix indices and owner keys used to apply the filter in bulk
+        self._types = NP.zeros( count, dtype=NP.intp )
+        self._owners = NP.zeros( count, dtype=NP.int64 )
+        if self._filter is not None:
+            self._owners[:] = [ self._filter.get_owner_key(r) for r in self._rects ]
+
+        self._refresh_range( 0, count )
+
+    ### Overloaded Operators ###
+
+    ##  @return The number of rectangles in the array.
+    def __len__( self ):
+        return len( self._rects )
+
+    ### Methods ###
+
+    ##  Copies the current positions of the moving rectangles into the arrays.
+    def refresh( self ):
+        self._refresh_range( self._static_count, len(self._rects) )
+
+    ##  @return The list of rectangles mirrored by the array, in index order.
+    def get_rects( self ):
+        return self._rects
+
+    ##  Finds every pair of overlapping rectangles that contains at least one
+    #   moving rectangle.
+    #
+    #   @return An (N, 2) integer array where each row holds the indices of
+    #    two overlapping rectangles with the smaller index first.
+    def get_overlapping_pairs( self ):
+        self.pairs_tested = 0
+
+        count = len( self._rects )
+        if count < 2:
+            return NP.zeros( (0, 2), dtype=NP.intp )
+
+        # The moving rectangles are swept against each other and against the
+        # static ones, so no pair of two static rectangles is ever generated.
+        # A static rectangle starting at the same x as a moving one is only
+        # paired with it by the sweep over the static rectangles.
+        static = NP.arange( min(self._static_count, count) )
+        moving = NP.arange( len(static), count )
+        candidates = [ self._sweep( moving ),
+            self._sweep_across( moving, static, "right" ),
+            self._sweep_across( static, moving, "left" ) ]
+
+        idx_a = NP.concatenate( [pair[0] for pair in candidates] )
+        idx_b = NP.concatenate( [pair[1] for pair in candidates] )
+
+        total = len( idx_a )
+        self.pairs_tested = total
+        if total == 0:
+            return NP.zeros( (0, 2), dtype=NP.intp )
+
+        overlapping = \
+            ( self._left[idx_a] < self._right[idx_b] ) & \
+            ( self._right[idx_a] > self._left[idx_b] ) & \
+            ( self._top[idx_a] < self._bottom[idx_b] ) & \
+            ( self._bottom[idx_a] > self._top[idx_b] )
+
+        if self._filter is not None:
+            type_matrix = self._filter.get_type_matrix()
+            overlapping &= type_matrix[ self._types[idx_a], self._types[idx_b] ] & \
+                ( self._owners[idx_a] != self._owners[idx_b] )
+
+        pairs = NP.column_stack( (idx_a[overlapping], idx_b[overlapping]) )
+        pairs.sort( axis=1 )
+
+        return pairs
+
+    ### Helper Methods ###
+
+    ##  Finds the candidate pairs amongst the given rectangles, which are the
+    #   pairs whose intervals along the x axis intersect.
+    #
+    #   @param indices An array of the indices of the rectangles to be swept.
+    #   @return A tuple of two index arrays holding the candidate pairs.
+    def _sweep( self, indices ):
+        order = indices[ NP.argsort(self._left[indices], kind="mergesort") ]
+        sorted_left = self._left[ order ]
+
+        # Every rectangle after position `i` in sorted order that starts
+        # before rectangle `i` ends is a candidate partner for it.
+        starts = NP.arange( len(order) ) + 1
+        ends = NP.searchsorted( sorted_left, self._right[order], side="left" )
+
+        return self._get_candidates( order, order, starts, ends )
+
+    ##  Finds the candidate pairs between two disjoint groups of rectangles,
+    #   which pair each source rectangle with the target rectangles starting
+    #   within its interval along the x axis.
+    #
+    #   @param sources An array of the indices of the source rectangles.
+    #   @param targets An array of the indices of the target rectangles.
+    #   @param side "left" if the targets starting at the same x as a source
+    #    are its partners and "right" otherwise.
+    #   @return A tuple of two index arrays holding the candidate pairs.
+    def _sweep_across( self, sources, targets, side ):
+        order = targets[ NP.argsort(self._left[targets], kind="mergesort") ]
+        sorted_left = self._left[ order ]
+
+        starts = NP.searchsorted( sorted_left, self._left[sources], side=side )
+        ends = NP.searchsorted( sorted_left, self._right[sources], side="left" )
+
+        return self._get_candidates( sources, order, starts, ends )
+
+    ##  Expands ranges of sorted partner positions into candidate pairs.
+    #
+    #   @param sources An array of the indices of the source rectangles.
+    #   @param order An array of the indices of the partner rectangles in
+    #    sorted order.
+    #   @param starts The first sorted position of each source's partners.
+    #   @param ends The sorted position one past each source's last partner.
+    #   @return A tuple of two index arrays holding the candidate pairs.
+    def _get_candidates( self, sources, order, starts, ends ):
+        counts = NP.maximum( ends - starts, 0 )
+        total = int( counts.sum() )
+
+        group_starts = NP.repeat( NP.cumsum(counts) - counts, counts )
+        positions = NP.repeat( starts, counts ) + \
+            ( NP.arange(total) - group_starts )
+
+        return ( NP.repeat(sources, counts), order[positions] )
+
+    ##  Copies the positions of the rectangles in the given index range into
+    #   the coordinate arrays.
+    #
+    #   @param start The first index to be copied.
+    #   @param stop The index one past the last index to be copied.
+    def _refresh_range( self, start, stop ):
+        if start >= stop:
+            return
+
+        rects = self._rects[ start:stop ]
+        self._left[ start:stop ] = [ r.x for r in rects ]
+        self._top[ start:stop ] = [ r.y for r in rects ]
+        self._right[ start:stop ] = [ r.x + r.width for r in rects ]
+        self._bottom[ start:stop ] = [ r.y + r.height for r in rects ]
+
+        if self._filter is not None:
+            self._types[ start:stop ] = [ self._filter.get_type_index(r) for r in rects ]
@@ -13,11 +13,30 @@
 #   Low Priority:
 #   - Fix the problems associated with fixed to free camera transitioning.
 
+import sys
 import string
 import struct
+import numpy as NP
 import pygame as PG
 from os.path import join as join_paths
 from Globals import *
+from AssetBundle import AssetBundle
+from Tilemap import Tilemap
+
+##  The lightweight description of a segment that is known before the segment
+#   is loaded, which is enough to place the segment within its level.
+class SegmentInfo():
+
+    ##  Constructs the description of a segment.
+    #
+    #   @param id The identifier of the described segment.
+    #   @param dims A tuple of the form (width, height) given in tiles.
+    #   @param transition_tiles A list of the transition tiles of the segment,
+    #       of the form ((x,y), color_tuple).
+    def __init__(self, id, dims, transition_tiles):
+        self.id = id
+        self.dims = dims
+        self.transition_tiles = transition_tiles
 
 ##  A representation of a portion of the game world, which is composed of a 
 #   matrix of tiles.  A segment instance handles all the assets associated with
@@ -41,22 +60,68 @@ class Segment():
         # The height of the tile matrix (in number of tiles).
         self.height = 0
 
-        # 2d array of Tiles
-        self.tiles = []
+        # 2d array of Tiles indexed by [x][y], given as a `Tilemap`
+        self.tiles = Tilemap([], NP.zeros((0, 0)))
+
+        # 2d boolean array indexed by [x, y] that is true for tangible tiles
+        self.tangibility = NP.zeros((0, 0), dtype=bool)
 
-        # edges to other segments, of the form:
-        # { (x,y) => (dest_segment, (dest_x,dest_y)) }
+        # edges to other segments, which are given by the segment's level, of
+        # the form: { (x,y) => (dest_segment_id, (dest_x,dest_y)) }
         self.transitions = {}
 
         # initial position of entities, of the form:
         # ( (x,y), entity_id )
         self.entities = []
 
-        self._setup_tiles()
-        self._setup_entities()
+        compiled_data = self._load_compiled_data()
+        if compiled_data != None:
+            self._setup_compiled(compiled_data)
+        else:
+            self._setup_tiles()
+            self._setup_entities()
+
+        # greedy-meshed collision geometry, which is kept with the segment so
+        # that it's evicted along with it, of the form: [(x, y, w, h)] (given
+        # in pixels)
+        self.collision_rects = self._setup_collision_rects()
+
+        # greedy-meshed trigger geometry of the form: [(x, y, w, h)] (given in
+        # pixels), along with the transitions it was meshed from as a tuple of
+        # the form: (transitions, transition_count)
+        self.trigger_rects = []
+        self.trigger_source = None
+
+    ##  Finds the description of a segment without loading the segment, which
+    #   only reads the compiled segment data or the segment's tile image.
+    #
+    #   @param id The identifier of the segment to be described.
+    #
+    #   @return The `SegmentInfo` describing the segment.
+    @staticmethod
+    def load_info(id):
+        bundle = AssetBundle.get_default()
+        data = bundle.get("segdata/" + id) if bundle != None else None
+
+        if data != None:
+            dims = data["dims"]
+            colors = [tile[2] for tile in data["palette"]]
+            pixels = NP.frombuffer(data["tiles"],
+                dtype=Tilemap.get_index_type(len(colors))).reshape(dims)
+        else:
+            surface_filename = os.path.join('assets','data','segdata', id + '.gif')
+            surface = PG.image.load(surface_filename)
+            dims = (surface.get_width(), surface.get_height())
+
+            # Index the distinct colors so both sources are scanned alike
+            (unique_colors, indices) = NP.unique(
+                Segment._read_packed_colors(surface), return_inverse=True)
+            colors = [Segment._unpack_color(color)
+                for color in unique_colors.tolist()]
+            pixels = indices.reshape(dims)
 
-        # Find transition tiles
-        self._set_transition_tiles()
+        return SegmentInfo(id, tuple(dims),
+            Segment._find_transition_tiles(colors, pixels))
 
     # Methods #
 
@@ -64,7 +129,8 @@ class Segment():
     #
     #   @param src A tuple of the form (x,y) representing the location of the
     #              transition in this segment.
-    #   @param dest_segment The segment that the transition goes to.
+    #   @param dest_segment The identifier of the segment that the transition
+    #              goes to.
     #   @param dest A tuple of the form (x,y) representing the location of the
     #              transition in the destination segment.
     def add_transition(self, src, dest_segment, dest):
@@ -76,7 +142,7 @@ class Segment():
     #   @param idy the y coordinate of the tile
     #
     #   @return None if there is no transition
-    #           (dest_segment, (dest_x,dest_y)) if there is a transition
+    #           (dest_segment_id, (dest_x,dest_y)) if there is a transition
     def get_tile_transition(self, idx, idy):
         if ((idx,idy) in self.transitions):
             return self.transitions[(idx,idy)]
@@ -85,11 +151,45 @@ class Segment():
 
     ##  Returns the tile information
     #
-    #   @return A 2d array of tiles.
-    #           Tiles have form (tile_id, bool tangible)
+    #   @return A `Tilemap` of tiles indexed by [x][y].
+    #           Tiles have form (tile_id, bool tangible, color)
     def get_tiles(self):
         return self.tiles
 
+    ##  Returns the tangibility grid of the segment, which is built once when
+    #   the segment is loaded.
+    #
+    #   @return A 2d boolean NumPy array indexed by [x, y] that is true where
+    #           the tile is tangible.
+    def get_tangibility(self):
+        return self.tangibility
+
+    ##  Returns the static collision geometry of the segment, which merges
+    #   contiguous tangible tiles into as few rectangles as practical.  The
+    #   geometry is built once when the segment is loaded.
+    #
+    #   @return A list of `pygame.Rect` objects (given in pixels) which cover
+    #           every tangible tile exactly once.
+    def get_collision_rects(self):
+        return [PG.Rect(rect) for rect in self.collision_rects]
+
+    ##  Returns the trigger geometry of the segment, which merges contiguous
+    #   transition tiles into as few rectangles as practical.  Transitions are
+    #   only known once the level has been connected, so the geometry is built
+    #   on the first call and rebuilt only when transitions have been added or
+    #   replaced since (transitions are never removed).
+    #
+    #   @return A list of `pygame.Rect` objects (given in pixels) which cover
+    #           every transition tile exactly once.
+    def get_trigger_rects(self):
+        source = self.trigger_source
+        if source == None or source[0] is not self.transitions or \
+                source[1] != len(self.transitions):
+            self.trigger_rects = self._setup_trigger_rects()
+            self.trigger_source = (self.transitions, len(self.transitions))
+
+        return [PG.Rect(rect) for rect in self.trigger_rects]
+
     ##  Returns the entity information
     #
     #   @return A list of the entities in this segment.
@@ -97,6 +197,42 @@ class Segment():
     def get_entities(self):
         return self.entities
 
+    ##  Returns the tile and entity information of the segment in the compact
+    #   form stored in asset bundles.
+    #
+    #   @return A dictionary of the form:
+    #           { "dims": (width, height),
+    #             "palette": [(tile_id, tangible, color)],
+    #             "tiles": string of the palette index of each tile (of the
+    #                      `Tilemap` index type), ordered by column and then
+    #                      by row,
+    #             "entities": [((x,y), entity_id)] }
+    def get_compiled_data(self):
+        return {
+            "dims": (self.width, self.height),
+            "palette": self.tiles.get_palette(),
+            "tiles": self.tiles.get_indices().tostring(),
+            "entities": self.entities,
+        }
+
+    ##  @return The `SegmentInfo` describing this segment.
+    def get_info(self):
+        return SegmentInfo(self.id, self.get_dims(), self.transition_tiles)
+
+    ##  Estimates the memory used by the loaded segment, which counts the tile
+    #   arrays, collision geometry and entity list but not the tile tuples
+    #   shared between tiles.
+    #
+    #   @return The estimated size of the segment in bytes.
+    def get_memory_size(self):
+        return self.tiles.get_memory_size() + \
+            self.tangibility.nbytes + sys.getsizeof(self.entities) + \
+            sum(sys.getsizeof(entity) for entity in self.entities) + \
+            sys.getsizeof(self.collision_rects) + \
+            sum(sys.getsizeof(rect) for rect in self.collision_rects) + \
+            sys.getsizeof(self.trigger_rects) + \
+            sum(sys.getsizeof(rect) for rect in self.trigger_rects)
+
     ##  Returns the segment size
     #
     #   @return A tuple of the level size. It is not multiplied by the tile size.
@@ -110,22 +246,86 @@ class Segment():
 
     # Helper Functions #
 
-    ##  Finds certain types of tiles in the segments data surface.
+    ##  Sets up the tile array, tangibility grid and transition tiles from the
+    #   palette index of each tile.
+    #
+    #   @param palette A list of the distinct tiles of the segment.
+    #   @param indices A 2d NumPy array of palette indices indexed by [x, y].
+    def _setup_palette(self, palette, indices):
+        self.tiles = Tilemap(palette, indices)
+        self.tangibility = self.tiles.get_tangibility()
+        self.transition_tiles = Segment._find_transition_tiles(
+            [tile[2] for tile in palette], self.tiles.get_indices())
+
+    ##  Finds certain types of tiles in a grid of palette indices.
+    #
+    #   @param colors A list of the color tuple of each palette entry.
+    #   @param indices A 2d NumPy array of palette indices indexed by [x, y].
     #
     #   @return A list of tuples of the form:
-    #       ((x,y),pygame.Color)
-    def _set_transition_tiles(self):
-        self.transition_tiles = []
+    #       ((x,y),color_tuple)
+    @staticmethod
+    def _find_transition_tiles(colors, indices):
+        transition_indices = [index for (index, color) in enumerate(colors)
+            if Tilemap.is_transition_color(color)]
+        (xs, ys) = NP.nonzero(NP.in1d(indices, transition_indices).reshape(indices.shape))
+
+        return [((x, y), colors[indices[x, y]])
+            for (x, y) in zip(xs.tolist(), ys.tolist())]
+
+    ##  Greedily merges the set tiles of a boolean tile grid into rectangles.
+    #   Each rectangle starts at the first uncovered set tile in row order,
+    #   grows right along its row and then grows down while the whole span
+    #   below it is set and uncovered.
+    #
+    #   @param grid A 2d boolean array indexed by [x, y] with the segment dims.
+    #
+    #   @return A list of tuples of the form (x, y, w, h) (given in tiles).
+    def _mesh_grid(self, grid):
+        remaining = grid.copy()
+        rects = []
+
+        for y in range(0, self.height):
+            for x in NP.flatnonzero(remaining[:, y]):
+                if not remaining[x, y]:
+                    continue
+
+                stop_x = x + 1
+                while stop_x < self.width and remaining[stop_x, y]:
+                    stop_x += 1
+
+                stop_y = y + 1
+                while stop_y < self.height and remaining[x:stop_x, stop_y].all():
+                    stop_y += 1
 
-        for x in range(0,len(self.tiles)):
-            for y in range(0,len(self.tiles[x])):
-                tile = self.tiles[x][y]
-                if (tile[2] != (0,0,0,255) and tile[2] != (255,255,255,255)):
-                    if (tile[2][0] == tile[2][1] == tile[2][2]): # color is grayscale
-                        self.transition_tiles.append(((x,y),tile[2]))
-        
+                remaining[x:stop_x, y:stop_y] = False
+                rects.append((int(x), y, int(stop_x - x), stop_y - y))
 
-    ##  Initializes the tile array
+        return rects
+
+    ##  Meshes the tangibility grid into the segment's collision geometry.
+    #
+    #   @return A list of the collision rectangles of the segment, of the
+    #           form: [(x, y, w, h)] (given in pixels).
+    def _setup_collision_rects(self):
+        (tile_w, tile_h) = TILE_DIMS
+        return [(x * tile_w, y * tile_h, w * tile_w, h * tile_h)
+            for (x, y, w, h) in self._mesh_grid(self.tangibility)]
+
+    ##  Meshes the transition tiles into the segment's trigger geometry.
+    #
+    #   @return A list of the trigger rectangles of the segment, of the form:
+    #           [(x, y, w, h)] (given in pixels).
+    def _setup_trigger_rects(self):
+        transition_grid = NP.zeros((self.width, self.height), dtype=bool)
+        for (x, y) in self.transitions:
+            transition_grid[x, y] = True
+
+        (tile_w, tile_h) = TILE_DIMS
+        return [(x * tile_w, y * tile_h, w * tile_w, h * tile_h)
+            for (x, y, w, h) in self._mesh_grid(transition_grid)]
+
+    ##  Initializes the tile array and the tangibility grid
     #
     def _setup_tiles(self):
         surface_filename = os.path.join('assets','data','segdata', self.id + '.gif')
@@ -134,13 +334,40 @@ class Segment():
         self.width = surface.get_width()
         self.height = surface.get_height()
 
+        # Look up every pixel in the tile palette, which is sorted by color
         tiles = self._load_tiles_file()
+        palette = sorted(tiles.values(), key=lambda tile: Segment._pack_color(tile[2]))
+        palette_colors = NP.array([Segment._pack_color(tile[2]) for tile in palette],
+            dtype=NP.uint32)
 
-        for x in range(0, self.width):
-            self.tiles.append([])
-            for y in range(0, self.height):
-                color = surface.get_at((x,y))
-                self.tiles[x].append(tiles[tuple(color)])
+        colors = Segment._read_packed_colors(surface)
+        indices = Segment._find_colors(palette_colors, colors)
+        if not (indices >= 0).all():
+            (x, y) = NP.argwhere(indices < 0)[0]
+            raise KeyError(Segment._unpack_color(int(colors[x, y])))
+
+        self._setup_palette(palette, indices)
+
+    ##  Initializes the tile array, tangibility grid and entity list from the
+    #   compiled data of the segment.
+    #
+    #   @param data The compiled segment data, as given by `get_compiled_data`.
+    def _setup_compiled(self, data):
+        (self.width, self.height) = data["dims"]
+        palette = data["palette"]
+
+        indices = NP.frombuffer(data["tiles"],
+            dtype=Tilemap.get_index_type(len(palette)))
+        indices = indices.reshape((self.width, self.height))
+
+        self._setup_palette(palette, indices)
+        self.entities = list(data["entities"])
+
+    ##  @return The compiled data of the segment in the default asset bundle,
+    #           or None if it should be loaded from the source files.
+    def _load_compiled_data(self):
+        bundle = AssetBundle.get_default()
+        return bundle.get("segdata/" + self.id) if bundle != None else None
 
     ##  Initializes the entity list
     #
@@ -149,12 +376,15 @@ class Segment():
         entity_surface = PG.image.load(entities_filename)
 
         entities = self._load_entities_file()
+        entity_colors = sorted(entities.keys(), key=Segment._pack_color)
+        palette_colors = NP.array([Segment._pack_color(color)
+            for color in entity_colors], dtype=NP.uint32)
 
-        for x in range(0, self.width):
-            for y in range(0, self.height):
-                color = entity_surface.get_at((x,y))
-                if (tuple(color) in entities):
-                    self.entities.append(((x,y), entities[tuple(color)]))
+        indices = Segment._find_colors(palette_colors,
+            Segment._read_packed_colors(entity_surface))
+        for (x, y) in zip(*NP.nonzero(indices >= 0)):
+            entity_id = entities[entity_colors[indices[x, y]]]
+            self.entities.append(((int(x), int(y)), entity_id))
 
     ##  Loads the mapping from color to (tile_id, tangible)
     #
@@ -181,6 +411,47 @@ class Segment():
 
         return tiles
 
+    ##  Reads the colors of a surface into an array, packing each color into
+    #   a single integer of the form 0xRRGGBBAA.
+    #
+    #   @param surface The surface (of type `pygame.Surface`) to be read.
+    #
+    #   @return A 2d uint32 NumPy array of packed colors indexed by [x, y].
+    @staticmethod
+    def _read_packed_colors(surface):
+        rgb = PG.surfarray.array3d(surface).astype(NP.uint32)
+        alpha = PG.surfarray.array_alpha(surface).astype(NP.uint32)
+        return (rgb[:, :, 0] << 24) | (rgb[:, :, 1] << 16) | \
+            (rgb[:, :, 2] << 8) | alpha
+
+    ##  Finds the position of each packed color within a sorted palette.
+    #
+    #   @param palette_colors A sorted 1d NumPy array of packed colors.
+    #   @param colors A NumPy array of packed colors to be found.
+    #
+    #   @return A NumPy array with the shape of the colors containing the
+    #           palette index of each color, or -1 where it isn't in the palette.
+    @staticmethod
+    def _find_colors(palette_colors, colors):
+        if len(palette_colors) == 0:
+            return NP.full(colors.shape, -1, dtype=int)
+
+        indices = NP.searchsorted(palette_colors, colors)
+        indices = NP.minimum(indices, len(palette_colors) - 1)
+        return NP.where(palette_colors[indices] == colors, indices, -1)
+
+    ##  @return The given color tuple packed into an integer of the form
+    #           0xRRGGBBAA.
+    @staticmethod
+    def _pack_color(color):
+        return (color[0] << 24) | (color[1] << 16) | (color[2] << 8) | color[3]
+
+    ##  @return The color tuple of the form (r,g,b,a) of a packed color.
+    @staticmethod
+    def _unpack_color(color):
+        return (color >> 24, (color >> 16) & 0xff, (color >> 8) & 0xff,
+                color & 0xff)
+
     ## Loads the mapping from color to entity_id
     #
     #   @return A dict of the form { color_tuple -> entity_id }
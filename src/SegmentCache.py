@@ -0,0 +1,104 @@
+##  @file SegmentCache.py
+#   @date Fall 2026
+#
+#   Source File for the "SegmentCache" Type
+#
+#   The segment cache holds the fully loaded segments of the world, keeping
+#   only those that fit within a memory budget.  Whenever the budget is
+#   exceeded, the least recently used segments are evicted and will be loaded
+#   again from their data files the next time that they're requested.
+
+from collections import OrderedDict
+
+##  A least recently used cache of loaded `Segment` objects with a memory
+#   budget.  The most recently used segment is never evicted, so the segment
+#   in use is always kept even if it doesn't fit within the budget alone.
+class SegmentCache( object ):
+    ### Constructors ###
+
+    ##  Constructs an empty segment cache.
+    #
+    #   @param memory_budget The estimated number of bytes that the cached
+    #    segments are allowed to use (or None if the cache is unbounded).
+    def __init__( self, memory_budget=None ):
+        self._memory_budget = memory_budget
+        self._memory_usage = 0
+
+        # Ordered from the least to the most recently used, of the form:
+        # { segment_id => (Segment, memory_size) }
+        self._segments = OrderedDict()
+
+    ### Methods ###
+
+    ##  Returns the segment with the given identifier, loading it with the
+    #   given function if it isn't cached and marking it as most recently used.
+    #
+    #   @param segment_id The identifier of the segment to be returned.
+    #   @param load A function that takes the segment identifier and returns
+    #    the loaded `Segment` object.
+    #   @return The `Segment` object with the given identifier.
+    def get( self, segment_id, load ):
+        if segment_id in self._segments:
+            entry = self._segments.pop( segment_id )
+            self._segments[ segment_id ] = entry
+            return entry[ 0 ]
+
+        segment = load( segment_id )
+        self.add( segment_id, segment )
+        return segment
+
+    ##  Adds a loaded segment to the cache as the most recently used segment,
+    #   evicting other segments if the memory budget is exceeded.
+    #
+    #   @param segment_id The identifier of the segment to be added.
+    #   @param segment The loaded `Segment` object to be added.
+    def add( self, segment_id, segment ):
+        self.discard( segment_id )
+
+        memory_size = segment.get_memory_size()
+        self._segments[ segment_id ] = ( segment, memory_size )
+        self._memory_usage += memory_size
+        self._evict()
+
+    ##  Removes the segment with the given identifier from the cache if it's
+    #   cached.
+    #
+    #   @param segment_id The identifier of the segment to be removed.
+    def discard( self, segment_id ):
+        if segment_id in self._segments:
+            self._memory_usage -= self._segments.pop( segment_id )[ 1 ]
+
+    ##  @return True if the segment with the given identifier is loaded in the
+    #    cache and false otherwise.
+    def __contains__( self, segment_id ):
+        return segment_id in self._segments
+
+    ##  @return The number of segments loaded in the cache.
+    def __len__( self ):
+        return len( self._segments )
+
+    ##  @return A list of the identifiers of the loaded segments, ordered from
+    #    the least to the most recently used.
+    def get_segment_ids( self ):
+        return self._segments.keys()
+
+    ##  @return The estimated number of bytes used by the loaded segments.
+    def get_memory_usage( self ):
+        return self._memory_usage
+
+    ##  @return The estimated number of bytes that the loaded segments are
+    #    allowed to use (or None if the cache is unbounded).
+    def get_memory_budget( self ):
+        return self._memory_budget
+
+    ### Helper Methods ###
+
+    ##  Evicts the least recently used segments until the cache fits within its
+    #   memory budget or only the most recently used segment remains.
+    def _evict( self ):
+        if self._memory_budget == None:
+            return
+
+        while self._memory_usage > self._memory_budget and len( self._segments ) > 1:
+            ( segment, memory_size ) = self._segments.popitem( last=False )[ 1 ]
+            self._memory_usage -= memory_size
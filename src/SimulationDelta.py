@@ -12,13 +12,9 @@
 #       > Integration may increase cohesion of the types (this type is never
 #         needed without the "State" type), but will make the files a bit harder
 #         to read (with multiple classes in a single file).
-#   - Fix the shallow copy issue within the "add" function if necessary (should
-#     be fine since the "Event" elements are immutable).
 #   - Make the equality operator agnostic of event ordering if event ordering
 #     doesn't end up mattering.
 
-import copy
-
 from PhysicalState import *
 from Event import *
 
@@ -34,12 +30,13 @@ class SimulationDelta( object ):
     #    physical state to be applied to the "Entity" instance associated with
     #    the state for the simulation delta.
     #   @param events A listing of all the events (as "Event" instances) produced 
-    #    during the simulation step.
+    #    during the simulation step, which are immutable and shared rather than
+    #    copied.
     def __init__( self, edelta=PhysicalState(), events=[] ):
         self._entity_delta = PhysicalState()
         self._entity_delta.add_delta( edelta )
 
-        self._events = copy.deepcopy( events )
+        self._events = list( events )
 
     ### Overloaded Operators ###
 
@@ -15,24 +15,43 @@
 #   check if any of those objects collide with entity A. We do this for all
 #   entities in the hash table to compute all collisions in the world.
 #
-#   Assumption: Width is a multiple of cell_size.
-
+#   Entities lying partly or entirely outside of the given dimensions are
+#   hashed to the nearest cells along the border of the grid, and the cell size
+#   can be tuned to the sizes of the tracked entities at any time.
+
+import bisect
+import heapq
+import math
+import pygame as PG
 from CollisionDetector import *
+from RectArray import *
 
 class SpatialDictionary( CollisionDetector ):
 
+    ### Class constants ###
+
+    ## Histogram bins of the sizes of the tracked objects, given as the
+    #  cell sizes they're counted under in increasing order.
+    SIZE_BINS = [8, 16, 32, 64, 128, 256, 512]
+
+    ## Fraction of the tracked objects that should fit in a single cell when
+    #  the cell size is tuned.
+    TUNING_COVERAGE = 0.9
+
     ### Construtors ###
 
     ## Constructs a spatial hashing dictionary with a given cell size and
     #  width/height for detecting collisions amongst a set of bonding volumes.
     #
     #  @param cell_size An integer specifying the square dimensions of a cell
-    #   in the game world. The cell size should be a factor of the width.
+    #   in the game world.
     #  @param width An integer specifying the total width of the area for which
     #   we're detecting collisions.
     #  @param height An integer specifying the total height of the area for
     #   which we're detecting collisions.
-    def __init__(self, cell_size=1, width=1, height=1):
+    #  @param vectorized A boolean signifying whether all the collisions should
+    #   be found in bulk with a `RectArray` instead of cell by cell.
+    def __init__(self, cell_size=1, width=1, height=1, vectorized=False):
         # Initialize the super class
         CollisionDetector.__init__(self)
 
@@ -41,22 +60,52 @@ class SpatialDictionary( CollisionDetector ):
         self.width = width
         self.height = height
 
-        # Number of columns in the virtual grid
-        self.columns = width/cell_size
+        # Number of columns and rows in the virtual grid
+        self.columns = self._get_cell_count(width)
+        self.rows = self._get_cell_count(height)
 
         # Hashtable mapping a cell to a set of game world entities that exist
         # in said cell
         self.table = {}
 
+        # Mapping from each tracked object to the range of cells it covered
+        # the last time it was hashed, of the form:
+        # { obj => (min_col, min_row, max_col, max_row) }
+        self.cell_ranges = {}
+
         # Set of the objects (i.e. bounding volumes) being tracked
         self.dynamic_objects = set([])
         self.static_objects = set([])
 
+        # Set of the tracked objects extending beyond the grid, which are
+        # hashed to the border cells closest to them
+        self.outside_objects = set([])
+
+        # Batch of every tracked rectangle used in vectorized mode, which is
+        # rebuilt whenever an object is added or removed
+        self.vectorized = vectorized
+        self.rect_array = None
+
+        # Whether the dynamic objects may have moved since they were last
+        # rehashed, which is only deferred in vectorized mode
+        self.grid_stale = False
+
+    ## Constructs a spatial hashing dictionary covering an area of the given
+    #  dimensions, which is divided into sixteen columns of cells. All the
+    #  collisions in the area are found in bulk in vectorized mode.
+    #
+    #  @param width An integer specifying the total width of the area.
+    #  @param height An integer specifying the total height of the area.
+    @classmethod
+    def for_area(cls, width, height):
+        return cls(width / 16, width, height, vectorized=True)
+
     ### Public methods ###
 
     ## Returns a string representation of the spatial hashing dictionary. This
     #  is intended to be machine-readable.
     def __repr__(self):
+        self._refresh_grid()
         rep = "{"
         for cell in self.table:
             objects = ", ".join(str(obj) for obj in self.table[cell])
@@ -68,6 +117,7 @@ class SpatialDictionary( CollisionDetector ):
     ## Returns a string representation of the spatial hashing dictionary. THis
     #  is intended to be human-readable
     def __str__(self):
+        self._refresh_grid()
         rep = "{"
         for cell in self.table:
             objects = ", ".join(str(obj) for obj in self.table[cell])
@@ -93,11 +143,21 @@ class SpatialDictionary( CollisionDetector ):
     #  Note: The bounding volume MUST be hashable.
     #
     #  @param obj A single bounding volume.
-    #  @param static A boolean signifying whether the object is stationary
+    #  @param static A boolean signifying whether the object is stationary.
+    #   Static objects are hashed once and never rehashed by update.
     def add(self, obj, static=False):
-        cells = self._get_covered_cells(obj)
-        for cell in cells:
-            self._add(cell, obj)
+        if self.exists(obj):
+            self.remove(obj)
+        if self._make_dormant(obj, static):
+            return
+
+        cell_range = self._get_cell_range(obj)
+        for cell in self._get_cells_in_range(cell_range):
+            self._add(cell, obj, static)
+
+        self.cell_ranges[obj] = cell_range
+        self._update_outside(obj)
+        self.rect_array = None
 
     ## Removes a list of bounding volumes from the dictionary. The bounding
     #  volumes represent the hitboxes of the game world entities.
@@ -112,30 +172,116 @@ class SpatialDictionary( CollisionDetector ):
     #
     #  @param objs The single bounding volumes to be removed.
     def remove(self, obj):
-        cells = self._get_covered_cells(obj)
-        for cell in cells:
+        self.dormant_objects.pop(obj, None)
+        if obj not in self.cell_ranges:
+            return
+
+        cell_range = self.cell_ranges.pop(obj)
+        for cell in self._get_cells_in_range(cell_range):
             self._remove(cell, obj)
 
-    ## Updates all the bounding volumes in the dictionary. If bounding volumes
-    #  have moved to new cells since the last time update was called, then it
-    #  must be called again before calling get_all_collisions.
-    def update(self):
-        objects = self.dynamic_objects.copy()
+        self.outside_objects.discard(obj)
+
+        self.rect_array = None
+
+    ## Updates the bounding volumes in the dictionary. Only the volumes whose
+    #  covered cell range has changed since they were last hashed are moved
+    #  between cells, so idle volumes cost a single range comparison. If
+    #  bounding volumes have moved to new cells since the last time update was
+    #  called, then it must be called again before calling get_all_collisions.
+    #
+    #  In vectorized mode the collisions are found without the grid, so the
+    #  volumes are only rehashed when the grid is next queried.
+    #
+    #  @param objs An optional list of the bounding volumes known to have
+    #   moved. If omitted, every dynamic bounding volume is checked.
+    def update(self, objs=None):
+        moved_objects = self.dynamic_objects if objs is None else objs
+        self._update_dormancy()
+
+        if self.vectorized:
+            self.grid_stale = True
+        else:
+            self._rehash_moved(moved_objects)
+
+    ## Chooses the cell size from a histogram of the sizes of the tracked
+    #  objects, which is the smallest histogram bin that holds a sufficient
+    #  fraction of them, and rehashes all the objects if the size changes.
+    #  Dynamic objects are favored since static ones are never rehashed.
+    def tune(self):
+        objs = self.dynamic_objects or self.static_objects
+        if not objs:
+            return
+
+        histogram = [0] * len(SpatialDictionary.SIZE_BINS)
+        for obj in objs:
+            size_bin = bisect.bisect_left(SpatialDictionary.SIZE_BINS,
+                                          max(obj.width, obj.height))
+            histogram[min(size_bin, len(histogram) - 1)] += 1
+
+        needed = SpatialDictionary.TUNING_COVERAGE * len(objs)
+        covered = 0
+        for (size_bin, count) in enumerate(histogram):
+            covered += count
+            if covered >= needed:
+                break
+
+        cell_size = min(SpatialDictionary.SIZE_BINS[size_bin],
+                        max(self.width, self.height))
+        if cell_size != self.cell_size:
+            self.resize(cell_size)
+
+    ## Changes the cell size of the grid and rehashes all the objects.
+    #
+    #  @param cell_size An integer specifying the new square dimensions of a
+    #   cell in the game world.
+    def resize(self, cell_size):
+        objs = [(obj, obj in self.static_objects) for obj in self.cell_ranges]
+
+        self.table.clear()
+        self.cell_ranges.clear()
+        self.outside_objects.clear()
+        self.static_objects = set([])
+        self.dynamic_objects = set([])
 
-        self.remove_multiple(objects)
-        self.add_multiple(objects)
+        self.cell_size = cell_size
+        self.columns = self._get_cell_count(self.width)
+        self.rows = self._get_cell_count(self.height)
+
+        for (obj, static) in objs:
+            self.add(obj, static)
 
     ## Determines all the collisions that are occuring given the current state
-    #  of the spatial hashing dictionary.
+    #  of the spatial hashing dictionary. Only pairs with at least one dynamic
+    #  object are tested since static objects never collide with each other.
     #
     #  @return A list of (Bounding Volume, Bounding Volume) frozensets of
     #          colliding game world entities.
     def get_all_collisions(self):
-        static_collisions = self._get_collisions(self.static_objects)
-        dynamic_collisions = self._get_collisions(self.dynamic_objects)
+        if not self.vectorized:
+            return list(self._get_collisions(self.dynamic_objects))
+
+        objs = self._get_rect_array().get_rects()
+        return [frozenset([objs[i], objs[j]])
+                for (i, j) in self.get_collision_indices().tolist()]
+
+    ## Determines all the collisions that are occuring in bulk, regardless of
+    #  whether the dictionary is in vectorized mode.
+    #
+    #  @return An (N, 2) array of the indices of the colliding bounding volumes
+    #          within the list returned by get_indexed_objects.
+    def get_collision_indices(self):
+        rect_array = self._get_rect_array()
+        rect_array.refresh()
 
-        static_collisions.update(dynamic_collisions)
-        return list(static_collisions)
+        pairs = rect_array.get_overlapping_pairs()
+        self.pairs_tested += rect_array.pairs_tested
+        return pairs
+
+    ## @return A list of all the bounding volumes being tracked, ordered as
+    #   they are indexed by get_collision_indices.
+    def get_indexed_objects(self):
+        return self._get_rect_array().get_rects()
 
     ## Finds all the collisions between the given set of objects and all other
     #  objects in the dictionary.
@@ -148,12 +294,105 @@ class SpatialDictionary( CollisionDetector ):
 
         for obj in objs:
             nearby_objects = self._get_nearby_objects(obj)
+            self.pairs_tested += len(nearby_objects)
+
             for nearby_object in nearby_objects:
-                if obj.colliderect(nearby_object):
+                if self._can_collide(obj, nearby_object) and \
+                        obj.colliderect(nearby_object):
                     collisions.add(frozenset([obj, nearby_object]))
 
         return collisions
 
+    ## Finds the bounding volumes colliding with a rectangle, considering only
+    #  the volumes in the cells the rectangle covers.
+    #
+    #  @param rect The rectangle (of type `pygame.Rect`) to be queried.
+    #  @return A list of the bounding volumes colliding with the rectangle.
+    def query_rect(self, rect):
+        self._refresh_grid()
+        cell_range = self._get_cell_range(rect)
+        (min_col, min_row, max_col, max_row) = cell_range
+
+        # Scanning every volume is cheaper than visiting more cells than
+        # there are occupied cells.
+        if (max_col - min_col + 1) * (max_row - min_row + 1) > len(self.table):
+            candidates = self.cell_ranges
+        else:
+            candidates = set([])
+            for cell in self._get_cells_in_range(cell_range):
+                candidates.update(self._objs_in(cell))
+
+        return [obj for obj in candidates if obj.colliderect(rect)]
+
+    ## Finds the bounding volumes containing a point, considering only the
+    #  volumes in the cell containing the point.
+    #
+    #  @param x The x coordinate of the point.
+    #  @param y The y coordinate of the point.
+    #  @return A list of the bounding volumes containing the point.
+    def query_point(self, x, y):
+        self._refresh_grid()
+        cell = self._get_cell_at(x, y)
+        return [obj for obj in self._objs_in(cell) if obj.collidepoint(x, y)]
+
+    ## Casts a ray through the grid, considering only the volumes in the cells
+    #  the ray crosses before it reaches its maximum distance and the volumes
+    #  extending beyond the grid.
+    #
+    #  @param origin The (x, y) point from which the ray is cast.
+    #  @param direction The (x, y) vector along which the ray is cast.
+    #  @param max_dist The maximum distance the ray travels.
+    #  @return A list of (distance, Bounding Volume) tuples for the volumes
+    #   hit by the ray, ordered from nearest to farthest.
+    def raycast(self, origin, direction, max_dist):
+        direction = self._get_unit_vector(direction)
+        if direction is None:
+            return []
+
+        self._refresh_grid()
+        candidates = set(self.outside_objects)
+        for cell in self._get_cells_on_ray(origin, direction, max_dist):
+            candidates.update(self._objs_in(cell))
+
+        return self._get_ray_hits(candidates, origin, direction, max_dist)
+
+    ## Finds the bounding volumes nearest to a point by searching rings of
+    #  cells of increasing size around the cell containing the point.
+    #
+    #  @param x The x coordinate of the point.
+    #  @param y The y coordinate of the point.
+    #  @param k The maximum number of bounding volumes to be found.
+    #  @return A list of up to k bounding volumes, ordered from nearest to
+    #   farthest from the point.
+    def nearest(self, x, y, k=1):
+        center_col = int(math.floor(float(x) / self.cell_size))
+        center_row = int(math.floor(float(y) / self.cell_size))
+        if not (0 <= center_col < self.columns and 0 <= center_row < self.rows):
+            return CollisionDetector.nearest(self, x, y, k)
+
+        self._refresh_grid()
+        max_radius = max(center_col, self.columns - center_col,
+                         center_row, self.rows - center_row)
+
+        # Volumes beyond the grid may be closer than the cells they hash to.
+        seen = set(self.outside_objects)
+        distances = [(self._get_point_distance(obj, x, y), obj)
+                     for obj in self.outside_objects]
+        for radius in range(max_radius + 1):
+            for cell in self._get_cells_in_ring(center_col, center_row, radius):
+                for obj in self._objs_in(cell):
+                    if obj not in seen:
+                        seen.add(obj)
+                        distances.append((self._get_point_distance(obj, x, y),
+                                          obj))
+
+            # Volumes outside the searched cells are at least this far away.
+            closest = heapq.nsmallest(k, distances, key=lambda hit: hit[0])
+            if len(closest) == k and closest[-1][0] <= radius * self.cell_size:
+                break
+
+        return [obj for (distance, obj) in closest]
+
     ## @return A list of all the bounding volumes currently being tracked.
     def get_all_objects(self):
         return list(self.static_objects) + list(self.dynamic_objects)
@@ -161,12 +400,7 @@ class SpatialDictionary( CollisionDetector ):
     ## @return True if we're tracking the provided bounding volume and false
     #   otherwise.
     def exists(self, obj):
-        cells = self._get_covered_cells(obj)
-        for cell in cells:
-            if (cell not in self.table or obj not in self.table[cell]):
-                return False
-
-        return True
+        return obj in self.cell_ranges or obj in self.dormant_objects
 
     ## @return The number of objects in the dictionary.
     def size(self):
@@ -177,6 +411,10 @@ class SpatialDictionary( CollisionDetector ):
         self.static_objects = set([])
         self.dynamic_objects = set([])
         self.table.clear()
+        self.cell_ranges.clear()
+        self.outside_objects.clear()
+        self.dormant_objects.clear()
+        self.rect_array = None
 
     ### Private helper methods ###
 
@@ -208,15 +446,59 @@ class SpatialDictionary( CollisionDetector ):
 
         if cell in self.table:
             self.table[cell].discard(obj)
+            if not self.table[cell]:
+                del self.table[cell]
 
-    ## Maps a given (x, y) position in the game world, to a cell's index in the
-    #  spatial dictionary.
+    ## Rehashes the given bounding volumes whose covered cell range has
+    #  changed since they were last hashed.
+    #
+    #  @param moved_objects The bounding volumes that may have moved.
+    def _rehash_moved(self, moved_objects):
+        for obj in moved_objects:
+            if obj not in self.dynamic_objects:
+                continue
+
+            old_range = self.cell_ranges[obj]
+            new_range = self._get_cell_range(obj)
+            if new_range != old_range:
+                self._rehash(obj, old_range, new_range)
+            self._update_outside(obj)
+
+    ## Moves a bounding volume from the cells in its old cell range to the
+    #  cells in its new cell range, leaving the cells common to both alone.
     #
-    #  @param x The x-coordinate
-    #  @param y The y-coordinate
-    def _hash(self, x, y):
-        return (int(x/self.cell_size) +
-                int(y/self.cell_size) * self.columns)
+    #  @param obj The bounding volume that we're rehashing.
+    #  @param old_range The cell range the bounding volume was hashed under.
+    #  @param new_range The cell range the bounding volume now covers.
+    def _rehash(self, obj, old_range, new_range):
+        old_cells = set(self._get_cells_in_range(old_range))
+        new_cells = set(self._get_cells_in_range(new_range))
+
+        for cell in old_cells - new_cells:
+            self.table[cell].discard(obj)
+            if not self.table[cell]:
+                del self.table[cell]
+        for cell in new_cells - old_cells:
+            self.table.setdefault(cell, set()).add(obj)
+
+        self.cell_ranges[obj] = new_range
+
+    ## Rehashes the dynamic bounding volumes if their rehashing was deferred
+    #  by update.
+    def _refresh_grid(self):
+        if self.grid_stale:
+            self.grid_stale = False
+            self._rehash_moved(self.dynamic_objects)
+
+    ## @return The `RectArray` of every tracked bounding volume, with the
+    #   static ones first, which is built on demand.
+    def _get_rect_array(self):
+        if self.rect_array is None:
+            self.rect_array = RectArray(self.get_all_objects(),
+                                        len(self.static_objects),
+                                        self.collision_filter)
+
+        return self.rect_array
 
     ## @return A list of bounding volumes that are in the same cell(s) as
     #   the given one.
@@ -224,7 +506,7 @@ class SpatialDictionary( CollisionDetector ):
         nearby_objects = set([])
         cells = self._get_covered_cells(obj)
         for cell in cells:
-            nearby_objects = nearby_objects | self._objs_in(cell)
+            nearby_objects.update(self._objs_in(cell))
 
         # Exclude the object from this list.
         nearby_objects.discard(obj)
@@ -232,33 +514,124 @@ class SpatialDictionary( CollisionDetector ):
 
     ## @return A list of cells that a given bounding volume overlaps.
     def _get_covered_cells(self, obj):
-        x = obj.x
-        y = obj.y
-        w = obj.width
-        h = obj.height
+        return self._get_cells_in_range(self._get_cell_range(obj))
 
-        tl_cell = self._hash(x, y)
-        tr_cell = self._hash(x + w, y)
-        bl_cell = self._hash(x, y + h)
-
-        covered_cells = set()
-        row_count = self._get_num_covered_rows(tl_cell, bl_cell)
-        for i in range(0, row_count):
-            col_start = tl_cell + (i * self.columns)
-            col_stop = tr_cell + (i * self.columns) + 1
-            covered_cells |= set(range(col_start, col_stop))
-
-        return list(covered_cells)
-
-    ## Computes the number of rows in the grid that a bounding volume overlaps.
+    ## Computes the range of grid cells that a bounding volume overlaps,
+    #  clamped to the cells of the grid.
+    #
+    #  @param obj The bounding volume whose cell range is computed.
+    #  @return A tuple of the form (min_col, min_row, max_col, max_row).
+    def _get_cell_range(self, obj):
+        return (self._clamp(obj.x/self.cell_size, self.columns),
+                self._clamp(obj.y/self.cell_size, self.rows),
+                self._clamp((obj.x + obj.width)/self.cell_size, self.columns),
+                self._clamp((obj.y + obj.height)/self.cell_size, self.rows))
+
+    ## @return The given cell coordinate clamped to the range [0, count).
+    def _clamp(self, index, count):
+        return max(0, min(int(index), count - 1))
+
+    ## @return The number of cells needed to cover the given length.
+    def _get_cell_count(self, length):
+        return max(1, int(math.ceil(float(length) / self.cell_size)))
+
+    ## Records whether the given bounding volume extends beyond the grid.
+    def _update_outside(self, obj):
+        if obj.x < 0 or obj.y < 0 or obj.x + obj.width > self.width or \
+                obj.y + obj.height > self.height:
+            self.outside_objects.add(obj)
+        else:
+            self.outside_objects.discard(obj)
+
+    ## @return A list of the cell indices contained in the given cell range.
+    def _get_cells_in_range(self, cell_range):
+        (min_col, min_row, max_col, max_row) = cell_range
+
+        return [col + row * self.columns
+                for row in range(min_row, max_row + 1)
+                for col in range(min_col, max_col + 1)]
+
+    ## @return The index of the grid cell closest to the given point.
+    def _get_cell_at(self, x, y):
+        return self._clamp(math.floor(float(x) / self.cell_size),
+                           self.columns) + \
+            self._clamp(math.floor(float(y) / self.cell_size),
+                        self.rows) * self.columns
+
+    ## @return A list of the indices of the grid cells at the given Chebyshev
+    #   distance from the cell in the given column and row.
+    def _get_cells_in_ring(self, col, row, radius):
+        if radius == 0:
+            positions = [(col, row)]
+        else:
+            positions = []
+            for offset in range(-radius, radius + 1):
+                positions.append((col + offset, row - radius))
+                positions.append((col + offset, row + radius))
+            for offset in range(-radius + 1, radius):
+                positions.append((col - radius, row + offset))
+                positions.append((col + radius, row + offset))
+
+        return [ring_col + ring_row * self.columns
+                for (ring_col, ring_row) in positions
+                if 0 <= ring_col < self.columns and 0 <= ring_row < self.rows]
+
+    ## Walks the grid cells crossed by a ray in order with a digital
+    #  differential analyzer, from where the ray enters the grid until it
+    #  leaves the grid or reaches its maximum distance.
+    #
+    #  @param origin The (x, y) point from which the ray is cast.
+    #  @param direction The unit (x, y) vector along which the ray is cast.
+    #  @param max_dist The maximum distance the ray travels.
+    #  @return A list of the cell indices crossed by the ray.
+    def _get_cells_on_ray(self, origin, direction, max_dist):
+        grid = PG.Rect(0, 0, self.columns * self.cell_size,
+                       self.rows * self.cell_size)
+        t_start = self._get_ray_distance(grid, origin, direction, max_dist)
+        if t_start is None:
+            return []
+
+        col = self._clamp(math.floor((origin[0] + direction[0] * t_start) /
+                                     self.cell_size), self.columns)
+        row = self._clamp(math.floor((origin[1] + direction[1] * t_start) /
+                                     self.cell_size), self.rows)
+
+        (step_col, t_max_x, t_delta_x) = self._get_ray_steps(
+            col, origin[0], direction[0])
+        (step_row, t_max_y, t_delta_y) = self._get_ray_steps(
+            row, origin[1], direction[1])
+
+        cells = [col + row * self.columns]
+        while min(t_max_x, t_max_y) <= max_dist:
+            if t_max_x < t_max_y:
+                col += step_col
+                t_max_x += t_delta_x
+            else:
+                row += step_row
+                t_max_y += t_delta_y
+
+            if not (0 <= col < self.columns and 0 <= row < self.rows):
+                break
+            cells.append(col + row * self.columns)
+
+        return cells
+
+    ## Computes how a ray steps between the cells along a single axis.
     #
-    #  @param start The cell that contains the top left corner of the bounding
-    #   volume.
-    #  @param stop The cell that contains the bottom left corner of the
-    #   bounding volume.
-    #  @return The number of rows a bounding volume overlaps.
-    def _get_num_covered_rows(self, start, stop):
-        return (stop - start)/self.columns + 1
+    #  @param index The index of the cell containing the ray origin on the axis.
+    #  @param start The coordinate of the ray origin on the axis.
+    #  @param step The component of the unit ray direction on the axis.
+    #  @return A tuple of the form (step, t_max, t_delta) holding the cell
+    #   index increment, the distance to the first cell boundary and the
+    #   distance between successive cell boundaries along the ray.
+    def _get_ray_steps(self, index, start, step):
+        if step == 0:
+            return (0, float("inf"), float("inf"))
+
+        boundary = (index + (1 if step > 0 else 0)) * self.cell_size
+        return (1 if step > 0 else -1,
+                (boundary - start) / step,
+                self.cell_size / abs(step))
 
     ## @return A set containing all the bounding volumes in a given cell. The
     #  cell is assumed to exist in the table.
@@ -7,10 +7,10 @@
 #   @TODO
 #   High Priority:
 #   - Finalize the step simulation logic when time outs occur.
-#       > Choice 1 (current): Quantize time on a per-frame basis.  This option entails
+#       > Choice 1: Quantize time on a per-frame basis.  This option entails
 #         that if a state times out, then it will return an empty delta and
 #         all time delta will be delegated to the next state.
-#       > Choice 2: Delegate time based on the amount of time given to each
+#       > Choice 2 (current): Delegate time based on the amount of time given to each
 #         state.  This option entails that intermediate timeouts may be invisible,
 #         but that they will always occur and eat up time proportional to their
 #         timeout time.
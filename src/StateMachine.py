@@ -15,14 +15,10 @@
 #     list passed in on initialization by making deep copies.
 #   - Add error handling in the constructor to ensure that the initial state
 #     machine information is correct.
-#   - Determine whether to use the in-house graph implementation or the
-#     'networkx' implementation.
-#       > Implementation used is fairly arbitrary since it's completely masked
-#         by the interface of the type.
 
-import networkx as NX
 from State import *
 from Transition import *
+from TransitionTable import *
 from Event import *
 from SimulationDelta import *
 
@@ -30,7 +26,12 @@ from SimulationDelta import *
 #   facilitate state representation and transition specification for game
 #   world objects.  A state machine resembles a graph in which nodes are
 #   object states and edges are directed and activated by events occuring
-#   within the game world.
+#   within the game world.  The graph is stepped through its compiled
+#   "TransitionTable", which can be shared by machines of the same kind.
+#
+#   State timeouts are polled on every step unless the machine is attached to
+#   a "TimerScheduler", in which case they're only checked when the machine's
+#   timer has expired or a state has been entered since the last step.
 class StateMachine():
     ### Constructors ###
 
@@ -44,12 +45,18 @@ class StateMachine():
     #    make up the directed edges in the state machine instance.
     #   @param start_id The name identifier of the starting state for the
     #    state machine instance (defaults to the first item in the state list).
-    def __init__( self, state_list, transition_list, start_id=None ):
-        self._machine = NX.MultiDiGraph()
-        self._curr_state_id = start_id if start_id else state_list[0].get_name()
+    #   @param table The "TransitionTable" compiled from the names of the given
+    #    states and the given transitions (compiled on construction if not given).
+    def __init__( self, state_list, transition_list, start_id=None, table=None ):
+        self._states = list( state_list )
+        self._table = table if table != None else TransitionTable(
+            [state.get_name() for state in state_list], transition_list )
+
+        start_id = start_id if start_id else state_list[0].get_name()
+        self._curr_state_index = self._table.get_state_index( start_id )
 
-        [ self._add_state( state ) for state in state_list ]
-        [ self._add_transition( transition ) for transition in transition_list ]
+        self._timers = None
+        self._timeout_pending = True
 
         assert self._is_machine_valid(), "Instantiation of an invalid FSM!"
 
@@ -57,6 +64,9 @@ class StateMachine():
 
     ##  Simulates a step of the state machine given the time delta between
     #   steps, returning a "SimulationDelta" object describing the changes.
+    #   If the current state times out during the step, the time by which it
+    #   was exceeded is passed on to the next state, so a long step passes
+    #   through every state that would time out within it.
     #
     #   @param time_delta The amount of elapsed time in between machine steps.
     #   @return A "SimulationDelta" instance that describes step changes.
@@ -64,9 +74,14 @@ class StateMachine():
         step_delta = SimulationDelta()
 
         step_delta += self.get_current_state().simulate_step( time_delta )
-        while self.get_current_state().has_timed_out():
-            step_delta += self.simulate_transition( Event(EventType.TIMEOUT) )
-            step_delta += self.get_current_state().simulate_step( time_delta )
+        if self._timers == None or self._timeout_pending:
+            while self.get_current_state().has_timed_out():
+                excess_time = self.get_current_state().get_excess_time()
+                step_delta += self.simulate_transition( Event(EventType.TIMEOUT) )
+                step_delta += self.get_current_state().simulate_step( excess_time )
+
+            if self._timers != None:
+                self._schedule_timeout( time_delta )
 
         return step_delta
 
@@ -76,86 +91,85 @@ class StateMachine():
     #   @param event The event on which the transition will be simulated.
     #   @return A "SimulationDelta" instance that describes all transition changes.
     def simulate_transition( self, event ):
-        for transition in self._get_outgoing_transitions( self._curr_state_id ):
+        outgoing = self._table.get_outgoing( self._curr_state_index, event.get_type() )
+        for ( transition, dst_index ) in outgoing:
             if transition.invoked_by( event ):
-                src_state = self._get_state( transition.get_source() )
-                dst_state = self._get_state( transition.get_destination() )
+                src_state = self._states[ self._curr_state_index ]
+                dst_state = self._states[ dst_index ]
 
-                self._curr_state_id = dst_state.get_name()
+                self._curr_state_index = dst_index
+                self._timeout_pending = True
                 return src_state.simulate_departure() + dst_state.simulate_arrival(event)
 
         return SimulationDelta()
 
+    ##  Attaches the machine to the given timer scheduler, which will notify
+    #   the machine when its current state may have timed out, or detaches the
+    #   machine from its current scheduler if None is given.
+    #
+    #   @param timers The "TimerScheduler" to which the machine is attached (or
+    #    None if the machine should poll for timeouts on every step).
+    def set_timer_scheduler( self, timers ):
+        if self._timers != None:
+            self._timers.cancel( self )
+
+        self._timers = timers
+        self._timeout_pending = True
+
+    ##  Notifies the machine that its timer has expired, so that the timeout of
+    #   the current state will be checked on the next step.
+    def expire_timer( self ):
+        self._timeout_pending = True
+
+    ##  @return The amount of time until the current state times out (which
+    #    will be infinite if the state has no time out time).
+    def get_time_until_timeout( self ):
+        state = self.get_current_state()
+        return state.get_timeout_time() - state.get_active_time()
+
     ##  @return The string identifier for the current state of the instance
     #    state machine.
     def get_current_state( self ):
-        return self._get_state( self._curr_state_id )
+        return self._states[ self._curr_state_index ]
 
     ##  @return A list containing all the "State" objects contained in the 
     #    instance state machine.
     def get_states( self ):
-        node_list = self._machine.nodes( data=True )
-        return [ nd[ "obj" ] for ( node_id, nd ) in node_list ]
+        return list( self._states )
 
     ##  @return A list containing all the "Transition" objects contained in the 
     #    instance state machine.
     def get_transitions( self ):
-        edge_list = self._machine.edges( data=True )
-        return [ ed[ "obj" ] for ( src_id, dst_id, ed ) in edge_list ]
+        return list( self._table.get_transitions() )
 
-    ### Helper Methods ###
+    ##  @return The "TransitionTable" used to step the instance state machine.
+    def get_table( self ):
+        return self._table
 
-    ##  Adds the given state to the graph structure underlying the state machine.
-    #
-    #   @param state A "State" object that will be added to the underlying graph.
-    def _add_state( self, state ):
-        self._machine.add_node( state.get_name(), obj=state )
+    ##  @return A `networkx.MultiDiGraph` of the instance state machine, whose
+    #    nodes and edges hold their "State" and "Transition" objects as "obj"
+    #    attributes.
+    def get_graph( self ):
+        return self._table.get_graph( self._states )
 
-    ##  Adds the given transition to the graph structure underlying the state
-    #   machine.
-    #
-    #   @param transition A "Transition" object that will be added to the
-    #    underlying graph.
-    def _add_transition( self, transition ):
-        self._machine.add_edge( transition.get_source(), transition.get_destination(),
-            obj=transition )
-
-    ##  Given the string identifier for a state, this function returns the "State"
-    #   object associated with that identifier.
-    #
-    #   @param state_id The string identifier of the state to be retrieved.
-    #   @return The "State" object associated with the given identifier (or "None"
-    #    if no such "State" exists in the machine).
-    def _get_state( self, state_id ):
-        return self._machine.node[ state_id ][ "obj" ] \
-            if self._has_state( state_id ) else None
-
-    ##  Given the string identifier for a state, this function returns the
-    #   "Transition" objects originating from that state as a list.
-    #
-    #   @param state_id The string identifier of the state in question.
-    #   @return A list containing all "Transition" objects originating from
-    #    the "State" represented by the given identifier.
-    def _get_outgoing_transitions( self, state_id ):
-        outgoing_edges = self._machine.out_edges( state_id, data=True ) \
-            if self._has_state( state_id ) else []
-
-        return [ ed[ "obj" ] for ( src_id, dst_id, ed ) in outgoing_edges ]
+    ### Helper Methods ###
 
-    ##  Returns true if the "State" corresponding with the given identifier
-    #   exists within the underlying graph structure and false otherwise.
+    ##  Schedules the machine's timer for the timeout of the current state at
+    #   the end of a step of the given length.  The timer is scheduled relative
+    #   to the end of the step since the scheduler's clock is only advanced
+    #   once all the machines have been stepped.
     #
-    #   @param state_id The string identifier to be checked.
-    #   @return True if there's a "State" object corresponding to the given
-    #    identifier and false otherwise.
-    def _has_state( self, state_id ):
-        return self._machine.has_node( state_id )
+    #   @param time_delta The length of the step that was simulated.
+    def _schedule_timeout( self, time_delta ):
+        self._timeout_pending = False
+        self._timers.schedule( self, time_delta + self.get_time_until_timeout() )
 
     ##  Determines whether or not the underlying machine for the state machine
     #   is valid or not, returning a Boolean based on this result.
     #
-    #   @return True if the underlying machine is valid (i.e. valid states, 
-    #    valid transitions, weakly connected) and false otherwise.
+    #   @return True if the underlying machine is valid (i.e. the states match
+    #    the transition table and the start state exists) and false otherwise.
     def _is_machine_valid( self ):
-        return True
-
+        state_names = tuple( state.get_name() for state in self._states )
+        return state_names == self._table.get_state_names() and \
+            self._curr_state_index != None
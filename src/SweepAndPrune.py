@@ -0,0 +1,269 @@
+##  @file SweepAndPrune.py
+#   @date Fall 2026
+#
+#   A sort-and-sweep collision detection strategy.
+#
+#   Every bounding volume contributes two endpoints (its left and right edges)
+#   to a single list that is kept sorted along the x axis. Sweeping the list
+#   from left to right while tracking the volumes whose intervals are open
+#   yields every pair whose x intervals overlap, which are then tested in
+#   full. Objects move little from one frame to the next, so the endpoint
+#   list stays nearly sorted between updates and an insertion sort restores
+#   it in close to linear time. Removed objects leave dead endpoints in the
+#   list, which are skipped by sweeps and compacted away on the next update.
+
+import bisect
+import pygame as PG
+from CollisionDetector import *
+
+class SweepAndPrune( CollisionDetector ):
+
+    ### Class constants ###
+
+    ## Endpoint kind for the left edge of a bounding volume. Left edges sort
+    #  before right edges at the same position so that touching volumes are
+    #  still considered as candidates.
+    MIN_ENDPOINT = 0
+
+    ## Endpoint kind for the right edge of a bounding volume.
+    MAX_ENDPOINT = 1
+
+    ### Construtors ###
+
+    ## Constructs an empty sweep and prune detector.
+    def __init__(self):
+        # Initialize the super class
+        CollisionDetector.__init__(self)
+
+        # List of [position, kind, object] endpoints sorted by (position, kind),
+        # where the object of a dead endpoint is None
+        self.endpoints = []
+        self.num_dead_endpoints = 0
+
+        # Mapping from each tracked object to its (min, max) endpoints
+        self.object_endpoints = {}
+
+        # Set of the objects (i.e. bounding volumes) being tracked
+        self.dynamic_objects = set([])
+        self.static_objects = set([])
+
+        # Upper bound on the width of any tracked object, which limits how far
+        # left of a queried region an overlapping object can begin
+        self.max_width = 0
+
+    ### Public methods ###
+
+    ## Adds a list of bounding volumes to the detector.
+    #
+    #  Note: The bounding volumes MUST be hashable.
+    #
+    #  @param objs A list of _hashable_ bounding volumes
+    #  @param static A boolean signifying whether the objects are stationary
+    def add_multiple(self, objs, static=False):
+        for obj in objs:
+            for endpoint in self._add_object(obj, static):
+                self.endpoints.append(endpoint)
+
+        self.endpoints.sort(key=lambda endpoint: (endpoint[0], endpoint[1]))
+
+    ## Adds a single bounding volume to the detector.
+    #
+    #  Note: The bounding volume MUST be hashable.
+    #
+    #  @param obj A single bounding volume.
+    #  @param static A boolean signifying whether the object is stationary.
+    #   Static objects never have their endpoints refreshed by update.
+    def add(self, obj, static=False):
+        for endpoint in self._add_object(obj, static):
+            index = bisect.bisect_right(self.endpoints, endpoint[:2])
+            self.endpoints.insert(index, endpoint)
+
+    ## Removes a list of bounding volumes from the detector.
+    #
+    #  @param objs The list of bounding volumes to be removed.
+    def remove_multiple(self, objs):
+        for obj in objs:
+            self.remove(obj)
+
+    ## Removes a single bounding volume from the detector.
+    #
+    #  @param obj The single bounding volume to be removed.
+    def remove(self, obj):
+        self.dormant_objects.pop(obj, None)
+        if obj not in self.object_endpoints:
+            return
+
+        for endpoint in self.object_endpoints.pop(obj):
+            endpoint[2] = None
+        self.num_dead_endpoints += 2
+
+        self.static_objects.discard(obj)
+        self.dynamic_objects.discard(obj)
+
+    ## Refreshes the endpoints of the dynamic bounding volumes and restores
+    #  the sorted order of the endpoint list with an insertion sort, which is
+    #  nearly linear when the volumes have only moved a little.
+    #
+    #  @param objs An optional list of the bounding volumes known to have
+    #   moved. If omitted, every dynamic bounding volume is refreshed.
+    def update(self, objs=None):
+        moved_objects = self.dynamic_objects if objs is None else objs
+        self._update_dormancy()
+
+        for obj in moved_objects:
+            if obj not in self.dynamic_objects:
+                continue
+
+            (min_endpoint, max_endpoint) = self.object_endpoints[obj]
+            min_endpoint[0] = obj.x
+            max_endpoint[0] = obj.x + obj.width
+            self.max_width = max(self.max_width, obj.width)
+
+        if self.num_dead_endpoints > 0:
+            self.endpoints = [endpoint for endpoint in self.endpoints
+                              if endpoint[2] is not None]
+            self.num_dead_endpoints = 0
+
+        endpoints = self.endpoints
+        for index in range(1, len(endpoints)):
+            previous = endpoints[index - 1]
+            current = endpoints[index]
+            if previous[0] > current[0] or \
+                    (previous[0] == current[0] and previous[1] > current[1]):
+                self._sink(index)
+
+    ## Determines all the collisions that are occuring given the current
+    #  order of the endpoint list. Only pairs with at least one dynamic object
+    #  are tested since static objects never collide with each other.
+    #
+    #  @return A list of (Bounding Volume, Bounding Volume) frozensets of
+    #          colliding game world entities.
+    def get_all_collisions(self):
+        collisions = set([])
+        active_static = set([])
+        active_dynamic = set([])
+
+        for (position, kind, obj) in self.endpoints:
+            if obj is None:
+                continue
+
+            obj_static = obj in self.static_objects
+            active_objects = active_static if obj_static else active_dynamic
+
+            if kind == SweepAndPrune.MAX_ENDPOINT:
+                active_objects.discard(obj)
+                continue
+
+            candidates = active_dynamic if obj_static else \
+                active_dynamic | active_static
+            self.pairs_tested += len(candidates)
+
+            for candidate in candidates:
+                if self._can_collide(obj, candidate) and \
+                        obj.colliderect(candidate):
+                    collisions.add(frozenset([obj, candidate]))
+
+            active_objects.add(obj)
+
+        return list(collisions)
+
+    ## Finds the bounding volumes colliding with a rectangle. Only the left
+    #  endpoints that lie within the widest tracked volume of the rectangle
+    #  are visited, which are found by binary search as of the last update.
+    #
+    #  @param rect The rectangle (of type `pygame.Rect`) to be queried.
+    #  @return A list of the bounding volumes colliding with the rectangle.
+    def query_rect(self, rect):
+        start = bisect.bisect_left(self.endpoints, [rect.x - self.max_width])
+        stop = bisect.bisect_right(self.endpoints, [rect.x + rect.width,
+                                                    SweepAndPrune.MAX_ENDPOINT])
+
+        return [obj for (position, kind, obj) in self.endpoints[start:stop]
+                if kind == SweepAndPrune.MIN_ENDPOINT and obj is not None and
+                obj.colliderect(rect)]
+
+    ## Finds the bounding volumes containing a point.
+    #
+    #  @param x The x coordinate of the point.
+    #  @param y The y coordinate of the point.
+    #  @return A list of the bounding volumes containing the point.
+    def query_point(self, x, y):
+        return [obj for obj in self.query_rect(PG.Rect(x, y, 1, 1))
+                if obj.collidepoint(x, y)]
+
+    ## Finds the bounding volumes nearest to a point by querying squares of
+    #  increasing size around it.
+    #
+    #  @param x The x coordinate of the point.
+    #  @param y The y coordinate of the point.
+    #  @param k The maximum number of bounding volumes to be found.
+    #  @return A list of up to k bounding volumes, ordered from nearest to
+    #   farthest from the point.
+    def nearest(self, x, y, k=1):
+        return self._get_nearest_by_window(x, y, k)
+
+    ## @return A list of all the bounding volumes currently being tracked.
+    def get_all_objects(self):
+        return list(self.static_objects) + list(self.dynamic_objects)
+
+    ## @return True if we're tracking the provided bounding volume and false
+    #   otherwise.
+    def exists(self, obj):
+        return obj in self.object_endpoints or obj in self.dormant_objects
+
+    ## @return The number of objects in the detector.
+    def size(self):
+        return len(self.static_objects) + len(self.dynamic_objects)
+
+    ## Resets the sweep and prune detector.
+    def clear(self):
+        self.endpoints = []
+        self.num_dead_endpoints = 0
+        self.object_endpoints.clear()
+        self.dormant_objects.clear()
+        self.static_objects = set([])
+        self.dynamic_objects = set([])
+        self.max_width = 0
+
+    ### Private helper methods ###
+
+    ## Starts tracking a bounding volume, replacing it if it's already
+    #  tracked, and creates its endpoints without placing them in the list.
+    #
+    #  @param obj A single bounding volume.
+    #  @param static A boolean signifying whether the object is stationary.
+    #  @return The (min, max) endpoints of the object, or an empty tuple if
+    #   the object was made dormant.
+    def _add_object(self, obj, static):
+        if self.exists(obj):
+            self.remove(obj)
+        if self._make_dormant(obj, static):
+            return ()
+
+        min_endpoint = [obj.x, SweepAndPrune.MIN_ENDPOINT, obj]
+        max_endpoint = [obj.x + obj.width, SweepAndPrune.MAX_ENDPOINT, obj]
+        self.object_endpoints[obj] = (min_endpoint, max_endpoint)
+        self.max_width = max(self.max_width, obj.width)
+
+        if static:
+            self.static_objects.add(obj)
+        else:
+            self.dynamic_objects.add(obj)
+
+        return (min_endpoint, max_endpoint)
+
+    ## Moves the endpoint at the given index towards the front of the
+    #  endpoint list until the list is sorted up to that index.
+    #
+    #  @param index The index of the endpoint to be moved into place.
+    def _sink(self, index):
+        endpoints = self.endpoints
+        endpoint = endpoints[index]
+        key = (endpoint[0], endpoint[1])
+
+        while index > 0 and (endpoints[index - 1][0],
+                             endpoints[index - 1][1]) > key:
+            endpoints[index] = endpoints[index - 1]
+            index -= 1
+
+        endpoints[index] = endpoint
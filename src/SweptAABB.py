@@ -0,0 +1,115 @@
+##  @file SweptAABB.py
+#   @date Fall 2026
+#
+#   A container file for the functions used to sweep axis-aligned bounding
+#   boxes along a displacement, which keeps fast or stalled movers from
+#   tunneling through thin volumes.
+#
+#   Contacts use the same strict overlap test as `pygame.Rect.colliderect`, so
+#   a contact begins at the first instant at which two boxes would overlap
+#   rather than merely touch.  Displacements are clamped so that the mover
+#   overlaps the first volume it contacts by a single pixel, which lets the
+#   discrete collision pipeline report the contact and resolve it as usual.
+
+### Global Functions ###
+
+##  Finds the time at which a rectangle moving along a displacement first
+#   overlaps a fixed rectangle.
+#
+#   @param rect The moving rectangle (of type `pygame.Rect`) at its start.
+#   @param delta The displacement of the moving rectangle as a tuple (dx, dy).
+#   @param obstacle The fixed rectangle (of type `pygame.Rect`).
+#   @return None if the rectangles don't begin overlapping during the
+#       displacement (which includes rectangles overlapping from the start),
+#       else a tuple of the form (time, axis) where the time is in [0, 1) and
+#       the axis of the contact is 0 for the horizontal and 1 for the vertical.
+def get_time_of_impact( rect, delta, obstacle ):
+    entry_times = [ float("-inf"), float("-inf") ]
+    exit_times = [ float("inf"), float("inf") ]
+
+    for axis in range( 2 ):
+        ( start, stop ) = _get_extent( rect, axis )
+        ( obstacle_start, obstacle_stop ) = _get_extent( obstacle, axis )
+
+        if delta[ axis ] > 0:
+            entry_times[ axis ] = ( obstacle_start - stop ) / float( delta[axis] )
+            exit_times[ axis ] = ( obstacle_stop - start ) / float( delta[axis] )
+        elif delta[ axis ] < 0:
+            entry_times[ axis ] = ( obstacle_stop - start ) / float( delta[axis] )
+            exit_times[ axis ] = ( obstacle_start - stop ) / float( delta[axis] )
+        elif not ( start < obstacle_stop and stop > obstacle_start ):
+            return None
+
+    entry_time = max( entry_times )
+    if entry_time < 0 or entry_time >= 1 or entry_time >= min( exit_times ):
+        return None
+
+    return ( entry_time, 0 if entry_times[0] >= entry_times[1] else 1 )
+
+##  Clamps the displacement of a group of rectangles moving together so that
+#   the movement stops at the first contact with any of the given obstacles.
+#   Once a contact stops the movement along one axis, the remaining movement
+#   along the other axis is swept again so that movers slide along walls.
+#
+#   @param rects The list of moving rectangles (of type `pygame.Rect`).
+#   @param delta The displacement of the rectangles as an integer tuple (dx, dy).
+#   @param obstacles The list of fixed rectangles (of type `pygame.Rect`).
+#   @param can_collide An optional function that returns true if the given
+#       moving rectangle and obstacle are allowed to collide.
+#   @return The clamped displacement as an integer tuple (dx, dy), which moves
+#       the rectangles a single pixel into the first obstacle they contact.
+def clamp_displacement( rects, delta, obstacles, can_collide=None ):
+    moved = [ 0, 0 ]
+    remaining = [ delta[0], delta[1] ]
+
+    for sweep in range( 2 ):
+        contact = _get_first_contact( rects, moved, remaining, obstacles,
+            can_collide )
+        if contact == None:
+            break
+
+        ( entry_time, axis, step ) = contact
+        other_step = int( remaining[1 - axis] * entry_time )
+
+        moved[ axis ] += step
+        moved[ 1 - axis ] += other_step
+        remaining[ axis ] = 0
+        remaining[ 1 - axis ] -= other_step
+
+    return ( moved[0] + remaining[0], moved[1] + remaining[1] )
+
+### Helper Functions ###
+
+##  Finds the earliest contact between any of the moving rectangles and any
+#   of the obstacles once the rectangles are offset by the given amount.  The
+#   rectangles are given to the collision function without the offset.
+#
+#   @return None if there is no contact, else a tuple of the form
+#       (time, axis, step) where the step is the integer movement along the
+#       contact axis that makes the rectangles overlap by a single pixel.
+def _get_first_contact( rects, offset, delta, obstacles, can_collide ):
+    first_contact = None
+
+    for rect in rects:
+        moved_rect = rect.move( offset[0], offset[1] )
+        for obstacle in obstacles:
+            if can_collide != None and not can_collide( rect, obstacle ):
+                continue
+
+            impact = get_time_of_impact( moved_rect, delta, obstacle )
+            if impact != None and ( first_contact == None or
+                    impact[0] < first_contact[0] ):
+                ( entry_time, axis ) = impact
+                ( start, stop ) = _get_extent( moved_rect, axis )
+                ( obstacle_start, obstacle_stop ) = _get_extent( obstacle, axis )
+
+                step = obstacle_start - stop + 1 if delta[ axis ] > 0 \
+                    else obstacle_stop - start - 1
+                first_contact = ( entry_time, axis, step )
+
+    return first_contact
+
+##  @return A tuple of the form (start, stop) containing the extent of the
+#       given rectangle along the given axis.
+def _get_extent( rect, axis ):
+    return ( rect.x, rect.right ) if axis == 0 else ( rect.y, rect.bottom )
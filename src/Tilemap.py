@@ -0,0 +1,134 @@
+##  @file Tilemap.py
+#   @date Fall 2026
+#
+#   Source File for the "Tilemap" Type
+#
+#   A tilemap stores the tiles of a segment as a 2d array of small palette
+#   indices along with a single table of the distinct tiles, rather than as a
+#   tile tuple reference for each cell.  The accessors answer questions about
+#   whole regions at once so that rendering and collision code can work on
+#   rows, columns and rectangles of tiles without visiting each tile in turn.
+
+import sys
+import numpy as NP
+
+##  A compact, read-only matrix of tiles indexed by [x, y].  Each tile is a
+#   tuple of the form (tile_id, tangible, color) taken from the palette, and
+#   `tilemap[x][y]` gives the same tile tuples as the nested lists it replaces.
+class Tilemap( object ):
+    ### Constructors ###
+
+    ##  Constructs a tilemap from a palette and the palette index of each tile.
+    #
+    #   @param palette A list of the distinct tiles of the tilemap, each of the
+    #    form (tile_id, tangible, color).
+    #   @param indices A 2d array of palette indices indexed by [x, y].
+    def __init__( self, palette, indices ):
+        self._palette = list( palette )
+        self._indices = NP.array( indices, dtype=Tilemap.get_index_type(len(palette)) )
+        self._indices.setflags( write=False )
+
+        self._tile_ids = NP.empty( len(self._palette), dtype=object )
+        self._tile_ids[:] = [ tile[0] for tile in self._palette ]
+        self._tangibles = NP.array( [tile[1] for tile in self._palette], dtype=bool )
+        self._transitions = NP.array( [Tilemap.is_transition_color(tile[2])
+            for tile in self._palette], dtype=bool )
+
+    ##  @return The smallest unsigned NumPy integer type that can index a
+    #    palette of the given size.
+    @staticmethod
+    def get_index_type( palette_size ):
+        return NP.uint8 if palette_size <= 256 else NP.uint16
+
+    ##  @return True if tiles of the given color are transition tiles, which
+    #    have any grayscale color other than black and white.
+    @staticmethod
+    def is_transition_color( color ):
+        if color[:3] == ( 0, 0, 0 ) or color[:3] == ( 255, 255, 255 ):
+            return False
+        return color[ 0 ] == color[ 1 ] == color[ 2 ]
+
+    ### Operators ###
+
+    ##  @return A read-only sequence of the tiles in the given column, or the
+    #    tile at the given position if indexed with a tuple of the form (x, y).
+    def __getitem__( self, index ):
+        if isinstance( index, tuple ):
+            return self._palette[ self._indices[index] ]
+
+        return TilemapColumn( self._palette, self._indices[index] )
+
+    ##  @return The number of columns in the tilemap.
+    def __len__( self ):
+        return self._indices.shape[ 0 ]
+
+    def __eq__( self, other ):
+        if not isinstance( other, Tilemap ):
+            return NotImplemented
+        if self.get_dims() != other.get_dims():
+            return False
+
+        palette_lookup = dict( (tile, index) for ( index, tile ) in enumerate(self._palette) )
+        other_indices = NP.array( [palette_lookup.get(tile, -1)
+            for tile in other._palette], dtype=int )
+        return len( other_indices ) == 0 or \
+            ( other_indices[other._indices] == self._indices ).all()
+
+    def __ne__( self, other ):
+        equal = self.__eq__( other )
+        return equal if equal is NotImplemented else not equal
+
+    ### Methods ###
+
+    ##  @return A tuple of the form (width, height) given in tiles.
+    def get_dims( self ):
+        return self._indices.shape
+
+    ##  @return The list of the distinct tiles indexed by the tilemap.
+    def get_palette( self ):
+        return self._palette
+
+    ##  @return A read-only 2d NumPy array of the palette index of each tile in
+    #    the given region, which is selected by an integer or slice for each axis.
+    def get_indices( self, xs=slice(None), ys=slice(None) ):
+        return self._indices[ xs, ys ]
+
+    ##  @return A NumPy array of the tile id of each tile in the given region.
+    def get_tile_ids( self, xs=slice(None), ys=slice(None) ):
+        return self._tile_ids[ self._indices[xs, ys] ]
+
+    ##  @return A boolean NumPy array that is true for each tangible tile in the
+    #    given region.
+    def get_tangibility( self, xs=slice(None), ys=slice(None) ):
+        return self._tangibles[ self._indices[xs, ys] ]
+
+    ##  @return A boolean NumPy array that is true for each transition tile in
+    #    the given region.
+    def get_transitions( self, xs=slice(None), ys=slice(None) ):
+        return self._transitions[ self._indices[xs, ys] ]
+
+    ##  @return The estimated memory used by the tilemap in bytes, not counting
+    #    the tile tuples of the palette which are shared with the tile files.
+    def get_memory_size( self ):
+        return self._indices.nbytes + sys.getsizeof( self._palette ) + \
+            self._tile_ids.nbytes + self._tangibles.nbytes + self._transitions.nbytes
+
+##  A read-only view of a single column of a `Tilemap`, which gives the tile
+#   tuple at each row of the column.
+class TilemapColumn( object ):
+    ### Constructors ###
+
+    def __init__( self, palette, indices ):
+        self._palette = palette
+        self._indices = indices
+
+    ### Operators ###
+
+    def __getitem__( self, index ):
+        if isinstance( index, slice ):
+            return [ self._palette[tile_index] for tile_index in self._indices[index] ]
+
+        return self._palette[ self._indices[index] ]
+
+    def __len__( self ):
+        return len( self._indices )
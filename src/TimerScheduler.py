@@ -0,0 +1,102 @@
+##  @file TimerScheduler.py
+#   @date Fall 2026
+#
+#   Source File for the "TimerScheduler" Type
+#
+#   The timer scheduler keeps the deadlines of the timers of the game world in
+#   a binary heap ordered by deadline, so that the timers that expire during an
+#   update can be found without visiting the timers that don't.  Each owner
+#   has at most one pending timer, and rescheduling or cancelling a timer
+#   leaves its old heap entry in place to be skipped when it's popped.
+
+import heapq
+import itertools
+
+##  A scheduler of one-shot timers on a clock that's advanced by the game world.
+#   Timers that expire at the same deadline are popped in the order in which
+#   they were scheduled, so expiration is deterministic.
+class TimerScheduler( object ):
+    ### Class Constants ###
+
+    ##  The amount of time by which a deadline may be passed without the timer
+    #   having expired, which allows for the rounding error between the clock
+    #   and the time accumulated by timer owners.  Timers are allowed to expire
+    #   early by this amount, so owners must check whether their timeout has
+    #   actually passed when their timer expires.
+    TOLERANCE = 1e-6
+
+    ### Constructors ###
+
+    ##  Constructs a timer scheduler without any timers, with its clock at 0.
+    def __init__( self ):
+        self._time = 0.0
+
+        # Of the form: [ (deadline, sequence_number, owner) ]
+        self._timer_heap = []
+        # Of the form: { owner => (deadline, sequence_number) }
+        self._timers = {}
+        self._sequence = itertools.count()
+
+    ### Methods ###
+
+    ##  Schedules the timer of the given owner to expire after the given delay,
+    #   replacing the owner's pending timer if it has one.
+    #
+    #   @param owner The hashable object that owns the timer.
+    #   @param delay The amount of time after the current time at which the
+    #    timer expires.  An infinite delay cancels the owner's timer.
+    def schedule( self, owner, delay ):
+        if delay == float( "inf" ):
+            self.cancel( owner )
+            return
+
+        timer = ( self._time + delay, next(self._sequence) )
+        self._timers[ owner ] = timer
+        heapq.heappush( self._timer_heap, timer + (owner,) )
+
+    ##  Cancels the pending timer of the given owner if it has one.
+    #
+    #   @param owner The object that owns the timer to be cancelled.
+    def cancel( self, owner ):
+        self._timers.pop( owner, None )
+
+    ##  Removes and returns the owners of all timers that expire by the given
+    #   time, ordered by deadline and then by when they were scheduled.
+    #
+    #   @param time The time by which the returned timers expire.
+    #   @return A list of the owners of the expired timers.
+    def pop_expired( self, time ):
+        expired = []
+
+        while self._timer_heap and \
+                self._timer_heap[0][0] <= time + TimerScheduler.TOLERANCE:
+            ( deadline, sequence_number, owner ) = heapq.heappop( self._timer_heap )
+            if self._timers.get( owner ) == ( deadline, sequence_number ):
+                del self._timers[ owner ]
+                expired.append( owner )
+
+        return expired
+
+    ##  Advances the clock of the scheduler by the given amount of time.
+    #
+    #   @param time_delta The amount of time that has passed on the clock.
+    def advance( self, time_delta ):
+        self._time += time_delta
+
+    ##  @return The current time of the scheduler's clock.
+    def get_time( self ):
+        return self._time
+
+    ##  @return The deadline of the pending timer for the given owner (or None
+    #    if the owner has no pending timer).
+    def get_deadline( self, owner ):
+        timer = self._timers.get( owner )
+        return timer[ 0 ] if timer != None else None
+
+    ##  @return True if the given owner has a pending timer and false otherwise.
+    def __contains__( self, owner ):
+        return owner in self._timers
+
+    ##  @return The number of pending timers.
+    def __len__( self ):
+        return len( self._timers )
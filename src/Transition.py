@@ -8,7 +8,7 @@
 #   - Determine if this is more appropriate for this module file or if it 
 #     should be contained within the "StateMachine" module instead.
 
-import re
+from EventMatcher import *
 
 ##  The representation of a directed edge within a state machine.  Each transition
 #   encodes a set of events that invoke the transition from the source state of
@@ -22,13 +22,14 @@ class Transition( object ):
     #
     #   @param src_name The name identifier for the source state.
     #   @param dst_name The name identifier for the destination state.
-    #   @param event_class A regular expression that describes the events that
-    #    will invoke the instance transition.
+    #   @param event_class A regular expression string, an event matcher or
+    #    a matcher specification dictionary (see `EventMatcher.parse`) that
+    #    describes the events that will invoke the instance transition.
     def __init__( self, src_name, dst_name, event_class=".*" ):
         self._src_state = src_name
         self._dst_state = dst_name
 
-        self._event_class = re.compile( event_class )
+        self._event_class = EventMatcher.parse( event_class )
 
     ### Methods ###
 
@@ -39,7 +40,17 @@ class Transition( object ):
     #   @return True if the given event invokes the instance transition and
     #    false otherwise.
     def invoked_by( self, event ):
-        return True if self._event_class.search( repr(event) ) else False
+        return self._event_class.matches( event )
+
+    ##  @return The `EventMatcher` or `RegexMatcher` that describes the events
+    #    that invoke the transition.
+    def get_matcher( self ):
+        return self._event_class
+
+    ##  @return The 'EventType' type of all events that invoke the transition,
+    #    or None if events of any type may invoke it.
+    def get_event_type( self ):
+        return self._event_class.get_event_type()
 
     ##  @return The name identifier for the source state of the transition.
     def get_source( self ):
@@ -0,0 +1,110 @@
+##  @file TransitionTable.py
+#   @date Fall 2026
+#
+#   Source File for the "TransitionTable" Type
+#
+#   A transition table is the compiled form of the graph of a state machine.
+#   States are numbered densely in the order in which they're given, and the
+#   outgoing transitions of each state are stored in a tuple of the form
+#   ((Transition, dst_index),) so that stepping a machine only needs list and
+#   tuple indexing.  The outgoing transitions are also indexed by the event
+#   type that invokes them, so an event is only tested against transitions that
+#   could match it.  The graph library is only used while compiling a table
+#   and when exporting one, so a table can be compiled once for each kind of
+#   entity and shared by all of the state machines of that kind.
+
+import networkx as NX
+
+##  The immutable compiled form of the states and transitions of a state
+#   machine, which holds state names rather than `State` objects so that it
+#   can be shared by state machines with their own states.
+class TransitionTable( object ):
+    ### Constructors ###
+
+    ##  Compiles the transition table for the given states and transitions.
+    #
+    #   @param state_names A listing of the name identifiers of the states of
+    #    the machine, whose positions become the state indices.
+    #   @param transition_list A listing of the "Transition" objects that make
+    #    up the directed edges of the machine.
+    def __init__( self, state_names, transition_list ):
+        self._state_names = tuple( state_names )
+        self._state_indices = dict( (name, index)
+            for ( index, name ) in enumerate(self._state_names) )
+        self._transitions = tuple( transition_list )
+
+        assert len( self._state_indices ) == len( self._state_names ), \
+            "Compilation of an FSM with duplicate states!"
+        assert all( transition.get_source() in self._state_indices and
+            transition.get_destination() in self._state_indices
+            for transition in self._transitions ), \
+            "Compilation of an FSM with transitions between unknown states!"
+
+        # Outgoing transitions are tested in the order given by the graph.
+        machine = self.get_graph()
+        self._outgoing = tuple(
+            tuple( (ed["obj"], self._state_indices[dst_name])
+                for ( src_name, dst_name, ed ) in machine.out_edges(name, data=True) )
+            for name in self._state_names
+        )
+
+        # Transitions for any event type are tested alongside the typed ones.
+        self._untyped_outgoing = tuple(
+            tuple( edge for edge in outgoing if edge[0].get_event_type() == None )
+            for outgoing in self._outgoing
+        )
+        self._typed_outgoing = tuple(
+            dict( (etype, tuple(edge for edge in outgoing
+                if edge[0].get_event_type() in (etype, None)))
+                for etype in set(edge[0].get_event_type() for edge in outgoing)
+                if etype != None )
+            for outgoing in self._outgoing
+        )
+
+    ### Methods ###
+
+    ##  @return The index of the state with the given name identifier (or None
+    #    if no such state exists in the table).
+    def get_state_index( self, state_name ):
+        return self._state_indices.get( state_name )
+
+    ##  @return The name identifier of the state with the given index.
+    def get_state_name( self, state_index ):
+        return self._state_names[ state_index ]
+
+    ##  @return A tuple of the name identifiers of all states in index order.
+    def get_state_names( self ):
+        return self._state_names
+
+    ##  @return A tuple of the form ((Transition, dst_index),) containing the
+    #    outgoing transitions of the state with the given index in the order
+    #    in which they're tested.  If an event type is given, only transitions
+    #    that may be invoked by events of that type are included.
+    def get_outgoing( self, state_index, event_type=None ):
+        if event_type == None:
+            return self._outgoing[ state_index ]
+
+        return self._typed_outgoing[ state_index ].get( event_type,
+            self._untyped_outgoing[state_index] )
+
+    ##  @return A tuple containing all the "Transition" objects in the table.
+    def get_transitions( self ):
+        return self._transitions
+
+    ##  Exports the table as a graph, which attaches the given "State" objects
+    #   to the nodes if they're given.
+    #
+    #   @param state_list An optional listing of the "State" objects for the
+    #    states of the table, given in index order.
+    #   @return A `networkx.MultiDiGraph` with a node for each state and an
+    #    edge for each transition, with the objects stored as "obj" attributes.
+    def get_graph( self, state_list=None ):
+        machine = NX.MultiDiGraph()
+
+        for ( index, name ) in enumerate( self._state_names ):
+            machine.add_node( name, obj=state_list[index] if state_list else None )
+        for transition in self._transitions:
+            machine.add_edge( transition.get_source(), transition.get_destination(),
+                obj=transition )
+
+        return machine
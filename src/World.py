@@ -13,54 +13,81 @@ import string
 import pygame as PG
 from Level import Level
 from Segment import Segment
+from SegmentCache import SegmentCache
+from AssetBundle import AssetBundle
+from Globals import SEGMENT_MEMORY_BUDGET
 
 ##  This class is a high level container for all of the levels in the game.
-#   For now its only job is to load and construct the levels.
+#   For now its only job is to load and construct the levels.  Segments are
+#   only loaded when accessed, and the loaded segments of all levels share a
+#   single cache with a memory budget.
 class World():
     ### Constructors ###
 
     ##  Contructs the world by loading segments and grouping them into levels
     #   
-    def __init__(self):
+    #   @param memory_budget The estimated number of bytes that the loaded
+    #       segments are allowed to use (or None for no limit).
+    def __init__(self, memory_budget=SEGMENT_MEMORY_BUDGET):
         # This holds all of the levels and has the following form:
         # { "Level #"" => Level }
         self.levels = {}
+        self.segment_cache = SegmentCache(memory_budget)
         self.load()
 
     ### Methods ###
 
-    ##  This method loads all of the segment files and creates segment objects
-    #   for them. Then Levels are created using the connectivity information
-    #   in each segment.
+    ##  This method finds all of the segment files and describes the segments
+    #   in them without loading them. Then Levels are created using the
+    #   connectivity information in each segment description.
     #
-    #   Segment files are stored in ../assets/data/segdata as .gif files
+    #   Segment files are stored in ../assets/data/segdata as .gif files, and
+    #   compiled segments may also be given by the default asset bundle.
     def load(self):
-        # get list of segment files
+        # get list of segment ids from the segment files and the bundle
         seg_file_pattern = os.path.join('assets','data','segdata','*[0-9].gif')
-        seg_files = glob.glob(seg_file_pattern)
+        seg_ids = set([os.path.basename(seg_file)[:-len('.gif')]
+            for seg_file in glob.glob(seg_file_pattern)])
 
-        # load segments into pygame surfaces
-        # creates Segments
-        # groups segments into levels
+        bundle = AssetBundle.get_default()
+        if bundle != None:
+            seg_ids.update([name[len('segdata/'):]
+                for name in bundle.get_names('segdata/')])
+
+        # describes Segments
+        # groups segment descriptions into levels
         lvl_groups = {}
-        for seg_file in seg_files:
-            seg_id = string.split(os.path.basename(seg_file),'.')[1]
-            filename = os.path.basename(seg_file)
-            lvl_id = filename[:string.find(filename,'.')]
+        for seg_id in sorted(seg_ids):
+            lvl_id = self._get_level_id(seg_id)
 
-            segment = Segment(lvl_id + '.' + seg_id)
+            info = Segment.load_info(seg_id)
             
             if (lvl_id not in lvl_groups):
-                lvl_groups[lvl_id] = [segment]
+                lvl_groups[lvl_id] = [info]
             else:
-                lvl_groups[lvl_id].append(segment)
+                lvl_groups[lvl_id].append(info)
 
         # create Levels
         for lvl_id in lvl_groups.keys():
-            segments = lvl_groups[lvl_id]
-            level = Level(lvl_id)
-            for segment in segments:
-                level.add_segment(segment)
+            infos = lvl_groups[lvl_id]
+            level = Level(lvl_id, self.segment_cache)
+            for info in infos:
+                level.add_segment_info(info)
             level.connect()
             self.levels[lvl_id] = level
 
+    ##  Returns the segment with the given id from its level, loading it if it
+    #   isn't loaded.
+    #
+    #   @param seg_id The identifier of the segment, of the form "level.#".
+    #
+    #   @return The loaded `Segment` object.
+    def get_segment(self, seg_id):
+        return self.levels[self._get_level_id(seg_id)].segments[seg_id]
+
+    # Helper Functions #
+
+    ##  @return The identifier of the level containing the given segment.
+    def _get_level_id(self, seg_id):
+        return seg_id[:string.find(seg_id,'.')]
+
@@ -35,7 +35,7 @@ def main():
 
     ## Game Variables ##
     game_view = GameView()
-    game_world = GameWorld()
+    game_world = GameWorld( continuous=True )
 
     game_running = True
     title_screen = True
@@ -75,7 +75,7 @@ def main():
                     game_running = False
                 elif input_event.key == K_r and gameover_screen == True:
                     game_view = GameView()
-                    game_world = GameWorld()
+                    game_world = GameWorld( continuous=True )
                     gameover_screen = False
 
                 event_type = EventType.KEYDOWN if input_event.type == KEYDOWN \
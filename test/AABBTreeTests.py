@@ -0,0 +1,243 @@
+##  @file AABBTreeTests.py
+#   @date Fall 2026
+#
+#   Test File for the "AABBTree" collision strategy
+
+import unittest
+import random
+import pygame
+
+from src.HashableRect import *
+from src.CollisionFilter import *
+from src.CompositeHitbox import *
+from src.AABBTree import *
+
+
+class AABBTreeTests(unittest.TestCase):
+    ### Test Set Up/Tear Down ###
+
+    def setUp(self):
+        self.entityA = HashableRect(4, 28, 15, 20)
+        self.entityB = HashableRect(28, 10, 15, 20)
+        self.entityC = HashableRect(65, 15, 20, 20)
+        self.entityD = HashableRect(35, 35, 30, 45)
+        self.entityE = HashableRect(60, 60, 10, 10)
+        self.entityF = HashableRect(30, 76, 10, 10)
+        self.entityG = HashableRect(80, 20, 15, 20)
+        self.entityH = HashableRect(62, 68, 10, 10)
+        self.entityI = HashableRect(75, 50, 20, 20)
+        self.entityJ = HashableRect(80, 60, 10, 13)
+        self.entityK = HashableRect(78, 55, 15, 15)
+        self.all_entities = [self.entityA, self.entityB, self.entityC,
+                             self.entityD, self.entityE, self.entityF,
+                             self.entityG, self.entityH, self.entityI,
+                             self.entityJ, self.entityK]
+
+        self.tree = AABBTree(margin=4)
+
+    def tearDown(self):
+        self.tree.clear()
+
+    ### Testing Functions ###
+
+    def test_add_multiple_objects(self):
+        self.tree.add_multiple(self.all_entities)
+        for entity in self.all_entities:
+            self.assertTrue(self.tree.exists(entity),
+                            "Some objects were not added correctly.")
+        self._assert_tree_valid()
+
+    def test_remove_multiple_objects(self):
+        self.tree.add_multiple(self.all_entities)
+        self.tree.remove_multiple(self.all_entities[:5])
+
+        for entity in self.all_entities[:5]:
+            self.assertFalse(self.tree.exists(entity),
+                             "Some objects were not removed.")
+        self.assertEqual(self.tree.size(), len(self.all_entities) - 5,
+                         "Size mismatch after removing objects.")
+        self._assert_tree_valid()
+
+    def test_clear_nonempty(self):
+        self.tree.add_multiple(self.all_entities)
+        self.tree.clear()
+
+        self.assertEqual(self.tree.size(), 0,
+                         "Entities still exists after clearing nonempty list.")
+        self.assertEqual(self.tree.get_height(), -1,
+                         "Tree still has nodes after clearing.")
+
+    def test_height_balanced(self):
+        rects = [HashableRect(10 * i, 0, 5, 5) for i in range(256)]
+        self.tree.add_multiple(rects)
+
+        self.assertTrue(self.tree.get_height() <= 16,
+                        "Tree is too deep for the number of leaves.")
+        self._assert_tree_valid()
+
+    def test_update_within_fat_bounds(self):
+        self.tree.add(self.entityA)
+        fat_bounds = self.tree.leaves[self.entityA].bounds
+
+        self.entityA.x += 2
+        self.tree.update()
+
+        self.assertTrue(self.tree.leaves[self.entityA].bounds is fat_bounds,
+                        "Object moving within its fat bounds was reinserted.")
+
+        self.entityA.x -= 2
+
+    def test_update_outside_fat_bounds(self):
+        self.tree.add_multiple([self.entityA, self.entityB])
+
+        self.entityA.x += 50
+        self.tree.update()
+
+        self.assertTrue(
+            self.tree.leaves[self.entityA].bounds.contains(self.entityA),
+            "Object moving outside its fat bounds was not reinserted.")
+        self._assert_tree_valid()
+
+        self.entityA.x -= 50
+
+    def test_get_all_collisions_universal(self):
+        expected_collisions = [frozenset([self.entityC, self.entityG]),
+                               frozenset([self.entityD, self.entityF]),
+                               frozenset([self.entityD, self.entityE]),
+                               frozenset([self.entityD, self.entityH]),
+                               frozenset([self.entityE, self.entityH]),
+                               frozenset([self.entityI, self.entityJ]),
+                               frozenset([self.entityI, self.entityK]),
+                               frozenset([self.entityJ, self.entityK])]
+        self.tree.add_multiple(self.all_entities)
+
+        self.assertEqual(set(self.tree.get_all_collisions()),
+                         set(expected_collisions),
+                         "Incorrect list of collisions detected.")
+
+    def test_get_all_collisions_static_pairs_ignored(self):
+        self.tree.add_multiple([self.entityI, self.entityJ], static=True)
+        self.tree.add(self.entityK)
+
+        expected_collisions = [frozenset([self.entityI, self.entityK]),
+                               frozenset([self.entityJ, self.entityK])]
+        self.assertEqual(set(self.tree.get_all_collisions()),
+                         set(expected_collisions),
+                         "Incorrect collisions detected with static objects.")
+
+    def test_filter_applied(self):
+        owners = {self.entityI: "owner", self.entityJ: "owner"}
+        box = Hitbox(80, 60, 0, 0, HitboxType.INTANGIBLE)
+        self.tree.set_filter(CollisionFilter(owners.get))
+        self.tree.add_multiple([self.entityI, self.entityJ, self.entityK, box])
+
+        self.assertTrue(self.tree.exists(box), "Dormant object not tracked.")
+        self.assertEqual(set(self.tree.get_all_collisions()),
+                         set([frozenset([self.entityI, self.entityK]),
+                              frozenset([self.entityJ, self.entityK])]),
+                         "Filtered collisions detected.")
+
+    def test_pairs_tested_counted(self):
+        self.tree.add_multiple(self.all_entities)
+        self.tree.update()
+        self.tree.pairs_tested = 0
+
+        collisions = self.tree.get_all_collisions()
+        self.assertTrue(self.tree.pairs_tested >= len(collisions),
+                        "Fewer pairs tested than collisions found.")
+
+    def test_query_rect(self):
+        self.tree.add_multiple(self.all_entities)
+
+        self.assertEqual(set(self.tree.query_rect(pygame.Rect(60, 50, 20, 20))),
+                         set([self.entityD, self.entityE, self.entityH,
+                              self.entityI, self.entityK]),
+                         "Incorrect volumes found in region.")
+
+    def test_query_point(self):
+        self.tree.add_multiple(self.all_entities)
+
+        self.assertEqual(set(self.tree.query_point(82, 62)),
+                         set([self.entityI, self.entityJ, self.entityK]),
+                         "Incorrect volumes found at point.")
+        self.assertEqual(self.tree.query_point(50, 50), [self.entityD],
+                         "Incorrect volumes found at point.")
+
+    def test_raycast(self):
+        self.tree.add_multiple(self.all_entities)
+
+        hits = self.tree.raycast((0, 40), (5, 0), 100)
+        self.assertEqual(hits, [(4.0, self.entityA), (35.0, self.entityD),
+                                (80.0, self.entityG)],
+                         "Incorrect volumes hit by ray.")
+        self.assertEqual(self.tree.raycast((0, 40), (1, 0), 30),
+                         [(4.0, self.entityA)],
+                         "Ray hit volumes beyond its maximum distance.")
+
+    def test_nearest(self):
+        self.tree.add_multiple(self.all_entities)
+
+        self.assertEqual(self.tree.nearest(50, 5, 3),
+                         [self.entityB, self.entityC, self.entityD],
+                         "Incorrect nearest volumes found.")
+        self.assertEqual(len(self.tree.nearest(50, 5, 20)), len(self.all_entities),
+                         "Nearest volumes missing when k exceeds the count.")
+
+    def test_queries_match_linear_scan(self):
+        generator = random.Random(428)
+        detector = AABBTree()
+        for i in range(200):
+            detector.add(HashableRect(generator.randint(-20, 400),
+                                      generator.randint(-20, 400),
+                                      generator.randint(0, 40),
+                                      generator.randint(0, 40)),
+                         static=(i % 2 == 0))
+        detector.update()
+
+        for i in range(50):
+            (x, y) = (generator.randint(0, 400), generator.randint(0, 400))
+            rect = pygame.Rect(x, y, generator.randint(0, 120),
+                               generator.randint(0, 120))
+            direction = (generator.uniform(-1, 1), generator.uniform(-1, 1))
+
+            self.assertEqual(
+                set(detector.query_rect(rect)),
+                set(CollisionDetector.query_rect(detector, rect)))
+            self.assertEqual(
+                set(detector.query_point(x, y)),
+                set(CollisionDetector.query_point(detector, x, y)))
+            self.assertEqual(
+                set(detector.raycast((x, y), direction, 150)),
+                set(CollisionDetector.raycast(detector, (x, y), direction,
+                                              150)))
+            self.assertEqual(
+                [detector._get_point_distance(obj, x, y)
+                 for obj in detector.nearest(x, y, 5)],
+                [detector._get_point_distance(obj, x, y)
+                 for obj in CollisionDetector.nearest(detector, x, y, 5)])
+
+    # Private helper functions
+
+    def _assert_tree_valid(self):
+        stack = [self.tree.root] if self.tree.root is not None else []
+        leaf_count = 0
+
+        while stack:
+            node = stack.pop()
+            if node.is_leaf():
+                leaf_count += 1
+                self.assertTrue(node.bounds.contains(node.obj),
+                                "Leaf bounds don't contain their object.")
+                continue
+
+            for child in (node.left, node.right):
+                self.assertTrue(child.parent is node,
+                                "Child doesn't reference its parent.")
+                self.assertTrue(node.bounds.contains(child.bounds),
+                                "Node bounds don't contain a child.")
+                stack.append(child)
+            self.assertTrue(abs(node.left.height - node.right.height) <= 1,
+                            "Tree is not balanced.")
+
+        self.assertEqual(leaf_count, self.tree.size(),
+                         "Tree leaves don't match the tracked objects.")
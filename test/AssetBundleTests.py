@@ -0,0 +1,110 @@
+##  @file AssetBundleTests.py
+#   @date Fall 2026
+#
+#   Test File for the "AssetBundle" Type
+
+import os
+import time
+import shutil
+import tempfile
+import unittest
+import src
+
+from src.AssetBundle import *
+from src.Segment import *
+
+##  Container class for the test suite that tests the functionality of the
+#   "AssetBundle" type.
+class AssetBundleTests( unittest.TestCase ):
+    ### Test Set Up/Tear Down ###
+
+    def setUp( self ):
+        self._temp_dir = tempfile.mkdtemp()
+        self._bundle_path = os.path.join( self._temp_dir, "test.bundle" )
+        self._source_path = os.path.join( self._temp_dir, "source.txt" )
+        with open( self._source_path, "w" ) as source_file:
+            source_file.write( "source" )
+
+        # Backdate the source so that it's older than any bundle built from it.
+        source_time = time.time() - 60
+        os.utime( self._source_path, (source_time, source_time) )
+
+        AssetBundle.write( self._bundle_path, {
+            "values/list": ( [1, (2, "three"), {"four": 4.0}], [self._source_path] ),
+            "values/bytes": ( "\x00\x01\xff", [] ),
+            "other": ( None, [] ),
+        } )
+        self._bundle = AssetBundle.open( self._bundle_path )
+
+    def tearDown( self ):
+        self._bundle.close()
+        shutil.rmtree( self._temp_dir )
+
+    ### Testing Functions ###
+
+    def test_get( self ):
+        self.assertEqual( self._bundle.get("values/list"), [1, (2, "three"), {"four": 4.0}],
+            "Bundle didn't return the stored asset." )
+        self.assertEqual( self._bundle.get("values/bytes"), "\x00\x01\xff",
+            "Bundle didn't return the stored binary asset." )
+        self.assertEqual( self._bundle.get("missing"), None,
+            "Bundle returned an asset that it doesn't contain." )
+
+    def test_get_names( self ):
+        self.assertEqual( self._bundle.get_names(), ["other", "values/bytes", "values/list"],
+            "Bundle didn't list all of its assets." )
+        self.assertEqual( self._bundle.get_names("values/"), ["values/bytes", "values/list"],
+            "Bundle didn't list its assets with a prefix." )
+
+    def test_stale_asset( self ):
+        os.utime( self._source_path, None )
+
+        self.assertEqual( self._bundle.get("values/list"), None,
+            "Bundle returned an asset with a modified source file." )
+        self.assertEqual( self._bundle.get("values/bytes"), "\x00\x01\xff",
+            "Bundle didn't return an asset without source files." )
+
+    def test_corrupt_asset( self ):
+        self._bundle.close()
+        with open( self._bundle_path, "r+b" ) as bundle_file:
+            bundle_file.seek( -1, os.SEEK_END )
+            last_byte = bundle_file.read( 1 )
+            bundle_file.seek( -1, os.SEEK_END )
+            bundle_file.write( chr(ord(last_byte) ^ 0xff) )
+        self._bundle = AssetBundle.open( self._bundle_path )
+
+        self.assertEqual( self._bundle.get("values/list"), None,
+            "Bundle returned an asset that failed its integrity check." )
+
+    def test_open_invalid( self ):
+        self.assertEqual( AssetBundle.open(os.path.join(self._temp_dir, "missing")), None,
+            "Opened a bundle that doesn't exist." )
+
+        with open( self._bundle_path, "r+b" ) as bundle_file:
+            bundle_file.seek( len(AssetBundle.MAGIC) )
+            bundle_file.write( "\xff" )
+        self.assertEqual( AssetBundle.open(self._bundle_path), None,
+            "Opened a bundle with an unsupported version." )
+
+    def test_compiled_segment( self ):
+        segment = Segment( "1.2" )
+        AssetBundle.write( self._bundle_path, {
+            "segdata/1.2": ( segment.get_compiled_data(), [] ) } )
+
+        previous_bundle = AssetBundle.get_default()
+        AssetBundle.set_default( AssetBundle.open(self._bundle_path) )
+        try:
+            compiled_segment = Segment( "1.2" )
+        finally:
+            AssetBundle.get_default().close()
+            AssetBundle.set_default( previous_bundle )
+
+        self.assertEqual( compiled_segment.get_dims(), segment.get_dims(),
+            "Compiled segment has different dims." )
+        self.assertEqual( compiled_segment.get_tiles(), segment.get_tiles(),
+            "Compiled segment has different tiles." )
+        self.assertEqual( compiled_segment.get_entities(), segment.get_entities(),
+            "Compiled segment has different entities." )
+        self.assertTrue( (compiled_segment.get_tangibility() ==
+            segment.get_tangibility()).all(),
+            "Compiled segment has a different tangibility grid." )
@@ -0,0 +1,89 @@
+##  @file CollisionFilterTests.py
+#   @date Fall 2026
+#
+#   Test File for the "CollisionFilter" broad-phase filter
+
+import unittest
+
+from src.HashableRect import *
+from src.CompositeHitbox import *
+from src.CollisionFilter import *
+
+
+class CollisionFilterTests(unittest.TestCase):
+    ### Test Set Up/Tear Down ###
+
+    def setUp(self):
+        self.default_box = Hitbox(0, 0, 10, 10)
+        self.hurt_box = Hitbox(0, 0, 10, 10, HitboxType.HURT)
+        self.vulnerable_box = Hitbox(0, 0, 10, 10, HitboxType.VULNERABLE)
+        self.intangible_box = Hitbox(0, 0, 0, 0, HitboxType.INTANGIBLE)
+
+        self.owners = {self.hurt_box: "owner", self.vulnerable_box: "owner"}
+        self.filter = CollisionFilter()
+
+    ### Testing Functions ###
+
+    def test_intangible_not_collidable(self):
+        self.assertFalse(self.filter.is_collidable(self.intangible_box),
+                         "Intangible volume considered collidable.")
+        self.assertTrue(self.filter.is_collidable(self.hurt_box),
+                        "Tangible volume considered uncollidable.")
+
+    def test_untyped_volume_collidable(self):
+        rect = HashableRect(0, 0, 10, 10)
+
+        self.assertTrue(self.filter.is_collidable(rect),
+                        "Untyped volume considered uncollidable.")
+        self.assertTrue(self.filter.can_collide(rect, self.default_box),
+                        "Untyped volume rejected as a pair.")
+
+    def test_ignored_pair(self):
+        self.filter.ignore_pair(HitboxType.HURT, HitboxType.HURT)
+        other_hurt_box = Hitbox(0, 0, 10, 10, HitboxType.HURT)
+
+        self.assertFalse(self.filter.can_collide(self.hurt_box,
+                                                 other_hurt_box),
+                         "Ignored type pair allowed to collide.")
+        self.assertTrue(self.filter.can_collide(self.hurt_box,
+                                                self.vulnerable_box),
+                        "Type pair rejected without being ignored.")
+
+    def test_same_owner_rejected(self):
+        owner_filter = CollisionFilter(self.owners.get)
+
+        self.assertFalse(owner_filter.can_collide(self.hurt_box,
+                                                  self.vulnerable_box),
+                         "Volumes of the same owner allowed to collide.")
+        self.assertTrue(owner_filter.can_collide(self.hurt_box,
+                                                 self.default_box),
+                        "Volumes of different owners rejected.")
+
+    def test_type_matrix(self):
+        self.filter.ignore_pair(HitboxType.HURT, HitboxType.VULNERABLE)
+        hurt_index = self.filter.get_type_index(self.hurt_box)
+        vulnerable_index = self.filter.get_type_index(self.vulnerable_box)
+        default_index = self.filter.get_type_index(self.default_box)
+
+        matrix = self.filter.get_type_matrix()
+        self.assertEqual(matrix.shape, (3, 3))
+        self.assertFalse(matrix[hurt_index, vulnerable_index])
+        self.assertFalse(matrix[vulnerable_index, hurt_index])
+        self.assertTrue(matrix[hurt_index, default_index])
+        self.assertTrue(matrix[hurt_index, hurt_index])
+
+    def test_ignored_types_rejected(self):
+        self.assertFalse(self.filter.can_collide(self.intangible_box,
+                                                 self.default_box),
+                         "Intangible volume allowed to collide.")
+
+        intangible_index = self.filter.get_type_index(self.intangible_box)
+        default_index = self.filter.get_type_index(self.default_box)
+        matrix = self.filter.get_type_matrix()
+        self.assertFalse(matrix[intangible_index, default_index])
+        self.assertFalse(matrix[default_index, intangible_index])
+        self.assertTrue(matrix[default_index, default_index])
+
+
+if __name__ == "__main__":
+    unittest.main()
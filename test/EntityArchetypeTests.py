@@ -0,0 +1,79 @@
+##  @file EntityArchetypeTests.py
+#   @date Fall 2026
+#
+#   Test File for the "EntityArchetype" Type
+
+import unittest
+import src
+
+from src.EntityArchetype import *
+from src.Entity import *
+
+##  Container class for the test suite that tests the functionality of the
+#   "EntityArchetype" type.
+class EntityArchetypeTests( unittest.TestCase ):
+    ### Testing Constants ###
+
+    ##  The name of the entity archetype loaded in the contained tests.
+    ENTITY_NAME = "monster"
+
+    ### Test Set Up/Tear Down ###
+
+    def setUp( self ):
+        EntityArchetype.clear()
+        self._archetype = EntityArchetype.load( EntityArchetypeTests.ENTITY_NAME )
+
+    def tearDown( self ):
+        self._archetype = None
+
+    ### Testing Functions ###
+
+    def test_load_shares_archetype( self ):
+        self.assertTrue( EntityArchetype.load(EntityArchetypeTests.ENTITY_NAME)
+            is self._archetype, "Archetype was loaded more than once." )
+
+    def test_clear_reloads_archetype( self ):
+        EntityArchetype.clear()
+
+        self.assertFalse( EntityArchetype.load(EntityArchetypeTests.ENTITY_NAME)
+            is self._archetype, "Archetype wasn't reloaded after clearing." )
+
+    def test_produce_states_independence( self ):
+        states_a = self._archetype.produce_states()
+        states_b = self._archetype.produce_states()
+
+        self.assertEqual( [state.get_name() for state in states_a],
+            [state.get_name() for state in states_b],
+            "Archetype produced different states." )
+        for ( state_a, state_b ) in zip( states_a, states_b ):
+            self.assertFalse( state_a is state_b,
+                "Archetype shared a mutable state." )
+
+    def test_produce_physical_independence( self ):
+        physical_a = self._archetype.produce_physical()
+        physical_b = self._archetype.produce_physical()
+
+        self.assertEqual( physical_a, physical_b,
+            "Archetype produced different physical states." )
+        self.assertFalse( physical_a.get_volume() is physical_b.get_volume(),
+            "Archetype shared a mutable physical state." )
+
+    def test_chitbox_templates( self ):
+        templates = self._archetype.get_chitbox_templates()
+
+        self.assertEqual( sorted(templates.keys()),
+            sorted(state.get_name() for state in self._archetype.produce_states()),
+            "Archetype didn't produce a template for every state." )
+
+    def test_entities_share_archetype( self ):
+        entity_a = Entity( EntityArchetypeTests.ENTITY_NAME )
+        entity_b = Entity( EntityArchetypeTests.ENTITY_NAME )
+
+        self.assertTrue( entity_a._chitbox_templates is entity_b._chitbox_templates,
+            "Entities didn't share their hitbox templates." )
+        self.assertFalse( entity_a.get_chitbox() is entity_b.get_chitbox(),
+            "Entities shared their composite hitboxes." )
+        self.assertFalse( entity_a._mntl_state is entity_b._mntl_state,
+            "Entities shared their state machines." )
+        self.assertTrue( entity_a._mntl_state.get_table() is entity_b._mntl_state.get_table(),
+            "Entities didn't share their compiled transition table." )
@@ -0,0 +1,96 @@
+##  @file EventBusTests.py
+#   @date Fall 2026
+#
+#   Test File for the "EventBus" Type
+
+import unittest
+import src
+from src.EventBus import *
+from src.EventMatcher import *
+from src.Event import *
+
+##  A simple subscriber that records the events of which it's notified.
+class TestSubscriber( object ):
+    def __init__( self ):
+        self.events = []
+
+    def notify_of( self, event ):
+        self.events.append( event )
+
+##  Container class for the test suite that tests the functionality of the
+#   "EventBus" type.
+class EventBusTests( unittest.TestCase ):
+    ### Testing Constants ###
+
+    ##  A key event that's only matched by the key subscriber.
+    KEY_EVENT = Event( EventType.KEYDOWN, {"key": 24} )
+
+    ##  A collision event that's matched by the collision and regex subscribers.
+    COLLISION_EVENT = Event( EventType.COLLISION, {"objects": ()} )
+
+    ### Test Set Up/Tear Down ###
+
+    def setUp( self ):
+        self._bus = EventBus()
+        self._key_sub = TestSubscriber()
+        self._collision_sub = TestSubscriber()
+        self._regex_sub = TestSubscriber()
+
+        self._bus.subscribe( self._key_sub, [EventMatcher(EventType.KEYDOWN, {"key": 24}),
+            EventMatcher(EventType.KEYUP, {"key": 24})] )
+        self._bus.subscribe( self._collision_sub, [EventMatcher(EventType.COLLISION)] )
+        self._bus.subscribe( self._regex_sub, [RegexMatcher("^collision")] )
+
+    def tearDown( self ):
+        self._bus = None
+
+    ### Testing Functions ###
+
+    def test_publish_by_type( self ):
+        self.assertEqual( self._bus.publish(EventBusTests.KEY_EVENT), 1,
+            "Event bus notified the wrong number of subscribers." )
+        self.assertEqual( self._key_sub.events, [EventBusTests.KEY_EVENT],
+            "Event bus didn't notify a subscriber of a matched event." )
+        self.assertEqual( self._collision_sub.events, [],
+            "Event bus notified a subscriber of an event of another type." )
+        self.assertEqual( self._regex_sub.events, [],
+            "Event bus notified a subscriber of an unmatched event." )
+
+    def test_publish_by_parameters( self ):
+        self.assertEqual( self._bus.publish(Event(EventType.KEYDOWN, {"key": 25})), 0,
+            "Event bus notified a subscriber of an event with unmatched parameters." )
+        self.assertEqual( self._key_sub.events, [],
+            "Event bus notified a subscriber of an event with unmatched parameters." )
+
+    def test_publish_untyped( self ):
+        self._bus.publish( EventBusTests.COLLISION_EVENT )
+
+        self.assertEqual( self._collision_sub.events, [EventBusTests.COLLISION_EVENT],
+            "Event bus didn't notify a typed subscriber of a matched event." )
+        self.assertEqual( self._regex_sub.events, [EventBusTests.COLLISION_EVENT],
+            "Event bus didn't notify an untyped subscriber of a matched event." )
+        self.assertEqual( self._bus.get_subscribers(EventType.COLLISION),
+            [self._collision_sub, self._regex_sub],
+            "Event bus doesn't keep subscribers in subscription order." )
+        self.assertEqual( self._bus.get_subscribers(EventType.TIMEOUT), [self._regex_sub],
+            "Event bus doesn't give untyped subscribers for unsubscribed types." )
+
+    def test_unsubscribe( self ):
+        self._bus.publish( EventBusTests.KEY_EVENT )
+        self._bus.unsubscribe( self._key_sub )
+        self._bus.publish( EventBusTests.KEY_EVENT )
+
+        self.assertEqual( len(self._key_sub.events), 1,
+            "Event bus notified an unsubscribed subscriber." )
+        self.assertFalse( self._key_sub in self._bus,
+            "Event bus still contains an unsubscribed subscriber." )
+        self.assertTrue( self._collision_sub in self._bus,
+            "Event bus doesn't contain a subscriber." )
+
+    def test_resubscribe( self ):
+        self._bus.subscribe( self._key_sub, [EventMatcher(EventType.COLLISION)] )
+        self._bus.publish( EventBusTests.KEY_EVENT )
+        self._bus.publish( EventBusTests.COLLISION_EVENT )
+
+        self.assertEqual( self._key_sub.events, [EventBusTests.COLLISION_EVENT],
+            "Event bus didn't replace the subscription of a subscriber." )
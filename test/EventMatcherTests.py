@@ -0,0 +1,73 @@
+##  @file EventMatcherTests.py
+#   @date Fall 2026
+#
+#   Test File for the "EventMatcher" and "RegexMatcher" Types
+
+import unittest
+import src
+from src.EventMatcher import *
+from src.Event import *
+
+##  Container class for the test suite that tests the functionality of the
+#   "EventMatcher" and "RegexMatcher" types.
+class EventMatcherTests( unittest.TestCase ):
+    ### Testing Constants ###
+
+    ##  The event that's matched in the tests.
+    KEY_EVENT = Event( EventType.KEYDOWN, {"key": 24, "volumes": (1, 2)} )
+
+    ### Testing Functions ###
+
+    def test_type_match( self ):
+        matcher = EventMatcher( EventType.KEYDOWN )
+
+        self.assertTrue( matcher.matches(EventMatcherTests.KEY_EVENT),
+            "Matcher doesn't match events of its type." )
+        self.assertFalse( matcher.matches(Event(EventType.KEYUP, {"key": 24})),
+            "Matcher matches events of other types." )
+        self.assertEqual( matcher.get_event_type(), EventType.KEYDOWN,
+            "Matcher gives the wrong event type." )
+
+    def test_parameter_match( self ):
+        self.assertTrue( EventMatcher(EventType.KEYDOWN, {"key": 24}).matches(
+            EventMatcherTests.KEY_EVENT ), "Matcher doesn't match equal parameters." )
+        self.assertFalse( EventMatcher(EventType.KEYDOWN, {"key": 25}).matches(
+            EventMatcherTests.KEY_EVENT ), "Matcher matches unequal parameters." )
+        self.assertFalse( EventMatcher(EventType.KEYDOWN, {"other": 24}).matches(
+            EventMatcherTests.KEY_EVENT ), "Matcher matches missing parameters." )
+        self.assertTrue( EventMatcher(EventType.KEYDOWN, {"volumes": [1, 2]}).matches(
+            EventMatcherTests.KEY_EVENT ), "Matcher doesn't compare lists with tuples." )
+
+    def test_predicate_match( self ):
+        self.assertTrue( EventMatcher(EventType.KEYDOWN, {"key": lambda key: key < 25}).matches(
+            EventMatcherTests.KEY_EVENT ), "Matcher doesn't match with true predicates." )
+        self.assertFalse( EventMatcher(EventType.KEYDOWN, {"key": lambda key: key > 25}).matches(
+            EventMatcherTests.KEY_EVENT ), "Matcher matches with false predicates." )
+
+    def test_pattern_match( self ):
+        self.assertTrue( EventMatcher(EventType.KEYDOWN, pattern="key:24").matches(
+            EventMatcherTests.KEY_EVENT ), "Matcher doesn't match found patterns." )
+        self.assertFalse( EventMatcher(EventType.KEYDOWN, pattern="key:25").matches(
+            EventMatcherTests.KEY_EVENT ), "Matcher matches missing patterns." )
+        self.assertFalse( EventMatcher(EventType.KEYUP, pattern="key:24").matches(
+            EventMatcherTests.KEY_EVENT ), "Matcher matches patterns in other event types." )
+
+    def test_regex_match( self ):
+        matcher = RegexMatcher( "^keydown" )
+
+        self.assertTrue( matcher.matches(EventMatcherTests.KEY_EVENT),
+            "Regex matcher doesn't match the event representation." )
+        self.assertFalse( matcher.matches(Event(EventType.KEYUP)),
+            "Regex matcher matches other event representations." )
+        self.assertEqual( matcher.get_event_type(), None,
+            "Regex matcher gives an event type." )
+
+    def test_parse( self ):
+        matcher = EventMatcher( EventType.NOTIFY )
+
+        self.assertTrue( isinstance(EventMatcher.parse(".*"), RegexMatcher),
+            "Strings aren't parsed as regex matchers." )
+        self.assertTrue( EventMatcher.parse({"type": u"keydown", "params": {u"key": 24}}).matches(
+            EventMatcherTests.KEY_EVENT ), "Dictionaries aren't parsed as structured matchers." )
+        self.assertTrue( EventMatcher.parse(matcher) is matcher,
+            "Matchers aren't used as given." )
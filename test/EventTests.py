@@ -10,6 +10,7 @@
 #   - The tests for the 'repr' and 'str' non-empty functions shouldn't rely
 #     on the arbitrary orderings given by the 'Event' type.
 
+import copy
 import unittest
 import src
 from src.Event import *
@@ -103,3 +104,43 @@ class EventTests( unittest.TestCase ):
             "one->" + str( EventTests.EVENT_PARAMS["one"] ) + " )",
             "Incorrect string formatting for a non-empty event." )
 
+
+
+    def test_immutability( self ):
+        params = dict( EventTests.EVENT_PARAMS )
+        event = Event( EventTests.EVENT_TYPE, params )
+        params[ "three" ] = 3
+
+        self.assertEqual( event.get_parameters(), EventTests.EVENT_PARAMS,
+            "Event parameters change with the dictionary given on construction." )
+        self.assertRaises( AttributeError, setattr, event, "_type", EventType.TIMEOUT )
+        self.assertRaises( TypeError, event.get_parameters().__setitem__, "one", 2 )
+        self.assertRaises( TypeError, event.get_parameters().update, {"one": 2} )
+
+
+    def test_hash( self ):
+        event_copy = Event( EventTests.EVENT_TYPE, dict(EventTests.EVENT_PARAMS) )
+
+        self.assertEqual( hash(event_copy), hash(self._event),
+            "Equivalent events have different hashes." )
+        self.assertEqual( {self._event: 1}.get(event_copy), 1,
+            "Equivalent events aren't interchangeable as dictionary keys." )
+        self.assertEqual( self._event.get_signature(),
+            ( EventTests.EVENT_TYPE, ("one", "two") ),
+            "Incorrect signature for a non-empty event." )
+
+
+    def test_copy( self ):
+        self.assertTrue( copy.copy(self._event) is self._event,
+            "Copying an immutable event doesn't share the event." )
+        self.assertTrue( copy.deepcopy([self._event])[0] is self._event,
+            "Deep copying an immutable event doesn't share the event." )
+
+        params = self._event.get_parameters()
+        self.assertTrue( copy.copy(params) is params,
+            "Copying read-only event parameters doesn't share the parameters." )
+        self.assertTrue( copy.deepcopy({"params": params})["params"] is params,
+            "Deep copying read-only event parameters doesn't share the parameters." )
+        self.assertEqual( copy.deepcopy(Event(EventType.COLLISION,
+            {"objects": (1, 2)}).get_parameters()), {"objects": (1, 2)},
+            "Deep copying event parameters changes their values." )
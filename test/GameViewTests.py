@@ -12,14 +12,13 @@
 #   Low Priority:
 #   - Refactor the functionality associated with the `DISPLAY_PATCHERS` to
 #     make the code less clunky.
-#   - Update the `GameViewTests.WORLD_TILES` matrix to contain `Tile` instances
-#     instead of strings.
 
 import unittest
 import mock
 import src.Globals
 import src.HealthWidget
 
+from src.Tilemap import Tilemap
 from src.GameView import GameView
 from src.GameWorld import GameWorld
 from src.Camera import Camera
@@ -40,12 +39,9 @@ class GameViewTests( unittest.TestCase ):
         "hwidget": mock.patch( "src.HealthWidget.HealthWidget" )
     }
 
-    ##  A matrix containing the `Tile` objects given by the mock `GameWorld`.
-    WORLD_TILES = [
-        [ "0", "1" ],
-        [ "2", "3" ],
-        [ "4", "5" ],
-    ]
+    ##  The `Tilemap` containing the tiles given by the mock `GameWorld`.
+    WORLD_TILES = Tilemap( [(str(i), False, (i, 0, 0, 255)) for i in range(6)],
+        [[0, 1], [2, 3], [4, 5]] )
 
     ##  A list containing the test `Entity` objects given by the mock `GameWorld`.
     WORLD_ENTITIES = []
@@ -100,7 +96,7 @@ class GameViewTests( unittest.TestCase ):
         for entity in GameViewTests.WORLD_ENTITIES:
             self.assertFalse( self._view._is_entity_graphic_loaded(entity),
                 "Game view improperly loads entity assets before they're needed." )
-        for tile in [ t for s in GameViewTests.WORLD_TILES for t in s ]:
+        for tile in GameViewTests.WORLD_TILES.get_tile_ids().flat:
             self.assertFalse( self._view._is_tile_graphic_loaded(tile),
                 "Game view improperly loads tile assets before they're needed." )
 
@@ -109,11 +105,29 @@ class GameViewTests( unittest.TestCase ):
         for entity in GameViewTests.WORLD_ENTITIES:
             self.assertTrue( self._view._is_entity_graphic_loaded(entity),
                 "Game view doesn't load entity assets when they're rendered." )
-        for tile in [ t for s in GameViewTests.WORLD_TILES for t in s ]:
+        for tile in GameViewTests.WORLD_TILES.get_tile_ids().flat:
             self.assertTrue( self._view._is_tile_graphic_loaded(tile),
                 "Game view doesn't load tile assets when they're rendered." )
 
 
+    def test_render_loading_once( self ):
+        tilemap = GameViewTests.WORLD_TILES
+        with mock.patch.object( tilemap, "get_indices", wraps=tilemap.get_indices ) as indices_mock:
+            self._view.render( self._world_mock )
+            self._view.render( self._world_mock )
+
+        self.assertEqual( indices_mock.call_count, 1,
+            "Game view scans a tilemap for its tiles on every render." )
+        self.assertEqual( self._load_image_mock.call_count, len(tilemap.get_palette()),
+            "Game view doesn't load each tile asset exactly once." )
+
+        self._world_mock.get_tilemap.return_value = Tilemap(
+            tilemap.get_palette() + [("6", False, (6, 0, 0, 255))], [[0, 6]] )
+        self._view.render( self._world_mock )
+        self.assertTrue( self._view._is_tile_graphic_loaded("6"),
+            "Game view doesn't load tile assets for a new tilemap." )
+
+
     def test_render_onetile_environment( self ):
         self._world_mock.get_viewport.return_value = HashableRect( 0, 0,
              src.Globals.TILE_DIMS[0] - 1, src.Globals.TILE_DIMS[1] - 1 )
@@ -53,6 +53,175 @@ class GameWorldTests(unittest.TestCase):
         except NameError:
             self.assertTrue(False, "Game world didn't define entities.")
 
+    def test_tiles_registered_as_static(self):
+        detector = self._world._collision_detector
+
+        self.assertTrue(len(self._world._tile_hitboxes) > 0,
+            "Game world didn't register any tile volumes.")
+        self.assertEqual(len(self._world._tile_hitboxes),
+            len(self._world._segment.get_collision_rects()),
+            "Game world didn't register the merged tile volumes.")
+        for tile_hitbox in self._world._tile_hitboxes:
+            self.assertTrue(tile_hitbox in detector.static_objects,
+                "Game world registered a tile volume as dynamic.")
+
+    def test_triggers_registered_as_static(self):
+        detector = self._world._collision_detector
+
+        self.assertTrue(len(self._world._trigger_hitboxes) > 0,
+            "Game world didn't register any trigger volumes.")
+        for trigger_hitbox in self._world._trigger_hitboxes:
+            self.assertEqual(trigger_hitbox.htype, HitboxType.TRIGGER,
+                "Game world registered a trigger volume of the wrong type.")
+            self.assertTrue(trigger_hitbox in detector.static_objects,
+                "Game world registered a trigger volume as dynamic.")
+
+    def test_trigger_entry_events(self):
+        monster = [entity for entity in self._world.get_entities()
+            if entity != self._world._player_entity][0]
+        trigger = list(self._world._trigger_hitboxes)[0]
+        monster.get_physical_state()._velocity = (0, 0)
+
+        bbox = monster.get_bbox()
+        monster.get_chitbox().translate(trigger.centerx - bbox.centerx,
+            trigger.centery - bbox.centery)
+        trigger_events = []
+        for frame in range(2):
+            self._world.update(0.1)
+            frame_events = []
+            while monster._event_queue:
+                event = monster._event_queue.popleft()
+                if event.get_type() == EventType.TRIGGER:
+                    frame_events.append(event)
+            trigger_events.append(frame_events)
+
+        self.assertEqual(len(trigger_events[0]), 1,
+            "Game world didn't send an event on entering a trigger.")
+        self.assertEqual(len(trigger_events[1]), 0,
+            "Game world resent an event while staying in a trigger.")
+        self.assertTrue(trigger_events[0][0].get_parameters()["transition"] != None,
+            "Game world didn't find the transition of a trigger.")
+        self.assertEqual(self._world._segment.id, "3.1",
+            "Game world transitioned for an entity other than the player.")
+
+    def test_trigger_occupancy_across_frames(self):
+        monster = [entity for entity in self._world.get_entities()
+            if entity != self._world._player_entity][0]
+        trigger = list(self._world._trigger_hitboxes)[0]
+        monster.get_physical_state()._velocity = (0, 0)
+        ( first_box, second_box ) = monster.get_chitbox().get_inner_boxes()[:2]
+
+        # Only the first box of the monster enters the trigger at first, and
+        # its second box follows it in while the first box stays.
+        ( offset_x, offset_y ) = ( trigger.centerx - first_box.centerx,
+            trigger.centery - first_box.centery )
+        second_box.x += trigger.width + first_box.width
+        moves = [ (offset_x, offset_y), None, (-offset_x, -offset_y),
+            (offset_x, offset_y) ]
+        trigger_events = []
+        for move in moves:
+            if move is None:
+                second_box.x -= trigger.width + first_box.width
+            else:
+                monster.get_chitbox().translate(move[0], move[1])
+            self._world.update(0.0)
+
+            trigger_events.append([event for event in monster._event_queue
+                if event.get_type() == EventType.TRIGGER])
+            monster._event_queue.clear()
+
+        self.assertEqual([len(events) for events in trigger_events], [1, 0, 0, 1],
+            "Game world didn't track trigger occupancy across updates.")
+
+    def test_tile_corner_resolution(self):
+        player = self._world._player_entity
+        chitbox = player.get_chitbox()
+        floor = Hitbox(0, 100, 200, 20)
+        wall = Hitbox(150, 40, 20, 60)
+
+        bbox = chitbox.get_bounding_box()
+        chitbox.translate(158 - bbox.right, 102 - bbox.bottom)
+        self._world._resolve_tile_collisions(player, [floor, wall])
+
+        bbox = chitbox.get_bounding_box()
+        self.assertEqual(bbox.right, 149,
+            "Game world didn't resolve an entity against each tile volume.")
+        self.assertTrue(bbox.bottom < 100,
+            "Game world didn't resolve an entity out of the floor.")
+
+    def test_sweep_and_prune_detector(self):
+        world = GameWorld(detector_type=SweepAndPrune)
+
+        self.assertTrue(isinstance(world._collision_detector, SweepAndPrune),
+            "Game world didn't use the requested collision detector.")
+        world.update(1)
+
+    def test_aabb_tree_detector(self):
+        world = GameWorld(detector_type=AABBTree)
+
+        self.assertTrue(isinstance(world._collision_detector, AABBTree),
+            "Game world didn't use the requested collision detector.")
+        world.update(1)
+
+    def test_collision_events_sent_on_contact_changes(self):
+        (entity1, entity2) = self._world.get_entities()[:2]
+        collision = [entity1.get_chitbox().get_inner_boxes()[0],
+                     entity2.get_chitbox().get_inner_boxes()[0]]
+
+        self._world._resolve_entity_collision(collision, False)
+        self.assertEqual(len(entity1._event_queue), 0,
+            "Game world resent an event for a persisting collision.")
+
+        self._world._resolve_entity_collision(collision, True)
+        self.assertEqual(entity1._event_queue.popleft().get_type(),
+            EventType.COLLISION,
+            "Game world didn't send an event for a new collision.")
+
+        self._world._resolve_entity_separation(collision)
+        self.assertEqual(entity2._event_queue.popleft().get_type(),
+            EventType.COLLISION)
+        self.assertEqual(entity2._event_queue.popleft().get_type(),
+            EventType.SEPARATION,
+            "Game world didn't send an event for an ended collision.")
+
+    def test_collision_event_on_type_change(self):
+        player = self._world._player_entity
+        monster = [entity for entity in self._world.get_entities()
+            if entity.get_name() == "monster"][0]
+        player_box = player.get_chitbox().get_inner_boxes()[0]
+        monster.get_chitbox().translate(player_box.x - monster.get_bbox().x,
+            player_box.y - monster.get_bbox().y)
+        self._world._collision_detector.update()
+        self._world._collision_detector.update_contacts()
+
+        player_box.copy_ip(Hitbox(player_box.x, player_box.y, player_box.w,
+            player_box.h, HitboxType.HURT))
+        self._world.update(0.0)
+
+        self.assertTrue(any(event.get_parameters().get("victim") == monster
+            for event in monster._event_queue),
+            "Game world didn't send an event for a touching volume that turned harmful.")
+
+    def test_continuous_sweep(self):
+        world = GameWorld(continuous=True)
+        player = world._player_entity
+        wall = Hitbox(-500, -700, 10, 400)
+        world._tile_hitboxes.add(wall)
+        world._collision_detector.add(wall, static=True)
+
+        player.get_chitbox().place_at(-600, -600)
+        start_positions = dict((entity, entity.get_chitbox().get_position())
+            for entity in world.get_entities())
+        player.get_chitbox().translate(300, 0)
+        world._sweep_entities(start_positions)
+
+        self.assertEqual(player.get_bbox().right, wall.left + 1,
+            "Game world let an entity tunnel through a thin volume.")
+
+        world.update(1)
+        self.assertTrue(player.get_bbox().right <= wall.left,
+            "Game world didn't resolve an entity stopped at a contact.")
+
     def test_update_no_events(self):
         pre_entities = self._world.get_entities()
         self._world.update(1)
@@ -76,11 +245,47 @@ class GameWorldTests(unittest.TestCase):
             "Player didn't change states."
         )
 
+    def test_notify_of_broadcast(self):
+        player = self._world._player_entity
+        others = [entity for entity in self._world.get_entities() if entity != player]
+        self._world.notify_of(Event(EventType.KEYDOWN, {"key": MOVE_UP}))
+
+        self.assertEqual(list(player._event_queue),
+            [Event(EventType.KEYDOWN, {"key": MOVE_UP})],
+            "Player wasn't notified of a broadcast key event.")
+        self.assertTrue(all(len(entity._event_queue) == 0 for entity in others),
+            "Entities without key transitions were notified of a key event.")
+        self.assertTrue(len(others) > 0)
+
+        self._world.notify_of(Event(EventType.KEYDOWN, {"key": -1}))
+        self.assertEqual(len(player._event_queue), 1,
+            "Player was notified of a key event it can't react to.")
+
+    def test_long_update(self):
+        monster = [entity for entity in self._world.get_entities()
+            if entity.get_name() == "monster"][0]
+        self._world.update(1.0)
+        self.assertTrue(monster.get_mental_state() in self._world._timers,
+            "Game world didn't schedule the timeout of an entity state.")
+
+        self._world.update(250.0)
+        self.assertNotEqual(
+            monster.get_mental_state().get_current_state().get_name(), "idle_1",
+            "Game world didn't pass an entity through its timeouts.")
+
     def test_get_entities(self):
         entities = self._world.get_entities()
         self.assertTrue(len(entities) > 0, "Game world didn't define entities.")
         pass
 
+    def test_get_entities_in(self):
+        player = self._world._player_entity
+
+        self.assertTrue(player in self._world.get_entities_in(player.get_bbox()),
+                "Game world didn't find the player within its own volume.")
+        self.assertEqual(self._world.get_entities_in(pg.Rect(-100, -100, 10, 10)),
+                [], "Game world found entities outside of the segment.")
+
     def test_get_viewport(self):
         curr_view = self._world.get_viewport()
         soln_view = self._world._camera.get_viewport()
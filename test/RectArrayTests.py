@@ -0,0 +1,130 @@
+##  @file RectArrayTests.py
+#   @date Fall 2026
+#
+#   Test File for the "RectArray" Type
+
+import unittest
+import random
+import pygame as PG
+
+from src.RectArray import *
+from src.CollisionFilter import *
+from src.CompositeHitbox import *
+
+##  Container class for the test suite that tests the functionality of the
+#   "RectArray" type.
+class RectArrayTests( unittest.TestCase ):
+    ### Testing Functions ###
+
+    def test_empty( self ):
+        rect_array = RectArray( [] )
+
+        self.assertEqual( len(rect_array), 0 )
+        self.assertEqual( rect_array.get_overlapping_pairs().shape, (0, 2) )
+
+    def test_single_rect( self ):
+        rect_array = RectArray( [PG.Rect(0, 0, 10, 10)] )
+
+        self.assertEqual( rect_array.get_overlapping_pairs().shape, (0, 2) )
+
+    def test_overlapping_pairs( self ):
+        rects = [ PG.Rect(0, 0, 10, 10), PG.Rect(5, 5, 10, 10),
+            PG.Rect(20, 0, 10, 10), PG.Rect(8, 8, 20, 2) ]
+        rect_array = RectArray( rects )
+
+        pairs = rect_array.get_overlapping_pairs()
+        self.assertEqual( pairs.shape, (4, 2) )
+        self.assertEqual( set(map(tuple, pairs.tolist())),
+            set([(0, 1), (0, 3), (1, 3), (2, 3)]) )
+
+    def test_touching_rects_not_overlapping( self ):
+        rects = [ PG.Rect(0, 0, 10, 10), PG.Rect(10, 0, 10, 10),
+            PG.Rect(0, 10, 10, 10) ]
+        rect_array = RectArray( rects )
+
+        self.assertEqual( rect_array.get_overlapping_pairs().shape, (0, 2) )
+
+    def test_empty_rect_inside_rect( self ):
+        rects = [ PG.Rect(0, 0, 10, 10), PG.Rect(5, 5, 0, 0),
+            PG.Rect(0, 0, 0, 0) ]
+        rect_array = RectArray( rects )
+
+        self.assertEqual( set(map(tuple, rect_array.get_overlapping_pairs().tolist())),
+            set([(0, 1)]) )
+
+    def test_static_pairs_ignored( self ):
+        rects = [ PG.Rect(0, 0, 10, 10), PG.Rect(5, 5, 10, 10),
+            PG.Rect(8, 8, 10, 10) ]
+        rect_array = RectArray( rects, static_count=2 )
+
+        self.assertEqual( set(map(tuple, rect_array.get_overlapping_pairs().tolist())),
+            set([(0, 2), (1, 2)]) )
+
+    def test_filtered_pairs_ignored( self ):
+        rects = [ Hitbox(0, 0, 10, 10, HitboxType.HURT), Hitbox(5, 5, 10, 10),
+            Hitbox(8, 8, 10, 10, HitboxType.HURT), Hitbox(2, 2, 4, 4) ]
+        owners = { rects[0]: "owner", rects[1]: "owner" }
+        collision_filter = CollisionFilter( owners.get )
+        collision_filter.ignore_pair( HitboxType.HURT, HitboxType.HURT )
+        rect_array = RectArray( rects, collision_filter=collision_filter )
+
+        self.assertEqual( set(map(tuple, rect_array.get_overlapping_pairs().tolist())),
+            set([(0, 3), (1, 2), (1, 3)]) )
+
+    def test_refresh( self ):
+        rects = [ PG.Rect(0, 0, 10, 10), PG.Rect(50, 50, 10, 10) ]
+        rect_array = RectArray( rects, static_count=1 )
+        self.assertEqual( rect_array.get_overlapping_pairs().shape, (0, 2) )
+
+        rects[1].topleft = ( 5, 5 )
+        self.assertEqual( rect_array.get_overlapping_pairs().shape, (0, 2) )
+
+        rect_array.refresh()
+        self.assertEqual( rect_array.get_overlapping_pairs().tolist(), [[0, 1]] )
+
+    def test_matches_colliderect( self ):
+        generator = random.Random( 428 )
+        rects = [ PG.Rect(generator.randint(0, 200), generator.randint(0, 200),
+            generator.randint(0, 30), generator.randint(0, 30))
+            for i in range(300) ]
+        rect_array = RectArray( rects )
+
+        expected_pairs = set( (i, j) for i in range(len(rects))
+            for j in range(i + 1, len(rects)) if rects[i].colliderect(rects[j]) )
+        actual_pairs = set( map(tuple, rect_array.get_overlapping_pairs().tolist()) )
+
+        self.assertEqual( actual_pairs, expected_pairs )
+
+    def test_static_matches_colliderect( self ):
+        generator = random.Random( 428 )
+        rects = [ PG.Rect(generator.randint(0, 200), generator.randint(0, 200),
+            generator.randint(0, 30), generator.randint(0, 30))
+            for i in range(300) ]
+        rects.append( PG.Rect(rects[0].x, rects[0].y, 10, 10) )
+        rect_array = RectArray( rects, static_count=250 )
+
+        expected_pairs = set( (i, j) for i in range(len(rects))
+            for j in range(max(i + 1, 250), len(rects))
+            if rects[i].colliderect(rects[j]) )
+        actual_pairs = set( map(tuple, rect_array.get_overlapping_pairs().tolist()) )
+
+        self.assertEqual( actual_pairs, expected_pairs )
+
+    def test_static_pairs_not_tested( self ):
+        rects = [ PG.Rect(x, 0, 20, 20) for x in range(0, 100, 10) ]
+        rects.append( PG.Rect(500, 500, 10, 10) )
+        rect_array = RectArray( rects, static_count=10 )
+
+        self.assertEqual( rect_array.get_overlapping_pairs().shape, (0, 2) )
+        self.assertEqual( rect_array.pairs_tested, 0 )
+
+        rects[ -1 ].topleft = ( 5, 0 )
+        rect_array.refresh()
+        self.assertEqual( set(map(tuple, rect_array.get_overlapping_pairs().tolist())),
+            set([(0, 10), (1, 10)]) )
+        self.assertEqual( rect_array.pairs_tested, 2 )
+
+    ### Testing Helper Functions ###
+
+if __name__ == "__main__":
+    unittest.main()
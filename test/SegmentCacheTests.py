@@ -0,0 +1,78 @@
+##  @file SegmentCacheTests.py
+#   @date Fall 2026
+#
+#   Test File for the "SegmentCache" Type
+
+import unittest
+import src
+
+from src.SegmentCache import *
+
+##  A stand-in for a loaded segment with a fixed memory size.
+class SizedSegment( object ):
+    def __init__( self, memory_size ):
+        self._memory_size = memory_size
+
+    def get_memory_size( self ):
+        return self._memory_size
+
+##  Container class for the test suite that tests the functionality of the
+#   "SegmentCache" type.
+class SegmentCacheTests( unittest.TestCase ):
+    ### Test Set Up/Tear Down ###
+
+    def setUp( self ):
+        self._loads = []
+        self._cache = SegmentCache( 25 )
+
+    def _load( self, segment_id ):
+        self._loads.append( segment_id )
+        return SizedSegment( 10 )
+
+    ### Testing Functions ###
+
+    def test_get( self ):
+        segment = self._cache.get( "1.1", self._load )
+
+        self.assertEqual( self._cache.get("1.1", self._load), segment,
+            "Cache didn't return the loaded segment." )
+        self.assertEqual( self._loads, ["1.1"],
+            "Cache loaded a segment more than once." )
+        self.assertEqual( self._cache.get_memory_usage(), 10,
+            "Cache reported the wrong memory usage." )
+
+    def test_evict_least_recent( self ):
+        for segment_id in [ "1.1", "1.2", "1.1", "1.3" ]:
+            self._cache.get( segment_id, self._load )
+
+        self.assertEqual( self._cache.get_segment_ids(), ["1.1", "1.3"],
+            "Cache didn't evict the least recently used segment." )
+        self.assertEqual( self._cache.get_memory_usage(), 20,
+            "Cache didn't release the memory of the evicted segment." )
+
+        self._cache.get( "1.2", self._load )
+        self.assertEqual( self._loads, ["1.1", "1.2", "1.3", "1.2"],
+            "Cache didn't reload the evicted segment." )
+
+    def test_keep_most_recent( self ):
+        self._cache.get( "1.1", self._load )
+        self._cache.add( "1.2", SizedSegment(100) )
+
+        self.assertEqual( self._cache.get_segment_ids(), ["1.2"],
+            "Cache evicted the most recently used segment." )
+
+    def test_unbounded( self ):
+        cache = SegmentCache()
+        for index in range( 10 ):
+            cache.get( "1.%d" % index, self._load )
+
+        self.assertEqual( len(cache), 10, "Unbounded cache evicted a segment." )
+
+    def test_discard( self ):
+        self._cache.get( "1.1", self._load )
+        self._cache.discard( "1.1" )
+        self._cache.discard( "1.2" )
+
+        self.assertFalse( "1.1" in self._cache, "Cache didn't discard a segment." )
+        self.assertEqual( self._cache.get_memory_usage(), 0,
+            "Cache didn't release the memory of a discarded segment." )
@@ -1,4 +1,7 @@
+import sys
 import unittest
+import numpy as NP
+import pygame
 import src
 
 from src.World import *
@@ -22,9 +25,47 @@ class SegmentTests(unittest.TestCase):
         segments = level1.segments.values()
         for segment in segments:
             for trans in segment.transitions.items():
-                trans_back = trans[1][0].transitions[trans[1][1]]
-                self.assertTrue(segment == trans_back[0] and trans[0] == trans_back[1], ("Transition is not bidirectional."))
-                self.assertTrue(segment != trans[1][0] or trans[0] != trans[1][1], ("Transition is a loop."))
+                trans_back = level1.segments[trans[1][0]].transitions[trans[1][1]]
+                self.assertTrue(segment.id == trans_back[0] and trans[0] == trans_back[1], ("Transition is not bidirectional."))
+                self.assertTrue(segment.id != trans[1][0] or trans[0] != trans[1][1], ("Transition is a loop."))
+        self.assertTrue(len(level1.segments['1.2'].transitions) > 0, ("Level has no transitions."))
+
+    def testLevelConnectSegment(self):
+        level1 = self.world.levels['1']
+        level = Level('1')
+        for seg_id in ['1.3', '1.1', '1.2']:
+            level.connect_segment(level1.segment_infos[seg_id])
+
+        self.assertTrue(level.transitions == level1.transitions, ("Incremental connection differs from connect."))
+        self.assertTrue(sum(len(trans) for trans in level.transitions.values()) ==
+            sum(len(info.transition_tiles) for info in level.segment_infos.values()),
+            ("Transition tiles weren't all linked."))
+
+    def testWorldLazyLoad(self):
+        level1 = self.world.levels['1']
+
+        self.assertTrue('1.2' in level1.segments and len(level1.segments) == 3, ("Level is missing segments."))
+        self.assertTrue(len(self.world.segment_cache) == 0, ("Segments were loaded before being accessed."))
+
+        seg = level1.segments['1.2']
+        self.assertTrue('1.2' in self.world.segment_cache, ("Accessed segment wasn't loaded."))
+        self.assertTrue(level1.segments['1.2'] is seg, ("Loaded segment wasn't reused."))
+        self.assertTrue(self.world.get_segment('1.2') is seg, ("World returned a different segment."))
+        self.assertTrue(seg.get_info().transition_tiles == level1.segment_infos['1.2'].transition_tiles,
+            ("Segment description disagrees with the loaded segment."))
+
+    def testWorldMemoryBudget(self):
+        world = World(memory_budget=1)
+        level1 = world.levels['1']
+
+        seg = level1.segments['1.2']
+        self.assertTrue(world.segment_cache.get_segment_ids() == ['1.2'], ("Segment in use was evicted."))
+        level1.segments['1.1']
+        self.assertTrue(world.segment_cache.get_segment_ids() == ['1.1'], ("Unused segment wasn't evicted."))
+
+        reloaded = level1.segments['1.2']
+        self.assertTrue(reloaded is not seg and reloaded.get_tiles() == seg.get_tiles(), ("Evicted segment wasn't reloaded."))
+        self.assertTrue(reloaded.transitions == seg.transitions, ("Reloaded segment lost its transitions."))
 
     def testSegmentConstructor(self):
         level1 = self.world.levels['1']
@@ -65,3 +106,82 @@ class SegmentTests(unittest.TestCase):
         self.assertTrue(entities[5] == ((38,24),'monster'), ("Entity was not loaded correctly."))
         self.assertTrue(entities[6] == ((43,37),'monster'), ("Entity was not loaded correctly."))
 
+    def testSegmentTangibility(self):
+        seg = self.world.levels['1'].segments['1.2']
+        tiles = seg.get_tiles()
+        tangibility = seg.get_tangibility()
+
+        self.assertTrue(tangibility.shape == seg.get_dims(), ("Tangibility grid has incorrect dims."))
+        for x in range(seg.width):
+            for y in range(seg.height):
+                self.assertTrue(tangibility[x, y] == tiles[x][y][1], ("Tangibility grid disagrees with tiles."))
+
+    def testSegmentTilesMatchSurface(self):
+        seg = Segment('1.2')
+        surface = pygame.image.load(os.path.join('assets','data','segdata','1.2.gif'))
+        tiles = seg.get_tiles()
+
+        for x in range(seg.width):
+            for y in range(seg.height):
+                self.assertTrue(tiles[x][y][2][:3] == tuple(surface.get_at((x,y)))[:3], ("Tile doesn't match its pixel."))
+
+    def testSegmentColorsKeepAlpha(self):
+        surface = pygame.Surface((2, 1), pygame.SRCALPHA, 32)
+        surface.set_at((0, 0), (0, 128, 128, 255))
+        surface.set_at((1, 0), (0, 128, 128, 0))
+        colors = Segment._read_packed_colors(surface)
+
+        self.assertTrue(colors[0, 0] != colors[1, 0], ("Colors differing in alpha were packed alike."))
+        self.assertTrue([Segment._unpack_color(int(color)) for color in colors[:, 0]] ==
+            [(0, 128, 128, 255), (0, 128, 128, 0)], ("Packed colors don't unpack to their channels."))
+
+        palette_colors = NP.array([Segment._pack_color((0, 128, 128, 255))], dtype=NP.uint32)
+        self.assertTrue(Segment._find_colors(palette_colors, colors).tolist() == [[0], [-1]],
+            ("A color differing only in alpha was matched to a tile."))
+
+    def testSegmentCollisionRects(self):
+        seg = self.world.levels['1'].segments['1.2']
+        tangibility = seg.get_tangibility()
+        rects = seg.get_collision_rects()
+
+        covered = [[0] * seg.height for x in range(seg.width)]
+        for rect in rects:
+            for x in range(rect.x / TILE_DIMS[0], rect.right / TILE_DIMS[0]):
+                for y in range(rect.y / TILE_DIMS[1], rect.bottom / TILE_DIMS[1]):
+                    covered[x][y] += 1
+
+        for x in range(seg.width):
+            for y in range(seg.height):
+                self.assertTrue(covered[x][y] == int(tangibility[x, y]), ("Collision rects don't cover the tangible tiles exactly once."))
+        self.assertTrue(len(rects) < tangibility.sum() / 4, ("Collision rects weren't merged."))
+
+    def testSegmentCollisionRectsCached(self):
+        seg = self.world.levels['1'].segments['1.2']
+
+        self.assertTrue(seg.get_collision_rects() == World().levels['1'].segments['1.2'].get_collision_rects(),
+            ("Cached collision rects differ between loads."))
+        self.assertTrue(seg.get_memory_size() > seg.tiles.get_memory_size() + seg.tangibility.nbytes +
+            sys.getsizeof(seg.collision_rects), ("Collision rects aren't counted in the segment's memory size."))
+
+    def testSegmentTriggerRects(self):
+        seg = self.world.levels['1'].segments['1.2']
+        rects = seg.get_trigger_rects()
+
+        covered = []
+        for rect in rects:
+            covered += [(x, y) for x in range(rect.x / TILE_DIMS[0], rect.right / TILE_DIMS[0])
+                for y in range(rect.y / TILE_DIMS[1], rect.bottom / TILE_DIMS[1])]
+
+        self.assertTrue(len(rects) > 0, ("Segment has no trigger rects."))
+        self.assertTrue(seg.trigger_source[0] is seg.transitions, ("Trigger rects weren't kept with the segment."))
+        self.assertTrue(seg.get_trigger_rects() == rects, ("Kept trigger rects differ from the meshed ones."))
+        self.assertTrue(sorted(covered) == sorted(seg.transitions.keys()),
+            ("Trigger rects don't cover the transition tiles exactly once."))
+
+    def testSegmentTriggerRectsRebuilt(self):
+        seg = Segment('1.2')
+        self.assertTrue(seg.get_trigger_rects() == [], ("Unconnected segment has trigger rects."))
+
+        seg.add_transition((0, 0), '1.1', (0, 0))
+        self.assertTrue(seg.get_trigger_rects() == [pygame.Rect(0, 0, TILE_DIMS[0], TILE_DIMS[1])],
+            ("Trigger rects weren't rebuilt after a transition was added."))
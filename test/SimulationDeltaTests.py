@@ -78,6 +78,12 @@ class SimulationDeltaTests( unittest.TestCase ):
         )
 
 
+    def test_event_sharing( self ):
+        for ( event, listed_event ) in zip( self._delta.get_events(), SimulationDeltaTests.EVENT_LIST ):
+            self.assertTrue( event is listed_event,
+                "Value constructor copies the immutable parameter events." )
+
+
     def test_equality_operator( self ):
         delta_default = SimulationDelta()
         delta_copy = SimulationDelta( SimulationDeltaTests.PHYSICAL_DELTA,
@@ -5,9 +5,13 @@
 #   Test File for the "SpatialDictionary" collision strategy
 
 import unittest
+import random
+import pygame
 
 from src.HashableRect import *
 from src.SpatialDictionary import *
+from src.CollisionFilter import *
+from src.CompositeHitbox import *
 
 
 class SpatialDictionaryTests(unittest.TestCase):
@@ -205,6 +209,84 @@ class SpatialDictionaryTests(unittest.TestCase):
         self.entityH.x = h_x
         self.entityH.y = h_y
 
+    def test_update_idle_objects_not_rehashed(self):
+        self.dict_.add_multiple(self.all_entities)
+        table_before = dict((cell, set(objs))
+                            for cell, objs in self.dict_.table.items())
+
+        self.entityJ.x += 1
+        self.dict_.update()
+
+        self.assertEqual(self.dict_.table, table_before,
+                         "Objects moving within their cells were rehashed.")
+
+        self.entityJ.x -= 1
+
+    def test_update_moved_object_rehashed(self):
+        self.dict_.add(self.entityA)
+        old_cells = self.dict_._get_covered_cells(self.entityA)
+
+        self.entityA.x += 50
+        self.dict_.update()
+        new_cells = self.dict_._get_covered_cells(self.entityA)
+
+        for cell in old_cells:
+            if cell not in new_cells:
+                self.assertFalse(cell in self.dict_.table,
+                                 "Moved object left behind in an old cell.")
+        for cell in new_cells:
+            self.assertTrue(self.entityA in self.dict_.table[cell],
+                            "Moved object missing from a new cell.")
+
+        self.entityA.x -= 50
+
+    def test_update_only_reported_objects(self):
+        self.dict_.add_multiple([self.entityA, self.entityB])
+
+        self.entityA.x += 50
+        self.entityB.x += 50
+        self.dict_.update([self.entityA])
+
+        self.assertEqual(self.dict_.cell_ranges[self.entityA],
+                         self.dict_._get_cell_range(self.entityA),
+                         "Reported moving object was not rehashed.")
+        self.assertNotEqual(self.dict_.cell_ranges[self.entityB],
+                            self.dict_._get_cell_range(self.entityB),
+                            "Unreported object was rehashed.")
+
+        self.entityA.x -= 50
+        self.entityB.x -= 50
+
+    def test_add_static_object(self):
+        self.dict_.add(self.entityA, static=True)
+
+        self.assertTrue(self.entityA in self.dict_.static_objects,
+                        "Static object was not tracked as static.")
+        self.assertFalse(self.entityA in self.dict_.dynamic_objects,
+                         "Static object was tracked as dynamic.")
+
+    def test_update_static_object_not_rehashed(self):
+        self.dict_.add(self.entityA, static=True)
+        old_range = self.dict_.cell_ranges[self.entityA]
+
+        self.entityA.x += 50
+        self.dict_.update()
+
+        self.assertEqual(self.dict_.cell_ranges[self.entityA], old_range,
+                         "Static object was rehashed on update.")
+
+        self.entityA.x -= 50
+
+    def test_get_all_collisions_static_pairs_ignored(self):
+        self.dict_.add_multiple([self.entityI, self.entityJ], static=True)
+        self.dict_.add(self.entityK)
+
+        expected_collisions = [frozenset([self.entityI, self.entityK]),
+                               frozenset([self.entityJ, self.entityK])]
+        self.assertEqual(set(self.dict_.get_all_collisions()),
+                         set(expected_collisions),
+                         "Incorrect collisions detected with static objects.")
+
     def test_get_all_collisions_universal(self):
         expected_collisions = [frozenset([self.entityC, self.entityG]),
                                frozenset([self.entityD, self.entityF]),
@@ -216,6 +298,310 @@ class SpatialDictionaryTests(unittest.TestCase):
                                frozenset([self.entityJ, self.entityK])]
         self._test_get_all_collisions(self.all_entities, expected_collisions)
 
+    def test_update_contacts(self):
+        self.dict_.add_multiple([self.entityI, self.entityJ, self.entityK])
+
+        (begun, persisting, ended) = self.dict_.update_contacts()
+        self.assertEqual(set(begun),
+                         set([frozenset([self.entityI, self.entityJ]),
+                              frozenset([self.entityI, self.entityK]),
+                              frozenset([self.entityJ, self.entityK])]),
+                         "Incorrect contacts begun.")
+        self.assertEqual((persisting, ended), ([], []))
+
+        self.entityJ.x += 50
+        self.dict_.update()
+
+        (begun, persisting, ended) = self.dict_.update_contacts()
+        self.assertEqual(begun, [], "Contacts begun without new collisions.")
+        self.assertEqual(persisting, [frozenset([self.entityI, self.entityK])],
+                         "Incorrect contacts persisting.")
+        self.assertEqual(set(ended),
+                         set([frozenset([self.entityI, self.entityJ]),
+                              frozenset([self.entityJ, self.entityK])]),
+                         "Incorrect contacts ended.")
+
+        self.entityJ.x -= 50
+
+    def test_update_contacts_removed_objects_dropped(self):
+        self.dict_.add_multiple([self.entityI, self.entityK])
+        self.dict_.update_contacts()
+
+        self.dict_.remove(self.entityK)
+        self.assertEqual(self.dict_.update_contacts(), ([], [], []),
+                         "Contacts reported for a removed object.")
+
+    def test_filter_intangible_dormant(self):
+        self.dict_.set_filter(CollisionFilter())
+        box = Hitbox(4, 28, 0, 0, HitboxType.INTANGIBLE)
+        self.dict_.add(box)
+
+        self.assertTrue(self.dict_.exists(box), "Dormant object not tracked.")
+        self.assertEqual(self.dict_.get_all_objects(), [],
+                         "Intangible object was indexed.")
+
+        box.copy_ip(Hitbox(4, 28, 15, 20))
+        self.dict_.update()
+        self.assertEqual(self.dict_.get_all_objects(), [box],
+                         "Object not indexed after becoming tangible.")
+
+        self.dict_.add(self.entityA)
+        box.copy_ip(Hitbox(4, 28, 0, 0, HitboxType.INTANGIBLE))
+        self.dict_.update()
+        self.assertEqual(self.dict_.get_all_collisions(), [],
+                         "Collision detected for an intangible object.")
+
+        self.dict_.remove(box)
+        self.assertFalse(self.dict_.exists(box), "Dormant object not removed.")
+
+    def test_filter_dormant_static_flag_kept(self):
+        self.dict_.set_filter(CollisionFilter())
+        box = Hitbox(4, 28, 15, 20, HitboxType.INTANGIBLE)
+        self.dict_.add(box, static=True)
+
+        box.copy_ip(Hitbox(4, 28, 15, 20))
+        self.dict_.update()
+        self.assertEqual(self.dict_.static_objects, set([box]),
+                         "Static object indexed as dynamic after waking.")
+
+    def test_filter_type_change_keeps_index(self):
+        vector_dict = SpatialDictionary(self.cell_size, self.width,
+                                        self.height, vectorized=True)
+        vector_dict.set_filter(CollisionFilter())
+        box = Hitbox(4, 28, 15, 20)
+        vector_dict.add_multiple([box, self.entityA])
+        rect_array = vector_dict._get_rect_array()
+        self.assertEqual(vector_dict.get_all_collisions(),
+                         [frozenset([box, self.entityA])],
+                         "Collision not detected for a tangible object.")
+
+        box.copy_ip(Hitbox(4, 28, 15, 20, HitboxType.INTANGIBLE))
+        vector_dict.update()
+        self.assertEqual(vector_dict.get_all_collisions(), [],
+                         "Collision detected for an intangible object.")
+        self.assertTrue(vector_dict.rect_array is rect_array,
+                        "Index rebuilt when an object became intangible.")
+
+    def test_filter_same_owner_pairs_ignored(self):
+        owners = {self.entityI: "owner", self.entityJ: "owner"}
+        self.dict_.set_filter(CollisionFilter(owners.get))
+        self.dict_.add_multiple([self.entityI, self.entityJ, self.entityK])
+
+        expected_collisions = [frozenset([self.entityI, self.entityK]),
+                               frozenset([self.entityJ, self.entityK])]
+        self.assertEqual(set(self.dict_.get_all_collisions()),
+                         set(expected_collisions),
+                         "Collisions detected between volumes of one owner.")
+
+        vector_dict = SpatialDictionary(self.cell_size, self.width,
+                                        self.height, vectorized=True)
+        vector_dict.set_filter(CollisionFilter(owners.get))
+        vector_dict.add_multiple([self.entityI, self.entityJ, self.entityK])
+        self.assertEqual(set(vector_dict.get_all_collisions()),
+                         set(expected_collisions),
+                         "Collisions detected between volumes of one owner.")
+
+    def test_outside_objects_hashed_to_border(self):
+        entity_right = HashableRect(110, 10, 10, 10)
+        entity_below = HashableRect(-20, 120, 30, 10)
+        self.dict_.add_multiple([self.entityA, entity_right, entity_below])
+
+        self.assertEqual(self.dict_.cell_ranges[entity_right], (3, 0, 3, 0),
+                         "Object beyond the grid hashed outside of it.")
+        self.assertEqual(self.dict_.cell_ranges[entity_below], (0, 3, 0, 3),
+                         "Object beyond the grid hashed outside of it.")
+        self.assertEqual(self.dict_.outside_objects,
+                         set([entity_right, entity_below]),
+                         "Objects beyond the grid not recorded.")
+        self.assertFalse(self.entityA in self.dict_._get_nearby_objects(
+                         entity_right), "Object beyond the grid aliased.")
+
+    def test_get_all_collisions_outside_grid(self):
+        entity_outside = HashableRect(150, 150, 20, 20)
+        entity_overlap = HashableRect(160, 160, 20, 20)
+        self.dict_.add_multiple([entity_outside, entity_overlap])
+
+        self.assertEqual(self.dict_.get_all_collisions(),
+                         [frozenset([entity_outside, entity_overlap])],
+                         "Collision beyond the grid not detected.")
+        self.assertEqual(set(self.dict_.query_point(165, 165)),
+                         set([entity_outside, entity_overlap]),
+                         "Point query beyond the grid missed objects.")
+        self.assertEqual(self.dict_.raycast((0, 155), (1, 0), 200),
+                         [(150.0, entity_outside)],
+                         "Ray missed an object beyond the grid.")
+
+    def test_tune(self):
+        small_entities = [HashableRect(x, 5, 6, 6) for x in range(0, 100, 10)]
+        self.dict_.add_multiple(small_entities)
+        self.dict_.add(self.entityD)
+        self.dict_.tune()
+
+        self.assertEqual(self.dict_.cell_size, 8,
+                         "Cell size not tuned to the object sizes.")
+        self.assertEqual((self.dict_.columns, self.dict_.rows), (13, 13),
+                         "Grid not resized with the cell size.")
+        self.assertEqual(self.dict_.size(), len(small_entities) + 1,
+                         "Objects lost when the grid was resized.")
+
+        self.dict_.clear()
+        self.dict_.add(self.entityD)
+        self.dict_.tune()
+        self.assertEqual(self.dict_.cell_size, 64,
+                         "Cell size not tuned to the object sizes.")
+
+    def test_resize_keeps_collisions(self):
+        self.dict_.add_multiple(self.all_entities)
+        expected_collisions = set(self.dict_.get_all_collisions())
+
+        self.dict_.resize(10)
+        self.assertEqual(set(self.dict_.get_all_collisions()),
+                         expected_collisions,
+                         "Collisions changed when the grid was resized.")
+        self.assertEqual(self.dict_.cell_ranges[self.entityA], (0, 2, 1, 4),
+                         "Object not rehashed when the grid was resized.")
+
+    def test_get_all_collisions_vectorized(self):
+        vector_dict = SpatialDictionary(self.cell_size, self.width,
+                                        self.height, vectorized=True)
+        vector_dict.add_multiple(self.all_entities)
+        self.dict_.add_multiple(self.all_entities)
+
+        self.assertEqual(set(vector_dict.get_all_collisions()),
+                         set(self.dict_.get_all_collisions()),
+                         "Vectorized collisions differ from cell collisions.")
+
+    def test_get_all_collisions_vectorized_after_move(self):
+        vector_dict = SpatialDictionary(self.cell_size, self.width,
+                                        self.height, vectorized=True)
+        vector_dict.add_multiple(self.all_entities)
+        vector_dict.get_all_collisions()
+
+        self.entityA.x += 25
+        vector_dict.remove(self.entityK)
+
+        expected_collisions = [frozenset([self.entityA, self.entityB]),
+                               frozenset([self.entityA, self.entityD]),
+                               frozenset([self.entityC, self.entityG]),
+                               frozenset([self.entityD, self.entityF]),
+                               frozenset([self.entityD, self.entityE]),
+                               frozenset([self.entityD, self.entityH]),
+                               frozenset([self.entityE, self.entityH]),
+                               frozenset([self.entityI, self.entityJ])]
+        self.assertEqual(set(vector_dict.get_all_collisions()),
+                         set(expected_collisions),
+                         "Vectorized collisions not refreshed after changes.")
+
+        self.entityA.x -= 25
+
+    def test_vectorized_update_defers_rehash(self):
+        vector_dict = SpatialDictionary(self.cell_size, self.width,
+                                        self.height, vectorized=True)
+        entity = HashableRect(5, 5, 10, 10)
+        vector_dict.add(entity)
+
+        entity.topleft = (85, 85)
+        vector_dict.update()
+        self.assertEqual(vector_dict.cell_ranges[entity], (0, 0, 0, 0),
+                         "Object rehashed by a vectorized update.")
+        self.assertEqual(vector_dict.query_point(90, 90), [entity],
+                         "Object not rehashed when the grid was queried.")
+        self.assertEqual(vector_dict.cell_ranges[entity], (3, 3, 3, 3),
+                         "Object not rehashed when the grid was queried.")
+
+    def test_get_collision_indices(self):
+        self.dict_.add_multiple([self.entityI, self.entityJ], static=True)
+        self.dict_.add(self.entityK)
+
+        objs = self.dict_.get_indexed_objects()
+        indices = self.dict_.get_collision_indices()
+        self.assertEqual(indices.shape, (2, 2),
+                         "Collision indices have the wrong shape.")
+        self.assertEqual(set(frozenset([objs[i], objs[j]])
+                             for (i, j) in indices.tolist()),
+                         set([frozenset([self.entityI, self.entityK]),
+                              frozenset([self.entityJ, self.entityK])]),
+                         "Incorrect collision indices detected.")
+
+    def test_pairs_tested_counted(self):
+        self.dict_.add_multiple(self.all_entities)
+        self.dict_.update()
+        self.dict_.pairs_tested = 0
+
+        collisions = self.dict_.get_all_collisions()
+        self.assertTrue(self.dict_.pairs_tested >= len(collisions),
+                        "Fewer pairs tested than collisions found.")
+
+    def test_query_rect(self):
+        self.dict_.add_multiple(self.all_entities)
+
+        self.assertEqual(set(self.dict_.query_rect(pygame.Rect(60, 50, 20, 20))),
+                         set([self.entityD, self.entityE, self.entityH,
+                              self.entityI, self.entityK]),
+                         "Incorrect volumes found in region.")
+
+    def test_query_point(self):
+        self.dict_.add_multiple(self.all_entities)
+
+        self.assertEqual(set(self.dict_.query_point(82, 62)),
+                         set([self.entityI, self.entityJ, self.entityK]),
+                         "Incorrect volumes found at point.")
+        self.assertEqual(self.dict_.query_point(50, 50), [self.entityD],
+                         "Incorrect volumes found at point.")
+
+    def test_raycast(self):
+        self.dict_.add_multiple(self.all_entities)
+
+        hits = self.dict_.raycast((0, 40), (5, 0), 100)
+        self.assertEqual(hits, [(4.0, self.entityA), (35.0, self.entityD),
+                                (80.0, self.entityG)],
+                         "Incorrect volumes hit by ray.")
+        self.assertEqual(self.dict_.raycast((0, 40), (1, 0), 30),
+                         [(4.0, self.entityA)],
+                         "Ray hit volumes beyond its maximum distance.")
+
+    def test_nearest(self):
+        self.dict_.add_multiple(self.all_entities)
+
+        self.assertEqual(self.dict_.nearest(50, 5, 3),
+                         [self.entityB, self.entityC, self.entityD],
+                         "Incorrect nearest volumes found.")
+        self.assertEqual(len(self.dict_.nearest(50, 5, 20)), len(self.all_entities),
+                         "Nearest volumes missing when k exceeds the count.")
+
+    def test_queries_match_linear_scan(self):
+        generator = random.Random(428)
+        detector = SpatialDictionary(25, 400, 400)
+        for i in range(200):
+            detector.add(HashableRect(generator.randint(-20, 400),
+                                      generator.randint(-20, 400),
+                                      generator.randint(0, 40),
+                                      generator.randint(0, 40)),
+                         static=(i % 2 == 0))
+        detector.update()
+
+        for i in range(50):
+            (x, y) = (generator.randint(0, 400), generator.randint(0, 400))
+            rect = pygame.Rect(x, y, generator.randint(0, 120),
+                               generator.randint(0, 120))
+            direction = (generator.uniform(-1, 1), generator.uniform(-1, 1))
+
+            self.assertEqual(
+                set(detector.query_rect(rect)),
+                set(CollisionDetector.query_rect(detector, rect)))
+            self.assertEqual(
+                set(detector.query_point(x, y)),
+                set(CollisionDetector.query_point(detector, x, y)))
+            self.assertEqual(
+                set(detector.raycast((x, y), direction, 150)),
+                set(CollisionDetector.raycast(detector, (x, y), direction,
+                                              150)))
+            self.assertEqual(
+                [detector._get_point_distance(obj, x, y)
+                 for obj in detector.nearest(x, y, 5)],
+                [detector._get_point_distance(obj, x, y)
+                 for obj in CollisionDetector.nearest(detector, x, y, 5)])
+
     def test_get_all_objects_empty(self):
         self.dict_.remove_multiple(self.all_entities)
         entities = self.dict_.get_all_objects()
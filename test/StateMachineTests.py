@@ -21,6 +21,7 @@ from src.StateMachine import *
 from src.Transition import *
 from src.Event import *
 from src.SimulationDelta import *
+from src.TimerScheduler import *
 
 ##  Container class for the test suite that tests the functionality of the
 #   "StateMachine" type.
@@ -258,3 +259,44 @@ class StateMachineTests( unittest.TestCase ):
             "Multipart transitions through steps return an incorrect sim delta."
         )
 
+
+
+    def test_long_step( self ):
+        self._complex_machine.simulate_step( 5.0 * StateMachineTests.TIME_DELTA )
+
+        self.assertEqual(
+            self._complex_machine.get_current_state(),
+            StateMachineTests.COMPLEX_STATES[ 0 ],
+            "A step longer than several timeouts doesn't pass through each timeout."
+        )
+        self.assertEqual(
+            self._complex_machine.get_current_state().get_active_time(),
+            1.0 * StateMachineTests.TIME_DELTA,
+            "A step longer than several timeouts doesn't pass on the excess time."
+        )
+
+
+    def test_scheduled_timeouts( self ):
+        timers = TimerScheduler()
+        self._complex_machine.set_timer_scheduler( timers )
+
+        for step in range( 3 ):
+            for machine in timers.pop_expired( timers.get_time() + StateMachineTests.TIME_DELTA ):
+                machine.expire_timer()
+            self._complex_machine.simulate_step( StateMachineTests.TIME_DELTA )
+            timers.advance( StateMachineTests.TIME_DELTA )
+
+            if step == 0:
+                self.assertEqual( timers.get_deadline(self._complex_machine),
+                    2.0 * StateMachineTests.TIME_DELTA,
+                    "Machine didn't schedule the timeout of its current state." )
+
+        self.assertEqual(
+            self._complex_machine.get_current_state(),
+            StateMachineTests.COMPLEX_STATES[ 1 ],
+            "Scheduled timeouts don't cause the same transitions as polled timeouts."
+        )
+
+        self._complex_machine.set_timer_scheduler( None )
+        self.assertFalse( self._complex_machine in timers,
+            "Detached machine still has a scheduled timeout." )
@@ -0,0 +1,243 @@
+##  @file SweepAndPruneTests.py
+#   @date Fall 2026
+#
+#   Test File for the "SweepAndPrune" collision strategy
+
+import unittest
+import random
+import pygame
+
+from src.HashableRect import *
+from src.CollisionFilter import *
+from src.CompositeHitbox import *
+from src.SweepAndPrune import *
+
+
+class SweepAndPruneTests(unittest.TestCase):
+    ### Test Set Up/Tear Down ###
+
+    def setUp(self):
+        self.entityA = HashableRect(4, 28, 15, 20)
+        self.entityB = HashableRect(28, 10, 15, 20)
+        self.entityC = HashableRect(65, 15, 20, 20)
+        self.entityD = HashableRect(35, 35, 30, 45)
+        self.entityE = HashableRect(60, 60, 10, 10)
+        self.entityF = HashableRect(30, 76, 10, 10)
+        self.entityG = HashableRect(80, 20, 15, 20)
+        self.entityH = HashableRect(62, 68, 10, 10)
+        self.entityI = HashableRect(75, 50, 20, 20)
+        self.entityJ = HashableRect(80, 60, 10, 13)
+        self.entityK = HashableRect(78, 55, 15, 15)
+        self.all_entities = [self.entityA, self.entityB, self.entityC,
+                             self.entityD, self.entityE, self.entityF,
+                             self.entityG, self.entityH, self.entityI,
+                             self.entityJ, self.entityK]
+
+        self.sap = SweepAndPrune()
+
+    def tearDown(self):
+        self.sap.clear()
+
+    ### Testing Functions ###
+
+    def test_add_one_object(self):
+        self.sap.add(self.entityJ)
+        self.assertTrue(self.sap.exists(self.entityJ),
+                        "A single object was not added correctly.")
+
+    def test_add_multiple_objects(self):
+        self.sap.add_multiple(self.all_entities)
+        for entity in self.all_entities:
+            self.assertTrue(self.sap.exists(entity),
+                            "Some objects were not added correctly.")
+        self.assertEqual(len(self.sap.endpoints), 2 * len(self.all_entities),
+                         "Incorrect number of endpoints tracked.")
+
+    def test_remove_one_object(self):
+        self.sap.add_multiple([self.entityI, self.entityJ])
+        self.sap.remove(self.entityJ)
+
+        self.assertFalse(self.sap.exists(self.entityJ),
+                         "A single object was not removed correctly.")
+        self.assertEqual(self.sap.get_all_collisions(), [],
+                         "Removed object still produces collisions.")
+
+    def test_remove_compacted_on_update(self):
+        self.sap.add_multiple(self.all_entities)
+        self.sap.remove(self.entityJ)
+        self.assertEqual(self.sap.query_rect(self.entityJ).count(self.entityJ), 0,
+                         "Removed object is still found by queries.")
+
+        self.sap.update()
+        self.assertEqual(len(self.sap.endpoints), 2 * (len(self.all_entities) - 1),
+                         "Dead endpoints weren't compacted on update.")
+        self._assert_endpoints_sorted()
+
+    def test_add_keeps_order(self):
+        for entity in self.all_entities:
+            self.sap.add(entity)
+        self._assert_endpoints_sorted()
+
+    def test_clear_nonempty(self):
+        self.sap.add_multiple(self.all_entities)
+        self.sap.clear()
+
+        self.assertEqual(self.sap.size(), 0,
+                         "Entities still exists after clearing nonempty list.")
+
+    def test_endpoints_sorted(self):
+        self.sap.add_multiple(self.all_entities)
+        self._assert_endpoints_sorted()
+
+    def test_update_restores_order(self):
+        self.sap.add_multiple(self.all_entities)
+
+        self.entityA.x += 70
+        self.entityG.x -= 75
+        self.sap.update()
+        self._assert_endpoints_sorted()
+
+        self.entityA.x -= 70
+        self.entityG.x += 75
+
+    def test_get_all_collisions_none(self):
+        self.sap.add_multiple([self.entityA, self.entityB])
+        self.assertEqual(self.sap.get_all_collisions(), [],
+                         "Phantom collisions detected.")
+
+    def test_get_all_collisions_universal(self):
+        expected_collisions = [frozenset([self.entityC, self.entityG]),
+                               frozenset([self.entityD, self.entityF]),
+                               frozenset([self.entityD, self.entityE]),
+                               frozenset([self.entityD, self.entityH]),
+                               frozenset([self.entityE, self.entityH]),
+                               frozenset([self.entityI, self.entityJ]),
+                               frozenset([self.entityI, self.entityK]),
+                               frozenset([self.entityJ, self.entityK])]
+        self.sap.add_multiple(self.all_entities)
+
+        self.assertEqual(set(self.sap.get_all_collisions()),
+                         set(expected_collisions),
+                         "Incorrect list of collisions detected.")
+
+    def test_get_all_collisions_after_move(self):
+        self.sap.add_multiple([self.entityE, self.entityH])
+
+        self.entityE.x = self.entityE.y = 5
+        self.entityH.x = self.entityH.y = 1
+        self.sap.update()
+
+        self.assertEqual(set(self.sap.get_all_collisions()),
+                         set([frozenset([self.entityE, self.entityH])]),
+                         "Incorrect set of collisions detected after a move.")
+
+    def test_get_all_collisions_static_pairs_ignored(self):
+        self.sap.add_multiple([self.entityI, self.entityJ], static=True)
+        self.sap.add(self.entityK)
+
+        expected_collisions = [frozenset([self.entityI, self.entityK]),
+                               frozenset([self.entityJ, self.entityK])]
+        self.assertEqual(set(self.sap.get_all_collisions()),
+                         set(expected_collisions),
+                         "Incorrect collisions detected with static objects.")
+
+    def test_filter_applied(self):
+        owners = {self.entityI: "owner", self.entityJ: "owner"}
+        box = Hitbox(80, 60, 0, 0, HitboxType.INTANGIBLE)
+        self.sap.set_filter(CollisionFilter(owners.get))
+        self.sap.add_multiple([self.entityI, self.entityJ, self.entityK, box])
+
+        self.assertTrue(self.sap.exists(box), "Dormant object not tracked.")
+        self.assertEqual(set(self.sap.get_all_collisions()),
+                         set([frozenset([self.entityI, self.entityK]),
+                              frozenset([self.entityJ, self.entityK])]),
+                         "Filtered collisions detected.")
+
+    def test_pairs_tested_counted(self):
+        self.sap.add_multiple(self.all_entities)
+        self.sap.update()
+        self.sap.pairs_tested = 0
+
+        collisions = self.sap.get_all_collisions()
+        self.assertTrue(self.sap.pairs_tested >= len(collisions),
+                        "Fewer pairs tested than collisions found.")
+
+    def test_query_rect(self):
+        self.sap.add_multiple(self.all_entities)
+        self.sap.update()
+
+        self.assertEqual(set(self.sap.query_rect(pygame.Rect(60, 50, 20, 20))),
+                         set([self.entityD, self.entityE, self.entityH,
+                              self.entityI, self.entityK]),
+                         "Incorrect volumes found in region.")
+
+    def test_query_point(self):
+        self.sap.add_multiple(self.all_entities)
+        self.sap.update()
+
+        self.assertEqual(set(self.sap.query_point(82, 62)),
+                         set([self.entityI, self.entityJ, self.entityK]),
+                         "Incorrect volumes found at point.")
+        self.assertEqual(self.sap.query_point(50, 50), [self.entityD],
+                         "Incorrect volumes found at point.")
+
+    def test_raycast(self):
+        self.sap.add_multiple(self.all_entities)
+        self.sap.update()
+
+        hits = self.sap.raycast((0, 40), (5, 0), 100)
+        self.assertEqual(hits, [(4.0, self.entityA), (35.0, self.entityD),
+                                (80.0, self.entityG)],
+                         "Incorrect volumes hit by ray.")
+        self.assertEqual(self.sap.raycast((0, 40), (1, 0), 30),
+                         [(4.0, self.entityA)],
+                         "Ray hit volumes beyond its maximum distance.")
+
+    def test_nearest(self):
+        self.sap.add_multiple(self.all_entities)
+        self.sap.update()
+
+        self.assertEqual(self.sap.nearest(50, 5, 3),
+                         [self.entityB, self.entityC, self.entityD],
+                         "Incorrect nearest volumes found.")
+        self.assertEqual(len(self.sap.nearest(50, 5, 20)), len(self.all_entities),
+                         "Nearest volumes missing when k exceeds the count.")
+
+    def test_queries_match_linear_scan(self):
+        generator = random.Random(428)
+        detector = SweepAndPrune()
+        for i in range(200):
+            detector.add(HashableRect(generator.randint(-20, 400),
+                                      generator.randint(-20, 400),
+                                      generator.randint(0, 40),
+                                      generator.randint(0, 40)),
+                         static=(i % 2 == 0))
+        detector.update()
+
+        for i in range(50):
+            (x, y) = (generator.randint(0, 400), generator.randint(0, 400))
+            rect = pygame.Rect(x, y, generator.randint(0, 120),
+                               generator.randint(0, 120))
+            direction = (generator.uniform(-1, 1), generator.uniform(-1, 1))
+
+            self.assertEqual(
+                set(detector.query_rect(rect)),
+                set(CollisionDetector.query_rect(detector, rect)))
+            self.assertEqual(
+                set(detector.query_point(x, y)),
+                set(CollisionDetector.query_point(detector, x, y)))
+            self.assertEqual(
+                set(detector.raycast((x, y), direction, 150)),
+                set(CollisionDetector.raycast(detector, (x, y), direction,
+                                              150)))
+            self.assertEqual(
+                [detector._get_point_distance(obj, x, y)
+                 for obj in detector.nearest(x, y, 5)],
+                [detector._get_point_distance(obj, x, y)
+                 for obj in CollisionDetector.nearest(detector, x, y, 5)])
+
+    # Private helper functions
+
+    def _assert_endpoints_sorted(self):
+        keys = [(endpoint[0], endpoint[1]) for endpoint in self.sap.endpoints]
+        self.assertEqual(keys, sorted(keys), "Endpoint list is not sorted.")
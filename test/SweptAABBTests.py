@@ -0,0 +1,66 @@
+##  @file SweptAABBTests.py
+#   @date Fall 2026
+#
+#   Test File for the "SweptAABB" functions
+
+import unittest
+import pygame as PG
+
+from src.SweptAABB import *
+
+class SweptAABBTests(unittest.TestCase):
+
+    def setUp(self):
+        self.mover = PG.Rect(0, 0, 10, 10)
+        self.wall = PG.Rect(50, -20, 2, 60)
+
+    def test_time_of_impact(self):
+        self.assertEqual(get_time_of_impact(self.mover, (80, 0), self.wall),
+                         (0.5, 0), "Wrong contact time for a horizontal move.")
+        self.assertEqual(get_time_of_impact(self.mover, (0, 80), PG.Rect(0, 50, 10, 2)),
+                         (0.5, 1), "Wrong contact time for a vertical move.")
+
+    def test_time_of_impact_misses(self):
+        self.assertEqual(get_time_of_impact(self.mover, (30, 0), self.wall), None,
+                         "Found a contact beyond the end of the move.")
+        self.assertEqual(get_time_of_impact(self.mover, (-80, 0), self.wall), None,
+                         "Found a contact behind the mover.")
+        self.assertEqual(get_time_of_impact(self.mover, (80, 80), self.wall), None,
+                         "Found a contact for a move passing over the wall.")
+        self.assertEqual(get_time_of_impact(self.mover, (80, 0), PG.Rect(5, 5, 2, 2)),
+                         None, "Found a contact for overlapping rectangles.")
+
+    def test_time_of_impact_touching(self):
+        self.assertEqual(get_time_of_impact(self.mover, (0, 50), PG.Rect(10, 0, 5, 100)),
+                         None, "Found a contact for a move touching a wall.")
+        self.assertEqual(get_time_of_impact(self.mover, (5, 0), PG.Rect(10, 0, 5, 10)),
+                         (0.0, 0), "Missed a contact for a mover starting in touch.")
+
+    def test_clamp_displacement_tunneling(self):
+        self.assertEqual(clamp_displacement([self.mover], (200, 0), [self.wall]),
+                         (41, 0), "Mover tunneled through a thin wall.")
+        self.assertEqual(clamp_displacement([self.mover], (-200, 0), [self.wall]),
+                         (-200, 0), "Mover was stopped by a wall behind it.")
+
+    def test_clamp_displacement_first_contact(self):
+        near_wall = PG.Rect(30, -20, 2, 60)
+
+        self.assertEqual(clamp_displacement([self.mover], (200, 0),
+                         [self.wall, near_wall]), (21, 0),
+                         "Mover wasn't stopped at the first contact.")
+
+    def test_clamp_displacement_slides(self):
+        self.assertEqual(clamp_displacement([self.mover], (80, 40), [self.wall]),
+                         (41, 40), "Mover didn't slide along the wall.")
+
+    def test_clamp_displacement_filter(self):
+        self.assertEqual(clamp_displacement([self.mover], (200, 0), [self.wall],
+                         lambda rect, obstacle: obstacle is not self.wall),
+                         (200, 0), "Mover was stopped by a filtered wall.")
+
+    def test_clamp_displacement_group(self):
+        follower = PG.Rect(-20, 0, 10, 10)
+
+        self.assertEqual(clamp_displacement([follower, self.mover], (200, 0),
+                         [self.wall]), (41, 0),
+                         "Group wasn't stopped by the contact of its leader.")
@@ -0,0 +1,95 @@
+##  @file TilemapTests.py
+#   @date Fall 2026
+#
+#   Test File for the "Tilemap" Type
+
+import sys
+import unittest
+import numpy as NP
+import src
+
+from src.Tilemap import *
+
+##  Container class for the test suite that tests the functionality of the
+#   "Tilemap" type.
+class TilemapTests( unittest.TestCase ):
+    ### Testing Constants ###
+
+    ##  The palette of the test tilemap, which has a wall, a floor and a
+    #   transition tile.
+    PALETTE = [
+        ( "wall", True, (0, 0, 0, 255) ),
+        ( "floor", False, (255, 255, 255, 255) ),
+        ( "door", False, (128, 128, 128, 255) ),
+    ]
+
+    ##  The palette index of each tile in the test tilemap, indexed by [x, y].
+    INDICES = [
+        [ 0, 0, 0 ],
+        [ 0, 1, 2 ],
+        [ 0, 1, 1 ],
+        [ 0, 0, 0 ],
+    ]
+
+    ### Test Set Up/Tear Down ###
+
+    def setUp( self ):
+        self._tilemap = Tilemap( TilemapTests.PALETTE, TilemapTests.INDICES )
+        self._tiles = [ [TilemapTests.PALETTE[index] for index in column]
+            for column in TilemapTests.INDICES ]
+
+    ### Testing Functions ###
+
+    def test_nested_indexing( self ):
+        self.assertEqual( len(self._tilemap), 4,
+            "Tilemap has the wrong number of columns." )
+        self.assertEqual( len(self._tilemap[0]), 3,
+            "Tilemap has the wrong number of rows." )
+        self.assertEqual( [list(column) for column in self._tilemap], self._tiles,
+            "Tilemap columns don't give the tiles of the tilemap." )
+        self.assertEqual( self._tilemap[1][2], ("door", False, (128, 128, 128, 255)),
+            "Tilemap gives the wrong tile at a position." )
+        self.assertEqual( self._tilemap[1, 2], self._tilemap[1][2],
+            "Tilemap gives different tiles for tuple and nested indexing." )
+
+    def test_region_accessors( self ):
+        self.assertEqual( self._tilemap.get_tile_ids(1).tolist(),
+            ["wall", "floor", "door"], "Tilemap gives the wrong tile ids for a column." )
+        self.assertEqual( self._tilemap.get_tangibility(slice(None), 0).tolist(),
+            [True, True, True, True], "Tilemap gives the wrong tangibility for a row." )
+        self.assertEqual( self._tilemap.get_tangibility(slice(1, 3), slice(1, 3)).tolist(),
+            [[False, False], [False, False]],
+            "Tilemap gives the wrong tangibility for a region." )
+        self.assertEqual( zip(*NP.nonzero(self._tilemap.get_transitions())), [(1, 2)],
+            "Tilemap gives the wrong transition tiles." )
+
+    def test_index_type( self ):
+        self.assertEqual( self._tilemap.get_indices().dtype, NP.uint8,
+            "Tilemap doesn't use bytes for small palettes." )
+
+        palette = [ (str(i), False, (i % 256, i / 256, 0, 255)) for i in range(300) ]
+        tilemap = Tilemap( palette, [[299, 0]] )
+        self.assertEqual( tilemap.get_indices().dtype, NP.uint16,
+            "Tilemap doesn't widen its indices for large palettes." )
+        self.assertEqual( tilemap[0][0], palette[299],
+            "Tilemap with a large palette gives the wrong tile." )
+
+    def test_equality( self ):
+        reordered_palette = TilemapTests.PALETTE[::-1]
+        reordered_indices = [ [2 - index for index in column]
+            for column in TilemapTests.INDICES ]
+
+        self.assertTrue( self._tilemap == Tilemap(reordered_palette, reordered_indices),
+            "Tilemaps with the same tiles aren't equal." )
+        self.assertTrue( self._tilemap != Tilemap(TilemapTests.PALETTE, [[0]]),
+            "Tilemaps with different tiles are equal." )
+
+    def test_memory_size( self ):
+        indices = NP.zeros( (480, 480), dtype=int )
+        tilemap = Tilemap( TilemapTests.PALETTE, indices )
+        tile_lists = [ [TilemapTests.PALETTE[0]] * 480 for x in range(480) ]
+        list_size = sys.getsizeof( tile_lists ) + \
+            sum( sys.getsizeof(column) for column in tile_lists )
+
+        self.assertTrue( tilemap.get_memory_size() < list_size / 8,
+            "Tilemap isn't much smaller than nested lists of tiles." )
@@ -0,0 +1,66 @@
+##  @file TimerSchedulerTests.py
+#   @date Fall 2026
+#
+#   Test File for the "TimerScheduler" Type
+
+import unittest
+import src
+
+from src.TimerScheduler import *
+
+##  Container class for the test suite that tests the functionality of the
+#   "TimerScheduler" type.
+class TimerSchedulerTests( unittest.TestCase ):
+    ### Test Set Up/Tear Down ###
+
+    def setUp( self ):
+        self._timers = TimerScheduler()
+
+    def tearDown( self ):
+        self._timers = None
+
+    ### Testing Functions ###
+
+    def test_schedule( self ):
+        self._timers.advance( 2.0 )
+        self._timers.schedule( "a", 3.0 )
+
+        self.assertEqual( self._timers.get_deadline("a"), 5.0,
+            "Timer deadline isn't relative to the scheduler's clock." )
+        self.assertEqual( self._timers.pop_expired(4.0), [],
+            "Timer expired before its deadline." )
+        self.assertEqual( self._timers.pop_expired(5.0), ["a"],
+            "Timer didn't expire at its deadline." )
+        self.assertEqual( len(self._timers), 0,
+            "Expired timer is still pending." )
+
+    def test_expiration_order( self ):
+        self._timers.schedule( "late", 3.0 )
+        self._timers.schedule( "first", 1.0 )
+        self._timers.schedule( "second", 1.0 )
+        self._timers.schedule( "early", 0.5 )
+
+        self.assertEqual( self._timers.pop_expired(10.0),
+            ["early", "first", "second", "late"],
+            "Timers didn't expire in deadline and then scheduling order." )
+
+    def test_reschedule( self ):
+        self._timers.schedule( "a", 1.0 )
+        self._timers.schedule( "a", 3.0 )
+
+        self.assertEqual( self._timers.pop_expired(2.0), [],
+            "Rescheduled timer expired at its old deadline." )
+        self.assertEqual( self._timers.pop_expired(3.0), ["a"],
+            "Rescheduled timer didn't expire at its new deadline." )
+
+    def test_cancel( self ):
+        self._timers.schedule( "a", 1.0 )
+        self._timers.schedule( "b", 1.0 )
+        self._timers.cancel( "a" )
+        self._timers.schedule( "b", float("inf") )
+
+        self.assertFalse( "a" in self._timers, "Cancelled timer is still pending." )
+        self.assertFalse( "b" in self._timers,
+            "Timer with an infinite delay is still pending." )
+        self.assertEqual( self._timers.pop_expired(2.0), [],
+            "Cancelled timers expired." )
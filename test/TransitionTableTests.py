@@ -0,0 +1,100 @@
+##  @file TransitionTableTests.py
+#   @date Fall 2026
+#
+#   Test File for the "TransitionTable" Type
+
+import unittest
+import src
+from TestStates import *
+from src.TransitionTable import *
+from src.StateMachine import *
+from src.Transition import *
+
+##  Container class for the test suite that tests the functionality of the
+#   "TransitionTable" type.
+class TransitionTableTests( unittest.TestCase ):
+    ### Testing Constants ###
+
+    ##  The name identifiers of the states in the test transition table.
+    STATE_NAMES = [ "0", "1", "2" ]
+
+    ##  The transitions in the test transition table.
+    TRANSITIONS = [
+        Transition( "0", "1", "^notify$" ),
+        Transition( "0", "2", "^timeout$" ),
+        Transition( "2", "1" ),
+        Transition( "1", "0" ),
+    ]
+
+    ### Test Set Up/Tear Down ###
+
+    def setUp( self ):
+        self._table = TransitionTable( TransitionTableTests.STATE_NAMES,
+            TransitionTableTests.TRANSITIONS )
+
+    def tearDown( self ):
+        self._table = None
+
+    ### Testing Functions ###
+
+    def test_state_indices( self ):
+        for ( index, name ) in enumerate( TransitionTableTests.STATE_NAMES ):
+            self.assertEqual( self._table.get_state_index(name), index,
+                "Transition table numbers states out of order." )
+            self.assertEqual( self._table.get_state_name(index), name,
+                "Transition table gives the wrong name for a state index." )
+        self.assertEqual( self._table.get_state_index("3"), None,
+            "Transition table gives an index for an unknown state." )
+
+    def test_outgoing( self ):
+        self.assertEqual( set(self._table.get_outgoing(0)),
+            set([(TransitionTableTests.TRANSITIONS[0], 1), (TransitionTableTests.TRANSITIONS[1], 2)]),
+            "Transition table gives the wrong outgoing transitions." )
+        self.assertEqual( self._table.get_outgoing(1),
+            ((TransitionTableTests.TRANSITIONS[3], 0),),
+            "Transition table gives the wrong outgoing transitions." )
+
+    def test_outgoing_by_type( self ):
+        transitions = [
+            Transition( "0", "1", {"type": EventType.NOTIFY} ),
+            Transition( "0", "2", ".*" ),
+            Transition( "0", "1", {"type": EventType.TIMEOUT} ),
+        ]
+        table = TransitionTable( TransitionTableTests.STATE_NAMES, transitions )
+        outgoing = [ edge[0] for edge in table.get_outgoing(0) ]
+
+        self.assertEqual( [edge[0] for edge in table.get_outgoing(0, EventType.NOTIFY)],
+            [transition for transition in outgoing if transition is not transitions[2]],
+            "Transition table gives the wrong transitions for an event type." )
+        self.assertEqual( table.get_outgoing(0, EventType.KEYDOWN), ((transitions[1], 2),),
+            "Transition table doesn't give untyped transitions for other types." )
+        self.assertEqual( table.get_outgoing(1, EventType.NOTIFY), (),
+            "Transition table gives transitions for a state without any." )
+
+    def test_invalid_table( self ):
+        self.assertRaises( AssertionError, TransitionTable, ["0", "0"], [] )
+        self.assertRaises( AssertionError, TransitionTable, ["0"],
+            [Transition("0", "1")] )
+
+    def test_graph_export( self ):
+        states = [ SimpleTestState(name) for name in TransitionTableTests.STATE_NAMES ]
+        graph = StateMachine( states, TransitionTableTests.TRANSITIONS ).get_graph()
+
+        self.assertEqual( sorted(graph.nodes()), TransitionTableTests.STATE_NAMES,
+            "Exported graph has the wrong nodes." )
+        self.assertEqual( graph.node["1"]["obj"], states[1],
+            "Exported graph doesn't hold the machine's states." )
+        self.assertEqual( set(ed["obj"] for ( src, dst, ed ) in graph.edges(data=True)),
+            set(TransitionTableTests.TRANSITIONS), "Exported graph has the wrong edges." )
+
+    def test_shared_table( self ):
+        machines = [ StateMachine([SimpleTestState(name) for name in TransitionTableTests.STATE_NAMES],
+            TransitionTableTests.TRANSITIONS, table=self._table) for i in range(2) ]
+        machines[ 0 ].simulate_transition( Event(EventType.NOTIFY) )
+
+        self.assertEqual( machines[0].get_current_state().get_name(), "1",
+            "State machine with a shared table doesn't transition." )
+        self.assertEqual( machines[1].get_current_state().get_name(), "0",
+            "State machines sharing a table share their current state." )
+        self.assertTrue( machines[0].get_current_state() is not machines[1].get_current_state(),
+            "State machines sharing a table share their states." )
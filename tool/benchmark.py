@@ -0,0 +1,251 @@
+##  @file benchmark.py
+#   @date Fall 2026
+#
+#   Broad-phase benchmark for the `CollisionDetector` implementations.
+#
+#   Each run drives a single detector with a synthetic population of hitboxes
+#   for a number of frames and reports the time spent inserting, updating,
+#   finding collisions and answering region queries, along with the number of
+#   candidate pairs tested against the number of collisions found and the peak
+#   memory used. Populations vary in object count, size distribution,
+#   clustering and motion coherence. Every run is executed in its own process
+#   so that the peak memory reported belongs to that run alone.
+#
+#   Usage (from the project root):
+#       python tool/benchmark.py [--detectors spatial tree] [--counts 10 100]
+#           [--sizes uniform mixed] [--layouts scattered clustered]
+#           [--motions coherent chaotic] [--frames 10] [--queries 100]
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import resource
+import argparse
+import subprocess
+
+sys.path.insert( 0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    "..", "src") )
+
+from CompositeHitbox import Hitbox
+from SpatialDictionary import SpatialDictionary
+from SweepAndPrune import SweepAndPrune
+from AABBTree import AABBTree
+
+### Benchmark Parameters ###
+
+##  The detector factories that can be benchmarked, each of which constructs a
+#   detector for an area of the given width and height.
+DETECTORS = {
+    "spatial": lambda width, height: SpatialDictionary( width / 16, width, height ),
+    "spatial-vectorized": SpatialDictionary.for_area,
+    "sweep": SweepAndPrune.for_area,
+    "tree": AABBTree.for_area,
+}
+
+##  The default object counts of the benchmarked populations.
+COUNTS = [ 10, 100, 1000, 10000 ]
+
+##  The size distributions of the hitboxes, given as weighted lists of
+#   (weight, min_size, max_size) tuples.
+SIZES = {
+    "uniform": [ (1.0, 8, 32) ],
+    "mixed": [ (0.9, 4, 16), (0.1, 64, 256) ],
+}
+
+##  The ways in which hitboxes are laid out over the area.
+LAYOUTS = [ "scattered", "clustered" ]
+
+##  The ways in which hitboxes move between frames: "coherent" hitboxes move
+#   a few pixels along a fixed velocity and "chaotic" ones jump anywhere.
+MOTIONS = [ "coherent", "chaotic" ]
+
+##  The average area (in square pixels) given to each hitbox in the population.
+AREA_PER_OBJECT = 48 * 48
+
+### Population Functions ###
+
+##  Constructs the hitbox population for a benchmark run.
+#
+#   @param generator The `random.Random` instance used to build the population.
+#   @param count The number of hitboxes in the population.
+#   @param sizes The name of the size distribution of the hitboxes.
+#   @param layout The name of the layout of the hitboxes.
+#   @return A tuple of the form (width, height, hitboxes) describing the area
+#    and the `Hitbox` objects within it.
+def make_population( generator, count, sizes, layout ):
+    side = max( 256, int(math.sqrt(count * AREA_PER_OBJECT)) )
+    centers = [ (generator.uniform(0, side), generator.uniform(0, side))
+        for i in range(count / 50 + 1) ]
+
+    hitboxes = []
+    for i in range( count ):
+        ( width, height ) = ( pick_size(generator, sizes), pick_size(generator, sizes) )
+        if layout == "clustered":
+            center = generator.choice( centers )
+            pos = ( generator.gauss(center[0], side / 20.0),
+                generator.gauss(center[1], side / 20.0) )
+        else:
+            pos = ( generator.uniform(0, side), generator.uniform(0, side) )
+
+        pos_x = clamp( int(pos[0]), 0, side - width )
+        pos_y = clamp( int(pos[1]), 0, side - height )
+        hitboxes.append( Hitbox(pos_x, pos_y, width, height) )
+
+    return ( side, side, hitboxes )
+
+##  @return A hitbox dimension drawn from the given size distribution.
+def pick_size( generator, sizes ):
+    choice = generator.random()
+    for ( weight, min_size, max_size ) in SIZES[ sizes ]:
+        if choice < weight:
+            return generator.randint( min_size, max_size )
+        choice -= weight
+
+    return generator.randint( SIZES[sizes][-1][1], SIZES[sizes][-1][2] )
+
+##  Moves every hitbox in the population for a single frame.
+#
+#   @param generator The `random.Random` instance used to move the population.
+#   @param hitboxes The list of `Hitbox` objects to be moved.
+#   @param velocities The list of (x, y) velocities of the hitboxes.
+#   @param motion The name of the motion of the hitboxes.
+#   @param side The dimension of the square area containing the hitboxes.
+def move_population( generator, hitboxes, velocities, motion, side ):
+    for ( hitbox, velocity ) in zip( hitboxes, velocities ):
+        if motion == "chaotic":
+            hitbox.x = generator.randint( 0, side - hitbox.w )
+            hitbox.y = generator.randint( 0, side - hitbox.h )
+        else:
+            if not 0 <= hitbox.x + velocity[0] <= side - hitbox.w:
+                velocity[ 0 ] = -velocity[ 0 ]
+            if not 0 <= hitbox.y + velocity[1] <= side - hitbox.h:
+                velocity[ 1 ] = -velocity[ 1 ]
+            hitbox.move_ip( velocity[0], velocity[1] )
+
+##  @return The value clamped to the range [min_value, max_value].
+def clamp( value, min_value, max_value ):
+    return max( min_value, min(value, max_value) )
+
+### Benchmark Functions ###
+
+##  Runs a single benchmark in the current process.
+#
+#   @param options The parsed command line options describing the run.
+#   @return A dictionary of the measurements taken during the run.
+def run_benchmark( options ):
+    generator = random.Random( options.seed )
+    ( width, height, hitboxes ) = make_population( generator, options.count,
+        options.size, options.layout )
+    velocities = [ [generator.choice([-3, -2, -1, 1, 2, 3]) for i in range(2)]
+        for hitbox in hitboxes ]
+
+    detector = DETECTORS[ options.detector ]( width, height )
+
+    start_time = time.time()
+    detector.add_multiple( hitboxes )
+    detector.tune()
+    insert_time = time.time() - start_time
+
+    ( update_time, collide_time, pairs_found ) = ( 0.0, 0.0, 0 )
+    detector.pairs_tested = 0
+    for frame in range( options.frames ):
+        move_population( generator, hitboxes, velocities, options.motion, width )
+
+        start_time = time.time()
+        detector.update()
+        update_time += time.time() - start_time
+
+        start_time = time.time()
+        pairs_found += len( detector.get_all_collisions() )
+        collide_time += time.time() - start_time
+
+    query_rects = [ Hitbox(generator.randint(0, width), generator.randint(0, height),
+        generator.randint(16, 128), generator.randint(16, 128))
+        for i in range(options.queries) ]
+    start_time = time.time()
+    for query_rect in query_rects:
+        detector.query_rect( query_rect )
+    query_time = time.time() - start_time
+
+    frames = max( options.frames, 1 )
+    return {
+        "detector": options.detector,
+        "count": options.count,
+        "size": options.size,
+        "layout": options.layout,
+        "motion": options.motion,
+        "insert_ms": 1000.0 * insert_time,
+        "update_ms": 1000.0 * update_time / frames,
+        "collide_ms": 1000.0 * collide_time / frames,
+        "query_us": 1000000.0 * query_time / max( options.queries, 1 ),
+        "tested": detector.pairs_tested / frames,
+        "found": pairs_found / frames,
+        "peak_kb": resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss,
+    }
+
+##  Runs a single benchmark in a new process so that its peak memory can be
+#   measured in isolation.
+#
+#   @return A dictionary of the measurements taken during the run.
+def run_benchmark_process( detector, count, size, layout, motion, options ):
+    command = [ sys.executable, os.path.abspath(__file__), "--single",
+        "--detectors", detector, "--counts", str(count), "--sizes", size,
+        "--layouts", layout, "--motions", motion,
+        "--frames", str(options.frames), "--queries", str(options.queries),
+        "--seed", str(options.seed) ]
+
+    # The results are on the last line since PyGame may greet on import.
+    output = subprocess.check_output( command )
+    return json.loads( output.splitlines()[-1] )
+
+##  Prints the results of a benchmark run as a row of the results table.
+def print_result( result ):
+    print "%-18s %6d %-7s %-9s %-8s %10.2f %10.3f %10.3f %9.2f %10d %8d %9d" % (
+        result["detector"], result["count"], result["size"], result["layout"],
+        result["motion"], result["insert_ms"], result["update_ms"],
+        result["collide_ms"], result["query_us"], result["tested"],
+        result["found"], result["peak_kb"] )
+    sys.stdout.flush()
+
+### Main Function ###
+
+def main():
+    parser = argparse.ArgumentParser( description="Benchmarks the broad-phase "
+        "collision detectors with synthetic hitbox populations." )
+    parser.add_argument( "--detectors", nargs="+", default=sorted(DETECTORS.keys()),
+        choices=sorted(DETECTORS.keys()) )
+    parser.add_argument( "--counts", nargs="+", type=int, default=COUNTS )
+    parser.add_argument( "--sizes", nargs="+", default=sorted(SIZES.keys()),
+        choices=sorted(SIZES.keys()) )
+    parser.add_argument( "--layouts", nargs="+", default=LAYOUTS, choices=LAYOUTS )
+    parser.add_argument( "--motions", nargs="+", default=MOTIONS, choices=MOTIONS )
+    parser.add_argument( "--frames", type=int, default=10 )
+    parser.add_argument( "--queries", type=int, default=100 )
+    parser.add_argument( "--seed", type=int, default=428 )
+    parser.add_argument( "--single", action="store_true", help="Run only the "
+        "first configuration in this process and print its results as JSON." )
+    options = parser.parse_args()
+
+    if options.single:
+        ( options.detector, options.count, options.size, options.layout,
+            options.motion ) = ( options.detectors[0], options.counts[0],
+            options.sizes[0], options.layouts[0], options.motions[0] )
+        print json.dumps( run_benchmark(options) )
+        return
+
+    print "%-18s %6s %-7s %-9s %-8s %10s %10s %10s %9s %10s %8s %9s" % (
+        "detector", "count", "size", "layout", "motion", "insert_ms",
+        "update_ms", "collide_ms", "query_us", "tested", "found", "peak_kb" )
+    for count in options.counts:
+        for size in options.sizes:
+            for layout in options.layouts:
+                for motion in options.motions:
+                    for detector in options.detectors:
+                        print_result( run_benchmark_process(detector, count,
+                            size, layout, motion, options) )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+##  @file build_bundle.py
+#   @date Fall 2026
+#
+#   Compiles the game data (entity files, hitbox files and segment files) into
+#   a single `AssetBundle` file, which the game loads in place of the source
+#   files whenever the bundle's copy of an asset is up to date.
+#
+#   Usage (from any directory):
+#       python tool/build_bundle.py [--output assets/data/assets.bundle]
+
+import os
+import sys
+import glob
+import json
+import argparse
+
+PROJECT_PATH = os.path.join( os.path.dirname(os.path.abspath(__file__)), ".." )
+sys.path.insert( 0, os.path.join(PROJECT_PATH, "src") )
+
+import Globals
+from AssetBundle import AssetBundle
+from EntityArchetype import EntityArchetype
+from Segment import Segment
+
+### Compilation Functions ###
+
+##  @return A dictionary mapping the name of each compiled entity asset to a
+#    tuple of the form (value, source_paths).
+def compile_entities():
+    assets = {}
+
+    for entity_path in glob.glob( os.path.join(Globals.DATA_PATH, "entities", "*.json") ):
+        name = os.path.splitext( os.path.basename(entity_path) )[ 0 ]
+        with open( entity_path, "r" ) as entity_file:
+            assets[ "entities/" + name ] = ( json.load(entity_file), [entity_path] )
+
+    return assets
+
+##  @return A dictionary mapping the name of each compiled hitbox asset to a
+#    tuple of the form (value, source_paths).
+def compile_hitboxes():
+    assets = {}
+
+    for hbox_path in glob.glob( os.path.join(Globals.DATA_PATH, "hitbox", "*", "*.svg") ):
+        entity_name = os.path.basename( os.path.dirname(hbox_path) )
+        state_name = os.path.splitext( os.path.basename(hbox_path) )[ 0 ]
+        with open( hbox_path, "r" ) as hbox_file:
+            assets[ "hitbox/%s/%s" % (entity_name, state_name) ] = (
+                EntityArchetype.parse_hitbox_file(hbox_file), [hbox_path] )
+
+    return assets
+
+##  @return A dictionary mapping the name of each compiled segment asset to a
+#    tuple of the form (value, source_paths).
+def compile_segments():
+    assets = {}
+
+    segdata_path = os.path.join( "assets", "data", "segdata" )
+    palette_paths = [ os.path.join(segdata_path, "tiles"),
+        os.path.join(segdata_path, "entities") ]
+    for seg_path in glob.glob( os.path.join(segdata_path, "*[0-9].gif") ):
+        seg_id = os.path.basename( seg_path )[ :-len(".gif") ]
+        entity_path = os.path.join( segdata_path, seg_id + "e.gif" )
+
+        assets[ "segdata/" + seg_id ] = ( Segment(seg_id).get_compiled_data(),
+            [seg_path, entity_path] + palette_paths )
+
+    return assets
+
+### Main Function ###
+
+def main():
+    parser = argparse.ArgumentParser( description="Compiles the game data into "
+        "a single asset bundle." )
+    parser.add_argument( "--output", default=Globals.BUNDLE_PATH,
+        help="The path of the bundle file to be written." )
+    options = parser.parse_args()
+    options.output = os.path.abspath( options.output )
+
+    # Segments load their files relative to the project root, and every asset
+    # must be compiled from its source files rather than an older bundle.
+    os.chdir( PROJECT_PATH )
+    AssetBundle.set_default( None )
+
+    assets = {}
+    for compile_assets in ( compile_entities, compile_hitboxes, compile_segments ):
+        assets.update( compile_assets() )
+
+    AssetBundle.write( options.output, assets )
+    print "Wrote %d assets to '%s' (%d bytes)." % ( len(assets), options.output,
+        os.path.getsize(options.output) )
+
+if __name__ == "__main__":
+    main()